@@ -2,19 +2,40 @@
 AutoWinPy
 ==========
 
+하위 패키지와 무거운 의존성(OpenCV, NumPy, Pillow, tkinter, pywin32)은
+처음 사용할 때 불러옵니다.
 """
-from . import win32
-from . import type
-from . import core
-from . import atk
-from .core import *
-from .win32 import *
-from .type import *
-from .atk import *
+import importlib
+import sys
+
+# autowinpy.core 는 이름 목록만 가지고 있어 바로 불러와도 가볍습니다.
+from .core import __all__ as _CORE_EXPORTS
 
 
 __version__ = "0.4.1"
 """패키지 버전"""
 
-__dpi_scale_factor__ = core._set_windows_dpi()
-"""HIDPI 배율"""
+_SUBPACKAGES = ("atk", "backend", "core", "type", "win32")
+
+__all__ = list(_CORE_EXPORTS) + [
+    name for name in _SUBPACKAGES if name != "win32" or sys.platform == "win32"]
+
+
+def __getattr__(name: str):
+    """하위 패키지와 코어 객체를 처음 접근할 때 불러옵니다."""
+    if name in _SUBPACKAGES:
+        return importlib.import_module("." + name, __name__)
+    if name == "__dpi_scale_factor__":
+        # HIDPI 배율
+        value = importlib.import_module(".core", __name__)._set_windows_dpi()
+        globals()[name] = value
+        return value
+    if name in _CORE_EXPORTS:
+        value = getattr(importlib.import_module(".core", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | {"__dpi_scale_factor__"})
@@ -0,0 +1,74 @@
+"""AutoWinPy 명령줄 도구
+
+    python -m autowinpy build-templates <PNG 폴더> <라이브러리 폴더>
+        [--scale 0.5 --scale 1.5] [--pyramid-levels 1] [--mask-threshold 255]
+    python -m autowinpy match-server <라이브러리 폴더>
+        [--host 127.0.0.1] [--port 7300] [--workers 4] [--authkey KEY]
+"""
+import argparse
+import os
+
+
+def main(argv=None):
+    """명령 실행"""
+    parser = argparse.ArgumentParser(prog="python -m autowinpy")
+    commands = parser.add_subparsers(dest="command")
+    build = commands.add_parser(
+        "build-templates", help="PNG 폴더를 탬플릿 라이브러리로 컴파일")
+    build.add_argument("source", help="PNG 파일이 있는 폴더")
+    build.add_argument("path", help="만들 라이브러리 디렉토리")
+    build.add_argument("--pattern", default="*.png", help="파일 이름 패턴")
+    build.add_argument("--scale", type=float, action="append", default=[],
+                       help="미리 만들 배율, 여러 번 지정 가능")
+    build.add_argument("--threshold", type=float, default=0.8)
+    build.add_argument("--mask-threshold", type=int, default=255)
+    build.add_argument("--mask-erode", type=int, default=0)
+    build.add_argument("--pyramid-levels", type=int, default=0)
+    serve = commands.add_parser(
+        "match-server", help="탬플릿 라이브러리로 로컬 매칭 서버 실행")
+    serve.add_argument("path", help="탬플릿 라이브러리 디렉토리")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=7300)
+    serve.add_argument("--workers", type=int, default=None)
+    serve.add_argument("--authkey", default=None,
+                       help="접속 인증 키, 생략하면 임의로 만들어 출력 (루프백 전용)")
+    args = parser.parse_args(argv)
+    if args.command == "match-server":
+        return _match_server(args)
+    if args.command != "build-templates":
+        parser.print_help()
+        return 1
+    from .core import TemplateLibrary
+    library = TemplateLibrary.build(
+        args.source, args.path, args.scale, args.pattern,
+        threshold=args.threshold, mask_threshold=args.mask_threshold,
+        mask_erode=args.mask_erode, pyramid_levels=args.pyramid_levels)
+    print("{} 탬플릿 -> {}".format(len(library), library.path))
+    return 0
+
+
+def _match_server(args) -> int:
+    """매칭 서버 실행, Ctrl+C 로 종료"""
+    from .core import MatchServer, TemplateLibrary
+    from .core._cls_match_server import _is_loopback
+    if args.authkey is None and not _is_loopback((args.host, args.port)):
+        print("루프백이 아닌 주소에는 --authkey 가 필요합니다.")
+        return 1
+    # 출력한 키를 그대로 MatchClient(address, key.encode()) 에 씁니다.
+    authkey = args.authkey or os.urandom(16).hex()
+    server = MatchServer(TemplateLibrary(args.path), args.workers,
+                         (args.host, args.port), authkey.encode())
+    server.start()
+    print("{} 탬플릿, 작업 프로세스 {} -> {}".format(
+        len(server.names), server.workers, server.address))
+    if args.authkey is None:
+        print("authkey: {}".format(authkey))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
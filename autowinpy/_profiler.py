@@ -0,0 +1,267 @@
+"""매칭 계측 모듈
+
+캡처, 이미지 변환, 탬플릿 매칭의 단계별 시간과 탬플릿별 탐색 결과를
+기록합니다. 꺼져 있을 때 계측 지점은 :meth:`Profiler.clock` 과
+:meth:`Profiler.lap` 호출 하나씩만 남으므로 비용이 거의 없습니다.
+
+계측 지점은 다음과 같이 작성합니다::
+
+    t = profiler.clock()            # 꺼져 있으면 0
+    ...                             # 작업
+    t = profiler.lap("stage", key, t)
+"""
+from time import perf_counter
+from typing import Callable, Dict, List, Tuple
+import json
+import math
+import threading
+
+# 점수 히스토그램 구간 수, [0, 1] 을 균등 분할
+HISTOGRAM_BINS = 20
+
+
+class _Stage:
+    """단계 하나의 누적 시간"""
+
+    __slots__ = ("count", "total", "min", "max")
+
+    def __init__(self):
+        self.count: int = 0
+        self.total: float = 0.0
+        self.min: float = float("inf")
+        self.max: float = 0.0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def merge(self, other: '_Stage'):
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1e3,
+            "mean_ms": self.total / self.count * 1e3 if self.count else 0.0,
+            "min_ms": self.min * 1e3 if self.count else 0.0,
+            "max_ms": self.max * 1e3,
+        }
+
+
+class _Searches:
+    """탬플릿 하나의 탐색 결과"""
+
+    __slots__ = ("count", "hits", "scored", "best", "score_sum", "histogram")
+
+    def __init__(self):
+        self.count: int = 0
+        self.hits: int = 0
+        self.scored: int = 0
+        self.best: float = None
+        self.score_sum: float = 0.0
+        self.histogram: List[int] = [0] * HISTOGRAM_BINS
+
+    def add(self, found: bool, score: float):
+        self.count += 1
+        self.hits += bool(found)
+        if not math.isfinite(score):
+            # 분산이 0인 영역 등에서 나오는 NaN/inf 는 횟수만 셉니다.
+            return
+        self.scored += 1
+        self.best = score if self.best is None else max(self.best, score)
+        self.score_sum += score
+        index = int(min(max(score, 0.0), 1.0) * HISTOGRAM_BINS)
+        self.histogram[min(index, HISTOGRAM_BINS - 1)] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "searches": self.count,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.count if self.count else 0.0,
+            "best_score": self.best,
+            "mean_score": self.score_sum / self.scored if self.scored else None,
+            "histogram": list(self.histogram),
+        }
+
+
+class Profiler:
+    """단계별 시간, 호출 수, 매칭 점수를 모으는 계측 기록기
+
+    기본으로 꺼져 있으며 :meth:`enable` 로 켭니다. 패키지 전체가
+    :data:`autowinpy.profiler` 하나를 공유합니다.
+
+    기록하는 단계:
+        ``capture`` 윈도우 캡처,
+        ``image.grayscale``, ``image.resize``, ``image.convert`` 이미지 변환,
+        ``template.prepare`` 탬플릿 회색조/크기/마스크 준비,
+        ``template.match`` ``cv2.matchTemplate``,
+        ``template.min_max_loc`` ``cv2.minMaxLoc``,
+        ``template.pyramid`` 피라미드 탐색,
+        ``template.search`` :meth:`Template.screen_search` 전체
+    """
+
+    __module__ = 'autowinpy'
+
+    def __init__(self):
+        """초기화"""
+        self.enabled: bool = False
+        self._lock = threading.Lock()
+        self._hooks: List[Callable[[dict], None]] = []
+        self._stages: Dict[Tuple[str, str], _Stage] = {}
+        self._searches: Dict[str, _Searches] = {}
+
+    def enable(self) -> 'Profiler':
+        """계측을 켭니다."""
+        self.enabled = True
+        return self
+
+    def disable(self) -> 'Profiler':
+        """계측을 끕니다. 기록은 유지됩니다."""
+        self.enabled = False
+        return self
+
+    def reset(self):
+        """기록을 모두 지웁니다."""
+        with self._lock:
+            self._stages.clear()
+            self._searches.clear()
+
+    def add_hook(self, callback: Callable[[dict], None]):
+        """기록할 때마다 호출할 함수를 등록합니다
+
+        ``callback`` 은 기록 스레드에서 ``{"stage", "key", "seconds"}``
+        사전을 받습니다. 탐색 결과에는 ``found`` 와 ``score`` 가
+        추가됩니다.
+        """
+        self._hooks.append(callback)
+
+    def remove_hook(self, callback: Callable[[dict], None]):
+        """등록한 함수를 해제합니다."""
+        self._hooks.remove(callback)
+
+    def clock(self) -> float:
+        """켜져 있으면 현재 시각, 꺼져 있으면 ``0``"""
+        return perf_counter() if self.enabled else 0.0
+
+    def lap(self, stage: str, key: str, start: float) -> float:
+        """``start`` 부터의 시간을 기록하고 현재 시각을 출력합니다
+
+        ``start`` 가 ``0`` 이면(계측이 꺼진 상태에서 시작) 아무것도
+        하지 않고 ``0`` 을 출력합니다.
+        """
+        if not start:
+            return 0.0
+        now = perf_counter()
+        self.record(stage, key, now - start)
+        return now
+
+    def record(self, stage: str, key: str, seconds: float):
+        """단계 시간 기록
+
+        Args:
+            stage: 단계 이름
+            key: 탬플릿 경로 등 구분 이름, 없으면 ``""``
+            seconds: 걸린 시간(초)
+        """
+        key = key or ""
+        with self._lock:
+            entry = self._stages.get((stage, key))
+            if entry is None:
+                entry = self._stages[(stage, key)] = _Stage()
+            entry.add(seconds)
+        if self._hooks:
+            event = {"stage": stage, "key": key, "seconds": seconds}
+            for hook in list(self._hooks):
+                hook(event)
+
+    def record_search(self, key: str, found: bool, score: float, seconds: float):
+        """탬플릿 탐색 결과 기록
+
+        Args:
+            key: 탬플릿 경로
+            found: 탐색 성공 여부
+            score: 매칭 점수
+            seconds: 탐색 전체 시간(초)
+        """
+        key = key or ""
+        score = float(score)
+        with self._lock:
+            entry = self._stages.get(("template.search", key))
+            if entry is None:
+                entry = self._stages[("template.search", key)] = _Stage()
+            entry.add(seconds)
+            searches = self._searches.get(key)
+            if searches is None:
+                searches = self._searches[key] = _Searches()
+            searches.add(found, score)
+        if self._hooks:
+            event = {"stage": "template.search", "key": key, "seconds": seconds,
+                     "found": bool(found), "score": score}
+            for hook in list(self._hooks):
+                hook(event)
+
+    def summary(self) -> dict:
+        """기록 요약
+
+        Returns:
+            ``{"stages": {단계: 통계}, "templates": {탬플릿: 탐색 통계와
+            단계별 통계}}``, 시간 단위는 ms
+        """
+        with self._lock:
+            stages: Dict[str, _Stage] = {}
+            templates: Dict[str, dict] = {}
+            for (stage, key), entry in self._stages.items():
+                stages.setdefault(stage, _Stage()).merge(entry)
+                if key:
+                    template = templates.setdefault(key, {"stages": {}})
+                    template["stages"][stage] = entry.to_dict()
+            for key, searches in self._searches.items():
+                templates.setdefault(key, {"stages": {}}).update(searches.to_dict())
+        return {
+            "stages": {stage: entry.to_dict() for stage, entry in sorted(
+                stages.items(), key=lambda item: -item[1].total)},
+            "templates": templates,
+        }
+
+    def report(self) -> str:
+        """단계별 시간과 탬플릿별 탐색 결과를 표로 출력합니다"""
+        summary = self.summary()
+        lines = ["{:<22} {:>8} {:>10} {:>9} {:>9}".format(
+            "stage", "count", "total ms", "mean ms", "max ms")]
+        for stage, s in summary["stages"].items():
+            lines.append("{:<22} {:>8} {:>10.1f} {:>9.3f} {:>9.3f}".format(
+                stage, s["count"], s["total_ms"], s["mean_ms"], s["max_ms"]))
+        searched = [(key, t) for key, t in summary["templates"].items() if "searches" in t]
+        if searched:
+            lines.append("")
+            lines.append("{:<40} {:>8} {:>8} {:>6} {:>9}".format(
+                "template", "searches", "hit rate", "best", "mean ms"))
+            for key, t in sorted(searched, key=lambda item: -item[1]["stages"]
+                                 ["template.search"]["total_ms"]):
+                best = t["best_score"]
+                lines.append("{:<40} {:>8} {:>8.1%} {:>6} {:>9.3f}".format(
+                    key[-40:], t["searches"], t["hit_rate"],
+                    "-" if best is None else "{:.3f}".format(best),
+                    t["stages"]["template.search"]["mean_ms"]))
+        return "\n".join(lines)
+
+    def to_json(self, path: str=None) -> str:
+        """요약을 JSON 문자열로 출력합니다
+
+        Args:
+            path: [선택] 저장할 파일 경로
+        """
+        text = json.dumps(self.summary(), ensure_ascii=False, indent=1)
+        if path is not None:
+            with open(path, "w", encoding="utf8") as f:
+                f.write(text)
+        return text
+
+
+profiler = Profiler()
+"""패키지 전체가 공유하는 :class:`Profiler`"""
@@ -1,6 +1,23 @@
 """tkinter 지원"""
+import importlib
 
-from ._function import image_tk
-from ._combobox import GuiSelectCombo
+# 이름: 정의된 모듈, Pillow와 tkinter는 처음 사용할 때 불러옵니다.
+_LAZY = {
+    "image_tk": "._function",
+    "GuiSelectCombo": "._combobox",
+}
 
 __all__ = []
+
+
+def __getattr__(name: str):
+    """``image_tk`` 와 ``GuiSelectCombo`` 를 처음 접근할 때 불러옵니다."""
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -33,8 +33,9 @@ class GuiSelectCombo(ttk.Combobox):
     
     def _list_update(self, e=None):
         """Gui 목록 업데이트"""
+        # 목록을 갱신할 때만 이름을 조회하도록 보관 모드 Gui 사용
         if self._parent is None:
-            self._gui_list = window_list()
+            self._gui_list = [Gui(g.hwnd, float("inf")) for g in window_list()]
         elif not self._parent.selected is None:
             self._gui_list = self._parent.selected.childs()
         self['values'] = self._gui_list
@@ -0,0 +1,28 @@
+"""플랫폼 백엔드
+
+윈도우 목록, 캡처, 메시지 전송을 플랫폼별로 구현합니다. Windows에서는
+Win32 백엔드를 필요할 때 불러오고, 다른 환경에서는
+:class:`FakeBackend` 를 :func:`set_backend` 로 지정해 사용합니다.
+"""
+from ._base import (
+    Backend,
+    BackendError,
+    get_backend,
+    set_backend,
+)
+
+from ._capture import (
+    CaptureError,
+    CaptureSource,
+    BytesSource,
+    WindowCapture,
+)
+
+from ._fake import (
+    FakeBackend,
+    FakeSource,
+    FakeWindow,
+)
+
+__all__ = [
+]
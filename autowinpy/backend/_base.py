@@ -0,0 +1,143 @@
+"""플랫폼 백엔드 기본 클래스와 선택 함수
+"""
+from abc import ABC, abstractmethod
+from typing import Iterator, List
+import sys
+
+from ..type import Rect
+from ._capture import CaptureSource
+
+
+class BackendError(Exception):
+    """백엔드 오류 처리"""
+
+    def __init__(self, message: str):
+        """초기화"""
+        self.message: str = message
+
+    def __str__(self) -> str:
+        """메시지 전달"""
+        return self.message
+
+
+class Backend(ABC):
+    """플랫폼 백엔드 기본 클래스
+
+    윈도우 목록, 이름, 영역, 캡처, 메시지 전송을 담당합니다.
+    :class:`Gui <autowinpy.Gui>` 를 비롯한 상위 모듈은 이 인터페이스만
+    사용하므로, 백엔드를 바꾸면 같은 코드가 다른 플랫폼에서
+    동작합니다.
+    """
+
+    __module__ = 'autowinpy.backend'
+
+    @abstractmethod
+    def handle_list(self) -> List[int]:
+        """최상위 윈도우 핸들 리스트"""
+
+    @abstractmethod
+    def child_handle_list(self, hwnd: int) -> List[int]:
+        """자식 윈도우 핸들 리스트
+
+        Args:
+            hwnd: 부모 윈도우 핸들
+        """
+
+    @abstractmethod
+    def direct_children(self, hwnd: int) -> Iterator[int]:
+        """직계 자식 윈도우 핸들을 하나씩 출력
+
+        Args:
+            hwnd: 부모 윈도우 핸들
+        """
+
+    @abstractmethod
+    def is_active_gui(self, hwnd: int) -> bool:
+        """윈도우가 활성화되어 보이는지 확인
+
+        Args:
+            hwnd: 윈도우 핸들
+        """
+
+    @abstractmethod
+    def window_text(self, hwnd: int) -> str:
+        """윈도우 이름, 이름이 비어있으면 ``"(hwnd)"``
+
+        Args:
+            hwnd: 윈도우 핸들
+        """
+
+    @abstractmethod
+    def window_class(self, hwnd: int) -> str:
+        """윈도우 클래스 이름
+
+        Args:
+            hwnd: 윈도우 핸들
+        """
+
+    @abstractmethod
+    def window_rect(self, hwnd: int) -> Rect:
+        """윈도우 사각영역
+
+        Args:
+            hwnd: 윈도우 핸들
+        """
+
+    @abstractmethod
+    def capture_source(self, hwnd: int) -> CaptureSource:
+        """윈도우 캡처 원본
+
+        Args:
+            hwnd: 윈도우 핸들
+        """
+
+    @abstractmethod
+    def post_message(self, hwnd: int, msg: int, wparam: int, lparam: int):
+        """윈도우 메시지 전송
+
+        Args:
+            hwnd: 윈도우 핸들
+            msg: 메시지 번호
+            wparam: 메시지 인자
+            lparam: 메시지 인자
+        """
+
+    def dpi_scale_factor(self) -> float:
+        """HIDPI 배율"""
+        return 1.0
+
+
+_backend: Backend = None
+
+
+def get_backend() -> Backend:
+    """현재 백엔드 출력
+
+    백엔드를 지정하지 않았다면 Windows에서는 Win32 백엔드를 처음
+    호출할 때 불러옵니다.
+
+    Returns:
+        :class:`Backend` 현재 백엔드
+    """
+    global _backend
+    if _backend is None:
+        if sys.platform != "win32":
+            raise BackendError(
+                "Windows가 아닌 환경에서는 set_backend()로 백엔드를 지정해야 합니다.")
+        from ..win32._backend import Win32Backend
+        _backend = Win32Backend()
+    return _backend
+
+
+def set_backend(backend: Backend) -> Backend:
+    """백엔드 변경
+
+    Args:
+        backend: 사용할 백엔드, ``None`` 이면 기본 백엔드로 되돌림
+
+    Returns:
+        :class:`Backend` 직전 백엔드
+    """
+    global _backend
+    previous, _backend = _backend, backend
+    return previous
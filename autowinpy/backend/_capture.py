@@ -0,0 +1,152 @@
+"""윈도우 캡처 버퍼
+
+캡처 원본(:class:`CaptureSource`)이 BGRX 픽셀을 미리 할당한 버퍼에
+직접 쓰고, :class:`WindowCapture` 가 이를 BGR 이미지로 변환합니다.
+이 모듈은 pywin32 없이 동작하므로 가짜 원본으로 버퍼와 변환 과정을
+시험할 수 있습니다.
+"""
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Tuple
+
+import cv2
+import numpy
+
+from .._profiler import profiler
+from ..type import Image
+
+
+class CaptureError(Exception):
+    """캡처 오류 처리"""
+
+    def __init__(self, message: str):
+        """초기화"""
+        self.message: str = message
+
+    def __str__(self) -> str:
+        """메시지 전달"""
+        return self.message
+
+
+class CaptureSource(ABC):
+    """캡처 원본 기본 클래스
+
+    하위 클래스는 :meth:`size` 와 :meth:`read_into` 를 구현합니다.
+    """
+
+    __module__ = 'autowinpy.backend'
+
+    @abstractmethod
+    def size(self) -> Tuple[int, int]:
+        """현재 캡처 크기
+
+        Returns:
+            (``int, int``) 너비, 높이
+        """
+
+    @abstractmethod
+    def read_into(self, buffer: numpy.ndarray):
+        """BGRX 픽셀을 버퍼에 씁니다.
+
+        Args:
+            buffer: ``(높이, 너비, 4)`` 모양의 ``uint8`` C 연속 배열
+        """
+
+    def close(self):
+        """원본이 가진 자원을 해제합니다."""
+
+
+class BytesSource(CaptureSource):
+    """BGRX 바이트열을 순서대로 돌려주는 캡처 원본
+
+    실제 윈도우 없이 캡처 과정을 시험하거나 측정할 때 사용합니다.
+
+    Args:
+        width: 프레임 너비
+        height: 프레임 높이
+        frames: BGRX 바이트열 목록, 끝에 다다르면 처음부터 반복
+    """
+
+    __module__ = 'autowinpy.backend'
+
+    def __init__(self, width: int, height: int, frames: Iterable[bytes]):
+        """초기화"""
+        self._size: Tuple[int, int] = (width, height)
+        self._frames: List[bytes] = list(frames)
+        self._index: int = 0
+        for frame in self._frames:
+            if len(frame) != width * height * 4:
+                raise CaptureError("프레임 크기가 BGRX {}x{} 와 다릅니다.".format(width, height))
+
+    def size(self) -> Tuple[int, int]:
+        """현재 캡처 크기"""
+        return self._size
+
+    def read_into(self, buffer: numpy.ndarray):
+        """다음 프레임을 버퍼에 복사합니다."""
+        frame = self._frames[self._index]
+        self._index = (self._index + 1) % len(self._frames)
+        numpy.copyto(buffer, numpy.frombuffer(frame, numpy.uint8).reshape(buffer.shape))
+
+
+class WindowCapture:
+    """버퍼를 재사용하는 캡처 클래스
+
+    BGRX 버퍼와 BGR 출력 버퍼를 한 번만 할당하고, 캡처 크기가 바뀔
+    때만 다시 할당합니다.
+
+    Args:
+        source: 캡처 원본
+    """
+
+    __module__ = 'autowinpy.backend'
+
+    def __init__(self, source: CaptureSource):
+        """초기화"""
+        self._source: CaptureSource = source
+        self._raw: numpy.ndarray = None
+        self._frame: numpy.ndarray = None
+
+    def __enter__(self) -> 'WindowCapture':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    @property
+    def source(self) -> CaptureSource:
+        """(:class:`CaptureSource`) 캡처 원본"""
+        return self._source
+
+    def capture(self, copy: bool=False) -> Image:
+        """한 프레임을 캡처합니다.
+
+        Args:
+            copy: ``True`` 이면 새 배열로 출력, ``False`` 이면 다음
+                캡처에서 덮어쓰는 내부 버퍼를 출력. 기본값 ``False``
+
+        Returns:
+            BGR 이미지
+        """
+        t = profiler.clock()
+        width, height = self._source.size()
+        if self._raw is None or self._raw.shape[:2] != (height, width):
+            self._raw = numpy.empty((height, width, 4), dtype=numpy.uint8)
+            self._frame = numpy.empty((height, width, 3), dtype=numpy.uint8)
+        self._source.read_into(self._raw)
+        if copy:
+            frame = Image(cv2.cvtColor(self._raw, cv2.COLOR_BGRA2BGR))
+        else:
+            cv2.cvtColor(self._raw, cv2.COLOR_BGRA2BGR, dst=self._frame)
+            frame = Image(self._frame)
+        profiler.lap("capture", "", t)
+        return frame
+
+    def close(self):
+        """캡처 원본과 버퍼를 해제합니다."""
+        source, self._source = getattr(self, "_source", None), None
+        if source is not None:
+            source.close()
+        self._raw = self._frame = None
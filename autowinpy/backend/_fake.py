@@ -0,0 +1,190 @@
+"""메모리 가짜 백엔드
+
+실제 윈도우 없이 합성 윈도우와 프레임을 제공합니다. 매칭과 캡처
+과정을 Windows가 아닌 환경에서 시험하거나 측정할 때 사용합니다.
+"""
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple, Union
+
+import cv2
+import numpy
+
+from ..type import Image, Rect
+from ._base import Backend, BackendError
+from ._capture import CaptureSource
+
+
+class FakeWindow:
+    """가짜 백엔드의 윈도우
+
+    Args:
+        hwnd: 윈도우 핸들
+        title: 윈도우 이름
+        rect: 윈도우 사각영역
+        frames: BGR 프레임 목록 또는 프레임 번호를 받아 BGR 프레임을
+            만드는 함수
+        parent: 부모 윈도우 핸들, 최상위 윈도우는 ``None``
+        active: 활성 여부
+        class_name: 윈도우 클래스 이름
+    """
+
+    __module__ = 'autowinpy.backend'
+
+    def __init__(self, hwnd: int, title: str, rect: Rect,
+                 frames: Union[Sequence[Image], Callable[[int], Image]]=None,
+                 parent: int=None, active: bool=True, class_name: str=""):
+        """초기화"""
+        self.hwnd: int = hwnd
+        self.title: str = title
+        self.rect: Rect = rect
+        self.frames = frames
+        self.parent: int = parent
+        self.active: bool = active
+        self.class_name: str = class_name
+        self.children: List[int] = []
+        self.frame_count: int = 0
+
+    def next_frame(self) -> Image:
+        """다음 프레임 출력, 프레임이 없으면 검은 화면"""
+        index, self.frame_count = self.frame_count, self.frame_count + 1
+        if self.frames is None:
+            return Image(numpy.zeros((self.rect.height, self.rect.width, 3), numpy.uint8))
+        if callable(self.frames):
+            return self.frames(index)
+        return self.frames[index % len(self.frames)]
+
+
+class FakeSource(CaptureSource):
+    """가짜 윈도우 캡처 원본
+
+    Args:
+        window: 캡처할 가짜 윈도우
+    """
+
+    __module__ = 'autowinpy.backend'
+
+    def __init__(self, window: FakeWindow):
+        """초기화"""
+        self._window: FakeWindow = window
+
+    def size(self) -> Tuple[int, int]:
+        """현재 캡처 크기"""
+        return self._window.rect.size
+
+    def read_into(self, buffer: numpy.ndarray):
+        """다음 프레임을 BGRX로 버퍼에 씁니다.
+
+        프레임은 회색조, BGR, BGRA 중 하나이며 버퍼와 크기가 같아야
+        합니다.
+
+        Raises:
+            BackendError: 프레임 크기나 채널 수가 맞지 않을 때
+        """
+        frame = self._window.next_frame()
+        channels = 1 if frame.ndim == 2 else frame.shape[2]
+        if frame.shape[:2] != buffer.shape[:2] or channels not in (1, 3, 4):
+            raise BackendError("프레임 {} 를 버퍼 {} 에 쓸 수 없습니다.".format(
+                frame.shape, buffer.shape))
+        if channels == 1:
+            cv2.cvtColor(frame, cv2.COLOR_GRAY2BGRA, dst=buffer)
+        elif channels == 3:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2BGRA, dst=buffer)
+        else:
+            buffer[...] = frame
+
+
+class FakeBackend(Backend):
+    """메모리 가짜 백엔드
+
+    :meth:`add_window` 로 윈도우를 만들고, 전송된 메시지는
+    :attr:`messages` 에 ``(시각, hwnd, msg, wparam, lparam)`` 으로
+    기록됩니다.
+
+    Args:
+        dpi_scale: HIDPI 배율, 기본값 ``1.0``
+    """
+
+    __module__ = 'autowinpy.backend'
+
+    def __init__(self, dpi_scale: float=1.0):
+        """초기화"""
+        self._windows: Dict[int, FakeWindow] = {}
+        self._next_hwnd: int = 0x10000
+        self._dpi_scale: float = dpi_scale
+        self.messages: List[Tuple[float, int, int, int, int]] = []
+
+    def add_window(self, title: str, rect: Rect,
+                   frames: Union[Sequence[Image], Callable[[int], Image]]=None,
+                   parent: int=None, active: bool=True, class_name: str="") -> int:
+        """가짜 윈도우 추가
+
+        Args:
+            title: 윈도우 이름
+            rect: 윈도우 사각영역
+            frames: BGR 프레임 목록 또는 프레임 번호를 받는 함수
+            parent: 부모 윈도우 핸들
+            active: 활성 여부
+            class_name: 윈도우 클래스 이름
+
+        Returns:
+            새 윈도우 핸들
+        """
+        hwnd, self._next_hwnd = self._next_hwnd, self._next_hwnd + 4
+        self._windows[hwnd] = FakeWindow(
+            hwnd, title, rect, frames, parent, active, class_name)
+        if parent is not None:
+            self.window(parent).children.append(hwnd)
+        return hwnd
+
+    def window(self, hwnd: int) -> FakeWindow:
+        """핸들로 가짜 윈도우 출력"""
+        try:
+            return self._windows[hwnd]
+        except KeyError:
+            raise BackendError("존재하지 않는 핸들입니다. {}".format(hwnd))
+
+    def handle_list(self) -> List[int]:
+        """최상위 윈도우 핸들 리스트"""
+        return [h for h, w in self._windows.items() if w.parent is None]
+
+    def child_handle_list(self, hwnd: int) -> List[int]:
+        """모든 자손 윈도우 핸들 리스트 (깊이 우선)"""
+        out: List[int] = []
+        for child in self.window(hwnd).children:
+            out.append(child)
+            out.extend(self.child_handle_list(child))
+        return out
+
+    def direct_children(self, hwnd: int) -> Iterator[int]:
+        """직계 자식 윈도우 핸들"""
+        return iter(list(self.window(hwnd).children))
+
+    def is_active_gui(self, hwnd: int) -> bool:
+        """윈도우 활성 여부"""
+        return self.window(hwnd).active
+
+    def window_text(self, hwnd: int) -> str:
+        """윈도우 이름"""
+        title = self.window(hwnd).title
+        return title if title.strip() else "({})".format(hwnd)
+
+    def window_class(self, hwnd: int) -> str:
+        """윈도우 클래스 이름"""
+        return self.window(hwnd).class_name
+
+    def window_rect(self, hwnd: int) -> Rect:
+        """윈도우 사각영역"""
+        return self.window(hwnd).rect
+
+    def capture_source(self, hwnd: int) -> CaptureSource:
+        """윈도우 캡처 원본"""
+        return FakeSource(self.window(hwnd))
+
+    def post_message(self, hwnd: int, msg: int, wparam: int, lparam: int):
+        """메시지를 기록합니다."""
+        self.window(hwnd)
+        self.messages.append((perf_counter(), hwnd, msg, wparam, lparam))
+
+    def dpi_scale_factor(self) -> float:
+        """HIDPI 배율"""
+        return self._dpi_scale
@@ -1,20 +1,51 @@
 """코어 모듈
+
+각 객체는 처음 접근할 때 해당 모듈을 불러옵니다. 예를 들어
+:class:`Template` 만 사용하면 매칭 서버(multiprocessing)나
+파이프라인(asyncio) 모듈은 불러오지 않습니다.
 """
-from ._cls_gui import (
-    Gui,
-    window_list,
-    find_window,
-)
+import importlib
+
+# {공개 이름: 정의한 모듈}
+_EXPORTS = {
+    "Gui": "._cls_gui",
+    "GuiNode": "._cls_gui",
+    "window_list": "._cls_gui",
+    "find_window": "._cls_gui",
+    "WindowInfo": "._cls_window_snapshot",
+    "WindowSnapshot": "._cls_window_snapshot",
+    "Template": "._cls_template",
+    "TemplateSet": "._cls_template_set",
+    "TemplateLibrary": "._cls_template_library",
+    "ChangeDetector": "._cls_frame_gate",
+    "FrameGate": "._cls_frame_gate",
+    "MatchPipeline": "._cls_pipeline",
+    "SearchExecutor": "._cls_search_executor",
+    "MatchServer": "._cls_match_server",
+    "MatchClient": "._cls_match_server",
+    "FrameRecorder": "._cls_recorder",
+    "FrameReplay": "._cls_recorder",
+    "InputScheduler": "._cls_input",
+    "drag_path": "._path",
+    "Profiler": ".._profiler",
+    "profiler": ".._profiler",
+}
+
+__all__ = list(_EXPORTS)
+
 
-from ._cls_template import (
-    Template,
-)
+def __getattr__(name: str):
+    """객체를 처음 접근할 때 정의한 모듈을 불러옵니다."""
+    if name == "_set_windows_dpi":
+        module = "._system"
+    else:
+        module = _EXPORTS.get(name)
+        if module is None:
+            raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-from ._system import _set_windows_dpi
 
-__all__ = [
-    "Gui",
-    "window_list",
-    "find_window",
-    "Template"
-]
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
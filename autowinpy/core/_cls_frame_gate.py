@@ -0,0 +1,192 @@
+"""프레임 변화 감지 클래스
+"""
+from ._cls_template import Template
+from ._cls_template_set import TemplateSet
+from ..type import Image, Rect
+from typing import Dict, Tuple
+import cv2
+import numpy
+
+
+class ChangeDetector:
+    """직전 프레임과 비교해 바뀐 블록을 찾는 클래스
+
+    프레임을 ``block_size`` 크기의 격자로 나누고, 기준 프레임과
+    ``tolerance`` 보다 크게 다른 픽셀이 하나라도 있는 블록을 바뀐
+    블록으로 표시합니다. 기준 프레임은 바뀐 블록만 새 프레임으로
+    갱신하므로, 문턱값 아래의 작은 변화도 블록마다 누적되어 결국
+    감지됩니다.
+
+    Args:
+        block_size: 격자 블록 크기(px), 기본값 ``32``
+        tolerance: 무시할 픽셀 값 차이, 기본값 ``0``
+    """
+
+    __module__ = 'autowinpy'
+
+    def __init__(self, block_size: int=32, tolerance: int=0):
+        """초기화"""
+        self._block_size: int = block_size
+        self._tolerance: int = tolerance
+        self._previous: Image = None
+        self._grid: numpy.ndarray = None
+
+    @property
+    def block_size(self) -> int:
+        """(int) 격자 블록 크기"""
+        return self._block_size
+
+    @property
+    def grid(self) -> numpy.ndarray:
+        """(numpy.ndarray) 블록별 변화 여부, 첫 프레임은 모두 ``True``"""
+        return self._grid
+
+    def reset(self):
+        """직전 프레임을 지웁니다. 다음 프레임은 모두 바뀐 것으로 봅니다."""
+        self._previous = None
+        self._grid = None
+
+    def update(self, screen: Image) -> numpy.ndarray:
+        """새 프레임을 비교하고 바뀐 블록을 기준 프레임에 반영합니다.
+
+        Args:
+            screen: 새 프레임
+
+        Returns:
+            (``numpy.ndarray``) 블록별 변화 여부, ``bool`` 격자
+        """
+        height, width = screen.shape[:2]
+        b = self._block_size
+        grid_shape = (-(-height // b), -(-width // b))
+        previous = self._previous
+        if previous is None or previous.shape != screen.shape:
+            self._previous = numpy.array(screen)
+            self._grid = numpy.ones(grid_shape, dtype=bool)
+            return self._grid
+        if cv2.norm(screen, previous, cv2.NORM_INF) <= self._tolerance:
+            # 바뀐 픽셀 없음
+            self._grid = numpy.zeros(grid_shape, dtype=bool)
+            return self._grid
+        diff = cv2.absdiff(screen, previous).reshape(height, -1)
+        # 블록별 최대 차이: 행 블록 -> 열 블록 순서로 축소
+        rows = numpy.maximum.reduceat(diff, numpy.arange(0, height, b), axis=0)
+        rows = rows.reshape(grid_shape[0], width, -1)
+        blocks = numpy.maximum.reduceat(rows, numpy.arange(0, width, b), axis=1)
+        self._grid = blocks.max(axis=2) > self._tolerance
+        # 바뀐 블록만 기준 프레임에 복사
+        where = self._grid.repeat(b, axis=0)[:height].repeat(b, axis=1)[:, :width]
+        if screen.ndim == 3:
+            where = where[:, :, None]
+        numpy.copyto(previous, screen, where=where)
+        return self._grid
+
+    def changed(self, rect: Rect) -> bool:
+        """영역에 바뀐 블록이 있는지 확인합니다.
+
+        Args:
+            rect: 확인할 스크린 좌표 영역
+
+        Returns:
+            바뀐 블록 포함 여부, 비교한 프레임이 없으면 ``True``
+        """
+        if self._grid is None:
+            return True
+        b = self._block_size
+        return bool(self._grid[
+            rect.top // b:-(-rect.bottom // b),
+            rect.left // b:-(-rect.right // b)].any())
+
+
+class FrameGate:
+    """바뀌지 않은 영역의 탬플릿 탐색을 건너뛰는 클래스
+
+    :class:`ChangeDetector` 로 프레임 변화를 감지하고, 탐색 영역이
+    바뀌지 않은 탬플릿은 직전 탐색 결과를 재사용합니다. 탬플릿의
+    :meth:`Template.configure` 로 설정을 바꾸면 다음 프레임에서 다시
+    탐색합니다.
+
+    Args:
+        templates: :class:`TemplateSet` 또는 ``{이름: Template}``
+        block_size: 격자 블록 크기(px), 기본값 ``32``
+        tolerance: 무시할 픽셀 값 차이, 기본값 ``0``
+    """
+
+    __module__ = 'autowinpy'
+
+    def __init__(self, templates, block_size: int=32, tolerance: int=0):
+        """초기화"""
+        if not isinstance(templates, TemplateSet):
+            templates = TemplateSet(templates)
+        self._templates: TemplateSet = templates
+        self._detector = ChangeDetector(block_size, tolerance)
+        # {이름: (탬플릿, 설정 리비전, 탐색 결과)}
+        self._results: Dict[str, Tuple[Template, int, Tuple[bool, Rect, float]]] = {}
+        self._stats: Dict[str, int] = {}
+        self.reset()
+
+    @property
+    def templates(self) -> TemplateSet:
+        """(:class:`TemplateSet`) 탐색할 탬플릿 묶음"""
+        return self._templates
+
+    @property
+    def detector(self) -> ChangeDetector:
+        """(:class:`ChangeDetector`) 변화 감지기"""
+        return self._detector
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """건너뛴 프레임과 탐색 횟수 출력
+
+        Returns:
+            ``frames`` 전체 프레임 수,
+            ``frames_skipped`` 탐색을 모두 건너뛴 프레임 수,
+            ``searches`` 실행한 탐색 수,
+            ``searches_skipped`` 재사용한 탐색 수
+        """
+        return dict(self._stats)
+
+    def reset(self):
+        """직전 프레임, 탐색 결과와 통계를 초기화합니다."""
+        self._detector.reset()
+        self._results = {}
+        self._stats = {
+            "frames": 0, "frames_skipped": 0,
+            "searches": 0, "searches_skipped": 0}
+
+    def screen_search(self, screen: Image) -> Dict[str, Tuple[bool, Rect, float]]:
+        """스크린에서 등록된 모든 탬플릿을 찾습니다
+
+        Args:
+            screen: 탬플릿을 탐색할 이미지
+
+        Returns:
+            ``{이름: (탐색 성공 여부, 탐색 결과 영역, 매칭 점수)}``
+        """
+        self._detector.update(screen)
+        width, height = screen.size()
+        screen_gray: Image = None
+        results: Dict[str, Tuple[bool, Rect, float]] = {}
+        cache = {}
+        searched = 0
+        for name in self._templates:
+            template: Template = self._templates[name]
+            region = template._search_region(width, height)
+            cached = self._results.get(name)
+            if (cached is not None and cached[0] is template
+                    and cached[1] == template._revision
+                    and not self._detector.changed(region)):
+                results[name] = cached[2]
+                cache[name] = cached
+                continue
+            if screen_gray is None:
+                screen_gray = screen.grayscale
+            results[name] = template._search(screen_gray, is_gray=True)
+            cache[name] = (template, template._revision, results[name])
+            searched += 1
+        self._results = cache
+        self._stats["frames"] += 1
+        self._stats["frames_skipped"] += searched == 0
+        self._stats["searches"] += searched
+        self._stats["searches_skipped"] += len(results) - searched
+        return results
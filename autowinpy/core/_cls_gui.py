@@ -1,23 +1,35 @@
 """Gui 클래스
 """
-from .. import win32
-from typing import List
-from ..type import Image
-import numpy
+from ..backend import WindowCapture, get_backend
+from time import monotonic
+from typing import Callable, Dict, Iterator, List
 import re
+from ..type import Image
 
 class Gui:
     """윈도우 앱 제어 클래스
 
+    ``max_age`` 를 지정하면 이름, 영역, 활성 여부를 처음 요청할 때
+    가져와 속성별로 보관하고, 그 속성의 보관 시간이 지나거나
+    :meth:`refresh` 를 호출할 때만 다시 가져옵니다.
+
     Args:
         hwnd: 핸들 ID
+        max_age: [선택] 보관한 속성의 최대 나이(초), 기본값 ``None``
+            이면 매번 조회합니다. ``float("inf")`` 이면 :meth:`refresh`
+            로만 갱신합니다.
     """
 
     __module__ = 'autowinpy'
+    __slots__ = ("_hwnd", "_capture", "_max_age", "_fetched")
 
-    def __init__(self, hwnd: int):
+    def __init__(self, hwnd: int, max_age: float=None):
         """초기화"""
         self._hwnd = hwnd
+        self._capture: WindowCapture = None
+        self._max_age: float = max_age
+        # {속성: (가져온 시각, 값)}, 보관 모드에서 처음 읽을 때 만듦
+        self._fetched: Dict[str, tuple] = None
 
     def __str__(self):
         """출력"""
@@ -27,14 +39,37 @@ class Gui:
         """터미널 출력"""
         return "({}) {}".format(self.hwnd, self.name)
 
+    def refresh(self) -> 'Gui':
+        """이름, 영역, 활성 여부를 다시 가져옵니다."""
+        backend = get_backend()
+        now = monotonic()
+        self._fetched = {
+            "name": (now, backend.window_text(self._hwnd)),
+            "rect": (now, backend.window_rect(self._hwnd)),
+            "active": (now, backend.is_active_gui(self._hwnd)),
+        }
+        return self
+
+    def _cached(self, field: str, fetch: Callable[[int], object]):
+        """보관 모드이면 보관한 값을, 오래되었거나 아니면 새로 가져온 값을 출력"""
+        if self._max_age is None:
+            return fetch(self._hwnd)
+        now = monotonic()
+        if self._fetched is None:
+            self._fetched = {}
+        entry = self._fetched.get(field)
+        if entry is None or now - entry[0] >= self._max_age:
+            entry = self._fetched[field] = (now, fetch(self._hwnd))
+        return entry[1]
+
     @property
     def _is_active(self) -> bool:
-        return win32.is_active_gui(self.hwnd)
+        return self._cached("active", get_backend().is_active_gui)
 
     @property
     def name(self) -> str:
         """(str) 윈도우 이름"""
-        return win32.window_text(self.hwnd)
+        return self._cached("name", get_backend().window_text)
 
     @property
     def hwnd(self) -> int:
@@ -46,37 +81,160 @@ class Gui:
         """윈도우 :class:`Rect <autowinpy.type.Rect>`
         사각영역 객체
         """
-        return win32.window_rect(self.hwnd)
+        return self._cached("rect", get_backend().window_rect)
 
     def childs(self) -> List['autowinpy.Gui']:
-        """자식 :class:`Gui` 목록 출력"""
-        child_list =  [Gui(h) for h in win32.child_handle_list(self.hwnd)]
+        """자식 :class:`Gui` 목록 출력
+
+        자식은 부모와 같은 ``max_age`` 를 사용합니다.
+        """
+        child_list =  [Gui(h, self._max_age)
+                       for h in get_backend().child_handle_list(self.hwnd)]
         return [g for g in child_list if g._is_active]
 
+    def walk(self, max_depth: int=None, class_name: str=None,
+             title_re: str=None, active_only: bool=True) -> Iterator['GuiNode']:
+        """자손 윈도우를 깊이 우선으로 하나씩 출력합니다
+
+        필요한 만큼만 자식을 열거하므로, 원하는 윈도우를 찾으면 바로
+        멈출 수 있습니다. 탐색은 핸들로만 진행하고, :class:`Gui` 와
+        :class:`GuiNode` 는 조건에 맞는 윈도우와 그 조상에 대해서만
+        만듭니다. 조건에 맞지 않는 윈도우의 자손도 탐색합니다.
+
+        Args:
+            max_depth: [선택] 최대 깊이, 직계 자식이 ``1``
+            class_name: [선택] 일치해야 하는 클래스 이름
+            title_re: [선택] 이름이 만족(``re.search``)해야 하는 정규표현식
+            active_only: 비활성 윈도우와 그 자손을 건너뜀, 기본값 ``True``
+
+        Returns:
+            :class:`GuiNode` 반복자
+        """
+        backend = get_backend()
+        _rex = re.compile(title_re) if title_re is not None else None
+        max_age = self._max_age
+
+        def node(frame: list) -> GuiNode:
+            # [핸들, 깊이, 부모 프레임, 노드], 노드는 처음 필요할 때 만듦
+            if frame[3] is None:
+                frame[3] = GuiNode(Gui(frame[0], max_age), node(frame[2]), frame[1])
+            return frame[3]
+
+        root = [self._hwnd, 0, None, GuiNode(self, None, 0)]
+        # (부모 프레임, 직계 자식 반복자) 스택
+        stack = [(root, backend.direct_children(self._hwnd))]
+        while stack:
+            parent, children = stack[-1]
+            hwnd = next(children, None)
+            if hwnd is None:
+                stack.pop()
+                continue
+            if active_only and not backend.is_active_gui(hwnd):
+                continue
+            depth = parent[1] + 1
+            frame = [hwnd, depth, parent, None]
+            if ((class_name is None or backend.window_class(hwnd) == class_name)
+                    and (_rex is None or _rex.search(backend.window_text(hwnd)))):
+                yield node(frame)
+            if max_depth is None or depth < max_depth:
+                stack.append((frame, backend.direct_children(hwnd)))
+
+    def find_child(self, predicate: Callable[['Gui'], bool]=None,
+                   max_depth: int=None, class_name: str=None,
+                   title_re: str=None) -> 'Gui':
+        """조건을 만족하는 첫 번째 자손 윈도우를 찾습니다
+
+        Args:
+            predicate: [선택] :class:`Gui` 를 받아 ``bool`` 을 출력하는 함수
+            max_depth: [선택] 최대 깊이
+            class_name: [선택] 일치해야 하는 클래스 이름
+            title_re: [선택] 이름이 만족해야 하는 정규표현식
+
+        Returns:
+            :class:`Gui`, 없으면 ``None``
+        """
+        for node in self.walk(max_depth, class_name, title_re):
+            if predicate is None or predicate(node.gui):
+                return node.gui
+        return None
+
+    def tree(self, max_depth: int=None) -> 'GuiNode':
+        """자손 윈도우를 부모-자식 구조로 출력합니다
+
+        Args:
+            max_depth: [선택] 최대 깊이
+
+        Returns:
+            이 윈도우를 뿌리로 하는 :class:`GuiNode`
+        """
+        root = None
+        for node in self.walk(max_depth):
+            node.parent.children.append(node)
+            if root is None:
+                root = node.parent  # 첫 노드는 직계 자식
+        return root or GuiNode(self, None, 0)
+
     def image_array(self) -> Image:
-        """이미지 출력"""
-        return Image(win32.window_array(self.hwnd))
+        """이미지 출력
 
-def window_list() -> List[Gui]:
+        캡처에 쓰는 GDI 객체와 버퍼는 첫 호출에 만들어 재사용합니다.
+        """
+        if self._capture is None:
+            self._capture = WindowCapture(get_backend().capture_source(self.hwnd))
+        return self._capture.capture(copy=True)
+
+class GuiNode:
+    """윈도우 트리의 노드
+
+    Args:
+        gui: 노드의 :class:`Gui`
+        parent: 부모 노드, 뿌리는 ``None``
+        depth: 뿌리로부터의 깊이
+    """
+
+    __module__ = 'autowinpy'
+    __slots__ = ("gui", "parent", "depth", "children")
+
+    def __init__(self, gui: Gui, parent: 'GuiNode', depth: int):
+        """초기화"""
+        self.gui: Gui = gui
+        self.parent: GuiNode = parent
+        self.depth: int = depth
+        self.children: List[GuiNode] = []
+
+    def __repr__(self):
+        """터미널 출력"""
+        return "{}{!r}".format("  " * self.depth, self.gui)
+
+def window_list(max_age: float=0.5) -> List[Gui]:
     """활성 윈도우를 Gui 목록으로 출력
 
+    Args:
+        max_age: 재사용할 윈도우 스냅샷의 최대 나이(초),
+            ``0`` 이면 항상 새로 열거합니다. 기본값 ``0.5``
+
     Return:
         :class:`Gui` 리스트
     """
-    win_list: List[Gui] = [Gui(h) for h in win32.handle_list()]
-    return [g for g in win_list if g._is_active]
+    from ._cls_window_snapshot import _default_snapshot
+    return _default_snapshot.windows(max_age)
 
-def find_window(name_re:str) -> List[Gui]:
+def find_window(name_re:str, max_age: float=0.5) -> List[Gui]:
     """정규표현식으로 윈도우를 찾습니다.
 
+    Args:
+        name_re: 정규표현식
+        max_age: 재사용할 윈도우 스냅샷의 최대 나이(초),
+            ``0`` 이면 항상 새로 열거합니다. 기본값 ``0.5``
+
     Returns:
         정규식 규칙을 포함하는 :class:`Gui` 리스트
 
     Note:
         ``re.search()`` 를 만족하는 윈도우를 출력하기 때문에,
         문자열을 포함하거나 일치하는 윈도우를 찾을 때도 활용할
-        수 있습니다.
+        수 있습니다. 반복 호출은 :class:`WindowSnapshot` 을
+        공유하므로 ``max_age`` 안에서는 OS를 다시 조회하지 않습니다.
     """
-    _rex = re.compile(name_re)
-    wins = [win for win in window_list() if _rex.search(win.name)]
-    return wins
+    from ._cls_window_snapshot import _default_snapshot
+    return _default_snapshot.search(name_re, max_age)
@@ -0,0 +1,233 @@
+"""입력 메시지 스케줄러 클래스
+"""
+from ._path import drag_path
+from ..backend import Backend, get_backend
+from concurrent.futures import CancelledError, Future
+from itertools import count
+from time import perf_counter
+from typing import Dict, List, Sequence, Tuple
+import heapq
+import threading
+
+# 윈도우 메시지
+WM_MOUSEMOVE = 0x0200
+WM_LBUTTONDOWN = 0x0201
+WM_LBUTTONUP = 0x0202
+WM_KEYDOWN = 0x0100
+WM_KEYUP = 0x0101
+MK_LBUTTON = 0x0001
+
+# (시작 기준 시각, 메시지, wParam, lParam)
+InputEvent = Tuple[float, int, int, int]
+
+
+def _lparam(x: int, y: int) -> int:
+    """좌표를 lParam으로 변환"""
+    return (x & 0xFFFF) | (y & 0xFFFF) << 16
+
+
+class _Command:
+    """예약된 명령 하나의 진행 상태"""
+
+    __slots__ = ("future", "remaining", "posted", "dropped")
+
+    def __init__(self, future: Future, remaining: int):
+        self.future: Future = future
+        self.remaining: int = remaining
+        self.posted: int = 0
+        self.dropped: bool = False
+
+
+class InputScheduler:
+    """입력 메시지를 백그라운드 스레드에서 보내는 스케줄러
+
+    클릭, 이동, 드래그, 키 입력 명령을 메시지 목록으로 바꾸고, 각
+    메시지를 보낼 시각을 단조 시계 기준으로 미리 계산합니다. 같은
+    핸들의 명령은 예약한 순서대로 이어서 실행되고, 다른 핸들의
+    명령은 동시에 진행됩니다. 명령을 예약하는 함수는 바로 반환하며
+    :class:`concurrent.futures.Future` 로 완료(보낸 메시지 수)를
+    알립니다.
+
+    Args:
+        backend: [선택] 메시지를 보낼 백엔드, 기본값은 현재 백엔드
+    """
+
+    __module__ = 'autowinpy'
+
+    def __init__(self, backend: Backend=None):
+        """초기화"""
+        self._backend: Backend = backend
+        self._heap: List[tuple] = []
+        self._sequence = count()
+        self._free: Dict[int, float] = {}
+        self._condition = threading.Condition()
+        self._closed: bool = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> 'InputScheduler':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        """(int) 아직 보내지 않은 메시지 수"""
+        with self._condition:
+            return len(self._heap)
+
+    def submit(self, hwnd: int, events: Sequence[InputEvent]) -> Future:
+        """메시지 목록을 예약합니다
+
+        Args:
+            hwnd: 메시지를 받을 핸들
+            events: ``(시작 기준 시각(초), 메시지, wParam, lParam)`` 목록,
+                시작 시각은 같은 핸들의 직전 명령이 끝나는 시각입니다.
+
+        Returns:
+            보낸 메시지 수를 결과로 가지는 ``Future``
+        """
+        future = Future()
+        if not events:
+            future.set_running_or_notify_cancel()
+            future.set_result(0)
+            return future
+        command = _Command(future, len(events))
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("종료된 스케줄러입니다.")
+            start = max(perf_counter(), self._free.get(hwnd, 0.0))
+            for offset, msg, wparam, lparam in events:
+                heapq.heappush(self._heap, (
+                    start + offset, next(self._sequence),
+                    hwnd, msg, wparam, lparam, command))
+            self._free[hwnd] = start + max(e[0] for e in events)
+            self._condition.notify()
+        return future
+
+    def click(self, hwnd: int, x: int, y: int, hold: float=0.01) -> Future:
+        """클릭 예약
+
+        Args:
+            hwnd: GUI 핸들
+            x: 클릭할 x 좌표
+            y: 클릭할 y 좌표
+            hold: 버튼을 누르고 있는 시간(초), 기본값 ``0.01``
+        """
+        lparam = _lparam(x, y)
+        return self.submit(hwnd, [
+            (0.0, WM_LBUTTONDOWN, MK_LBUTTON, lparam),
+            (hold, WM_LBUTTONUP, 0, lparam)])
+
+    def move(self, hwnd: int, x: int, y: int) -> Future:
+        """마우스 이동 예약
+
+        Args:
+            hwnd: GUI 핸들
+            x: 이동할 x 좌표
+            y: 이동할 y 좌표
+        """
+        return self.submit(hwnd, [(0.0, WM_MOUSEMOVE, 0, _lparam(x, y))])
+
+    def drag(self, hwnd: int, x0: int, y0: int, x1: int, y1: int,
+             step: float=0.01, duration: float=None, **path) -> Future:
+        """드래그 예약
+
+        Args:
+            hwnd: GUI 핸들
+            x0: 드래그를 시작할 x 좌표
+            y0: 드래그를 시작할 y 좌표
+            x1: 드래그를 끝낼 x 좌표
+            y1: 드래그를 끝낼 y 좌표
+            step: 이동 메시지 사이 간격(초), 기본값 ``0.01``
+            duration: [선택] 전체 이동 시간(초), 지정하면 ``step`` 대신
+                점 수에 맞춰 간격을 나눕니다.
+            **path: :func:`drag_path` 설정 (``spacing``, ``max_points``,
+                ``easing``, ``curve``, ``scale``)
+        """
+        lparams = drag_path(x0, y0, x1, y1, **path)
+        if duration is not None:
+            step = duration / (len(lparams) + 1)
+        events: List[InputEvent] = [(0.0, WM_LBUTTONDOWN, MK_LBUTTON, int(lparams[0]))]
+        events += [(step * (i + 1), WM_MOUSEMOVE, MK_LBUTTON, lp)
+                   for i, lp in enumerate(lparams.tolist())]
+        events.append((step * (len(lparams) + 1), WM_LBUTTONUP, 0, int(lparams[-1])))
+        return self.submit(hwnd, events)
+
+    def key(self, hwnd: int, vk: int, hold: float=0.01) -> Future:
+        """키 입력 예약
+
+        Args:
+            hwnd: GUI 핸들
+            vk: 가상 키 코드
+            hold: 키를 누르고 있는 시간(초), 기본값 ``0.01``
+        """
+        return self.submit(hwnd, [
+            (0.0, WM_KEYDOWN, vk, 0x00000001),
+            (hold, WM_KEYUP, vk, 0xC0000001)])
+
+    def close(self, wait: bool=True):
+        """스케줄러를 종료합니다
+
+        ``wait`` 가 ``False`` 면 남은 메시지를 버립니다. 아직 시작하지
+        않은 명령의 ``Future`` 는 취소되고, 메시지 일부를 이미 보낸
+        명령의 ``Future`` 는 :class:`concurrent.futures.CancelledError`
+        로 끝납니다.
+
+        Args:
+            wait: ``True`` 면 예약된 메시지를 모두 보낸 뒤 종료,
+                ``False`` 면 남은 명령을 취소
+        """
+        with self._condition:
+            self._closed = True
+            if not wait:
+                commands = {id(item[-1]): item[-1] for item in self._heap}
+                self._heap.clear()
+                for command in commands.values():
+                    if command.dropped:
+                        continue
+                    command.dropped = True
+                    if not command.future.cancel():
+                        command.future.set_exception(CancelledError())
+            self._condition.notify()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self):
+        """예약 시각에 맞춰 메시지를 보냅니다."""
+        while True:
+            with self._condition:
+                while True:
+                    if not self._heap:
+                        if self._closed:
+                            return
+                        self._condition.wait()
+                        continue
+                    delay = self._heap[0][0] - perf_counter()
+                    if delay <= 0:
+                        break
+                    self._condition.wait(delay)
+                _, _, hwnd, msg, wparam, lparam, command = heapq.heappop(self._heap)
+            self._post(hwnd, msg, wparam, lparam, command)
+
+    def _post(self, hwnd: int, msg: int, wparam: int, lparam: int, command: _Command):
+        """메시지 하나를 보내고 명령 상태를 갱신합니다."""
+        future = command.future
+        command.remaining -= 1
+        if command.posted == 0 and not command.dropped:
+            command.dropped = not future.set_running_or_notify_cancel()
+        if command.dropped:
+            return
+        try:
+            (self._backend or get_backend()).post_message(hwnd, msg, wparam, lparam)
+        except Exception as e:
+            with self._condition:
+                # close(wait=False) 가 먼저 끝냈을 수 있음
+                if not command.dropped:
+                    command.dropped = True
+                    future.set_exception(e)
+            return
+        command.posted += 1
+        if command.remaining == 0:
+            future.set_result(command.posted)
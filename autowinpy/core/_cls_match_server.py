@@ -0,0 +1,381 @@
+"""탬플릿 매칭 서버 클래스
+"""
+from ._cls_template_library import TemplateLibrary
+from ..type import Image, Rect
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import AuthenticationError, get_context, resource_tracker, shared_memory
+from multiprocessing.connection import Client, Listener
+from typing import Dict, List, Sequence, Tuple
+import ipaddress
+import os
+import sys
+import threading
+import cv2
+import numpy
+
+# CPython 내부 모듈, 자원 추적에 등록하지 않고 공유 메모리를 열 때만
+# 사용합니다. 없는 환경(Windows, 다른 구현)에서는 공개 API 로 엽니다.
+try:
+    import _posixshmem
+except ImportError:
+    _posixshmem = None
+
+# 작업 프로세스가 열어 둘 공유 메모리 수
+_MEMORY_CACHE = 16
+
+# 작업 프로세스 전역 상태
+_worker_templates = None
+_worker_memory: OrderedDict = OrderedDict()
+
+
+class MatchServerError(Exception):
+    """매칭 서버 오류 처리"""
+
+    def __init__(self, message: str):
+        """초기화"""
+        self.message: str = message
+
+    def __str__(self) -> str:
+        """메시지 전달"""
+        return self.message
+
+
+class _Attached:
+    """자원 추적에 등록하지 않고 연 POSIX 공유 메모리
+
+    :class:`~multiprocessing.shared_memory.SharedMemory` 와 같은
+    ``buf`` 와 ``close()`` 를 가집니다.
+    """
+
+    __slots__ = ("buf", "_mmap")
+
+    def __init__(self, name: str):
+        import mmap
+        fd = _posixshmem.shm_open("/" + name.lstrip("/"), os.O_RDWR, mode=0o600)
+        try:
+            self._mmap = mmap.mmap(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+        self.buf = memoryview(self._mmap)
+
+    def close(self):
+        self.buf.release()
+        self._mmap.close()
+
+
+def _open_shared(name: str):
+    """다른 프로세스가 만든 공유 메모리를 엽니다
+
+    공유 메모리는 클라이언트가 만들고 지우므로 자원 추적에 등록하지
+    않습니다. Python 3.13 부터는 ``track=False`` 를 사용합니다. 그 전
+    버전의 ``SharedMemory(name=...)`` 는 POSIX 에서 항상 등록하는데,
+    등록 후 해제하면 클라이언트와 자원 추적 프로세스를 공유할 때
+    클라이언트의 등록까지 지워져 ``unlink`` 때 경고가 남습니다. 그래서
+    ``_posixshmem`` 이 있으면 등록 없이 직접 열고, 없으면 공개 API 로
+    열고 등록을 해제합니다.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    if os.name != "posix":
+        # Windows 는 공유 메모리를 자원 추적에 등록하지 않음
+        return shared_memory.SharedMemory(name=name)
+    if _posixshmem is not None:
+        return _Attached(name)
+    memory = shared_memory.SharedMemory(name=name)
+    resource_tracker.unregister("/" + name.lstrip("/"), "shared_memory")
+    return memory
+
+
+def _is_loopback(address) -> bool:
+    """루프백 주소 여부, 소켓 파일 등 호스트가 없는 주소도 포함"""
+    if not isinstance(address, tuple):
+        return True
+    host = address[0]
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _init_worker(templates):
+    """작업 프로세스 초기화"""
+    global _worker_templates
+    _worker_templates = templates
+
+
+def _worker_ping() -> int:
+    """작업 프로세스 준비 확인"""
+    return os.getpid()
+
+
+def _worker_search(name: str, shape: Tuple[int, int], names: Sequence[str]
+                   ) -> List[tuple]:
+    """공유 메모리의 회색조 스크린에서 탬플릿을 찾습니다"""
+    memory = _worker_memory.get(name)
+    if memory is None:
+        memory = _open_shared(name)
+        _worker_memory[name] = memory
+        while len(_worker_memory) > _MEMORY_CACHE:
+            _worker_memory.popitem(last=False)[1].close()
+    else:
+        _worker_memory.move_to_end(name)
+    screen_gray = Image(numpy.ndarray(shape, numpy.uint8, memory.buf))
+    results = []
+    for n in names:
+        found, loc, score = _worker_templates[n]._match(screen_gray)
+        results.append((n, bool(found), (loc.left, loc.top, loc.right, loc.bottom),
+                        float(score)))
+    del screen_gray
+    return results
+
+
+class MatchServer:
+    """여러 프로세스가 함께 쓰는 로컬 탬플릿 매칭 서버
+
+    탬플릿을 작업 프로세스 풀에 한 번만 올려 두고, :class:`MatchClient`
+    가 공유 메모리에 써 넣은 스크린을 받아 탐색합니다. 한 요청의
+    탬플릿은 작업 프로세스 수만큼 나누어 동시에 탐색하며, 여러
+    클라이언트의 요청이 같은 풀을 공유합니다.
+
+    :class:`TemplateLibrary` 를 넘기면 작업 프로세스는 경로만 받아 같은
+    파일을 메모리 매핑하므로 탬플릿 데이터가 복사되지 않습니다.
+
+    작업 프로세스마다 탬플릿 사본이 따로 있으므로 추적(``tracking``)
+    설정은 사용하지 않고 항상 ``screen_area`` 전체를 탐색합니다.
+
+    요청은 pickle 로 주고받으므로 인증 키 없이는 접속을 받지 않습니다.
+    ``authkey`` 를 주지 않으면 임의의 키를 만들며, 클라이언트에는
+    :attr:`authkey` 를 전달합니다. 루프백이 아닌 주소에서는 키를 직접
+    지정해야 합니다.
+
+    Args:
+        templates: :class:`TemplateLibrary`, :class:`TemplateSet` 또는
+            ``{이름: Template}``
+        workers: 작업 프로세스 수, 기본값 ``None`` 이면 CPU 수
+        address: 접속 주소, 기본값은 ``("127.0.0.1", 0)`` (빈 포트)
+        authkey: [선택] 접속 인증 키, 기본값은 임의의 32 바이트
+    """
+
+    __module__ = 'autowinpy'
+
+    def __init__(self, templates, workers: int=None,
+                 address: Tuple[str, int]=("127.0.0.1", 0), authkey: bytes=None):
+        """초기화"""
+        self._names: List[str] = list(templates)
+        if not isinstance(templates, TemplateLibrary):
+            templates = {name: templates[name] for name in self._names}
+        self._templates = templates
+        self._workers: int = workers or os.cpu_count() or 1
+        if authkey is None:
+            if not _is_loopback(address):
+                raise MatchServerError(
+                    "루프백이 아닌 주소에는 인증 키가 필요합니다. {}".format(address))
+            authkey = os.urandom(32)
+        self._bind = address
+        self._authkey: bytes = authkey
+        self._pool: ProcessPoolExecutor = None
+        self._listener: Listener = None
+        self._thread: threading.Thread = None
+        self._running: bool = False
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {"connections": 0, "requests": 0, "errors": 0}
+
+    def __enter__(self) -> 'MatchServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """(tuple) 클라이언트가 접속할 주소, 시작 전에는 ``None``"""
+        return self._listener.address if self._listener is not None else None
+
+    @property
+    def authkey(self) -> bytes:
+        """(bytes) 클라이언트가 접속할 때 쓸 인증 키"""
+        return self._authkey
+
+    @property
+    def workers(self) -> int:
+        """(int) 작업 프로세스 수"""
+        return self._workers
+
+    @property
+    def names(self) -> List[str]:
+        """(list) 탬플릿 이름 목록"""
+        return list(self._names)
+
+    @property
+    def running(self) -> bool:
+        """(bool) 실행 여부"""
+        return self._running
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """누적 접속 수(``connections``), 요청 수(``requests``),
+        실패한 요청 수(``errors``)
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def start(self) -> 'MatchServer':
+        """작업 프로세스를 준비하고 접속을 받기 시작합니다."""
+        if self._running:
+            return self
+        self._pool = ProcessPoolExecutor(
+            self._workers, mp_context=get_context("spawn"),
+            initializer=_init_worker, initargs=(self._templates,))
+        for future in [self._pool.submit(_worker_ping) for _ in range(self._workers)]:
+            future.result()
+        self._listener = Listener(self._bind, authkey=self._authkey)
+        self._running = True
+        self._thread = threading.Thread(target=self._accept, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """서버를 시작하고 :meth:`close` 할 때까지 기다립니다."""
+        self.start()
+        try:
+            while self._thread.is_alive():
+                self._thread.join(0.5)
+        finally:
+            self.close()
+
+    def close(self):
+        """접속을 닫고 작업 프로세스를 종료합니다."""
+        if not self._running:
+            return
+        self._running = False
+        try:
+            # accept() 대기를 깨우기 위한 접속
+            Client(self._listener.address, authkey=self._authkey).close()
+        except OSError:
+            pass
+        self._thread.join()
+        self._listener.close()
+        self._pool.shutdown(wait=True)
+
+    def _accept(self):
+        """접속 대기 스레드"""
+        while self._running:
+            try:
+                conn = self._listener.accept()
+            except (OSError, EOFError, AuthenticationError):
+                continue
+            if not self._running:
+                conn.close()
+                break
+            with self._lock:
+                self._stats["connections"] += 1
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        """클라이언트 하나의 요청을 차례로 처리합니다"""
+        with conn:
+            while self._running:
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError):
+                    break
+                try:
+                    reply = ("ok", self._search(*request))
+                except Exception as e:
+                    with self._lock:
+                        self._stats["errors"] += 1
+                    reply = ("error", "{}: {}".format(type(e).__name__, e))
+                with self._lock:
+                    self._stats["requests"] += 1
+                try:
+                    conn.send(reply)
+                except OSError:
+                    break
+
+    def _search(self, name: str, shape: Tuple[int, int], names: Sequence[str]=None
+                ) -> List[tuple]:
+        """탬플릿을 작업 프로세스 수만큼 나누어 탐색합니다"""
+        names = self._names if names is None else list(names)
+        unknown = [n for n in names if n not in self._templates]
+        if unknown:
+            raise MatchServerError("등록되지 않은 탬플릿입니다. {}".format(unknown))
+        if not names:
+            return []
+        chunks = min(self._workers, len(names))
+        bounds = [len(names) * i // chunks for i in range(chunks + 1)]
+        futures = [self._pool.submit(_worker_search, name, shape, names[a:b])
+                   for a, b in zip(bounds[:-1], bounds[1:])]
+        results: List[tuple] = []
+        for future in futures:
+            results += future.result()
+        return results
+
+
+class MatchClient:
+    """:class:`MatchServer` 에 스크린을 보내 탬플릿을 찾는 클라이언트
+
+    스크린은 회색조로 변환하면서 바로 공유 메모리에 써 넣으므로,
+    서버로는 공유 메모리 이름과 크기만 전달됩니다. 공유 메모리는
+    클라이언트가 만들어 재사용하고 :meth:`close` 에서 지웁니다.
+
+    Args:
+        address: :attr:`MatchServer.address`
+        authkey: 서버와 같은 인증 키 (:attr:`MatchServer.authkey`)
+    """
+
+    __module__ = 'autowinpy'
+
+    def __init__(self, address: Tuple[str, int], authkey: bytes):
+        """초기화"""
+        self._conn = Client(address, authkey=authkey)
+        self._memory: shared_memory.SharedMemory = None
+
+    def __enter__(self) -> 'MatchClient':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """접속을 닫고 공유 메모리를 지웁니다."""
+        self._conn.close()
+        self._release()
+
+    def _release(self):
+        """공유 메모리 해제"""
+        if self._memory is not None:
+            self._memory.close()
+            self._memory.unlink()
+            self._memory = None
+
+    def screen_search(self, screen: Image, names: Sequence[str]=None
+                      ) -> Dict[str, Tuple[bool, Rect, float]]:
+        """서버에서 스크린의 탬플릿을 찾습니다
+
+        Args:
+            screen: 탬플릿을 탐색할 이미지, 회색조도 가능
+            names: [선택] 찾을 탬플릿 이름, 기본값은 서버의 전체 탬플릿
+
+        Returns:
+            ``{이름: (탐색 성공 여부, 탐색 결과 영역, 매칭 점수)}``
+        """
+        height, width = screen.shape[:2]
+        if self._memory is None or self._memory.size < width * height:
+            # 기존 공유 메모리는 서버가 새 이름을 받으면서 정리됩니다.
+            self._release()
+            self._memory = shared_memory.SharedMemory(create=True, size=width * height)
+        gray = numpy.ndarray((height, width), numpy.uint8, self._memory.buf)
+        if screen.ndim == 2:
+            gray[...] = screen
+        else:
+            cv2.cvtColor(screen, cv2.COLOR_RGB2GRAY, dst=gray)
+        del gray
+        self._conn.send((self._memory.name, (height, width),
+                         None if names is None else list(names)))
+        status, payload = self._conn.recv()
+        if status != "ok":
+            raise MatchServerError(payload)
+        return {n: (found, Rect(*box), score) for n, found, box, score in payload}
@@ -0,0 +1,208 @@
+"""캡처-매칭 파이프라인 클래스
+"""
+from ._cls_gui import Gui
+from ._cls_template_set import TemplateSet
+from ..type import Image, Rect
+from collections import deque
+from time import perf_counter
+from typing import AsyncIterator, Deque, Dict, Iterator, Tuple
+import asyncio
+import threading
+
+PipelineResult = Tuple[int, Dict[str, Tuple[bool, Rect, float]]]
+
+
+class MatchPipeline:
+    """캡처와 매칭을 겹쳐 실행하는 파이프라인
+
+    생산자 스레드가 ``gui`` 에서 프레임을 계속 캡처해 크기가 정해진
+    버퍼에 넣고, 소비자는 가장 최근 프레임에서 탬플릿을 찾습니다.
+    소비자가 늦으면 오래된 프레임은 버려집니다. OpenCV는 GIL을
+    해제하므로 캡처와 매칭이 동시에 진행됩니다.
+
+    결과는 ``(프레임 번호, {이름: (탐색 성공 여부, 탐색 결과 영역,
+    매칭 점수)})`` 이며 ``for`` 또는 ``async for`` 로 받습니다.
+
+    ``gui`` 의 ``image_array()`` 가 ``StopIteration`` 을 내면(예:
+    :class:`FrameReplay` 재생 끝) 캡처를 정상 종료합니다. 다른 예외는
+    :meth:`next_result` 에서 다시 발생합니다.
+
+    ``async for`` 를 중간에 빠져나가면 비동기 생성기가 정리될 때까지
+    캡처 스레드가 남으므로, 바로 멈추려면 ``async with`` 로 감쌉니다::
+
+        async with MatchPipeline(gui, templates) as pipeline:
+            async for number, results in pipeline:
+                ...
+
+    Args:
+        gui: 캡처할 :class:`Gui`, ``image_array()`` 를 가진 객체면 됩니다.
+        templates: :class:`TemplateSet` 또는 ``{이름: Template}``
+        buffer_size: 프레임 버퍼 크기, 기본값 ``2``
+        interval: 캡처 최소 간격(초), 기본값 ``0``
+    """
+
+    __module__ = 'autowinpy'
+
+    def __init__(self, gui: Gui, templates, buffer_size: int=2, interval: float=0):
+        """초기화"""
+        if not isinstance(templates, TemplateSet):
+            templates = TemplateSet(templates)
+        self._gui: Gui = gui
+        self._templates: TemplateSet = templates
+        self._interval: float = interval
+        self._frames: Deque[Tuple[int, Image]] = deque(maxlen=max(1, buffer_size))
+        self._condition = threading.Condition()
+        self._thread: threading.Thread = None
+        self._running: bool = False
+        self._error: BaseException = None
+        self._started: float = None
+        self._captured: int = 0
+        self._dropped: int = 0
+        self._matched: int = 0
+
+    def __enter__(self) -> 'MatchPipeline':
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    async def __aenter__(self) -> 'MatchPipeline':
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await asyncio.get_running_loop().run_in_executor(None, self.stop)
+
+    @property
+    def running(self) -> bool:
+        """(bool) 캡처 스레드 실행 여부"""
+        return self._running
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """처리 통계 출력
+
+        Returns:
+            ``captured`` 캡처한 프레임 수,
+            ``dropped`` 매칭하지 못하고 버린 프레임 수,
+            ``matched`` 매칭한 프레임 수,
+            ``capture_fps`` 초당 캡처 수,
+            ``match_fps`` 초당 매칭 수
+        """
+        with self._condition:
+            captured, dropped, matched = self._captured, self._dropped, self._matched
+        elapsed = perf_counter() - self._started if self._started else 0
+        return {
+            "captured": captured,
+            "dropped": dropped,
+            "matched": matched,
+            "capture_fps": captured / elapsed if elapsed else 0.0,
+            "match_fps": matched / elapsed if elapsed else 0.0,
+        }
+
+    def start(self):
+        """캡처 스레드를 시작합니다."""
+        if self._running:
+            return self
+        self._running = True
+        self._error = None
+        self._started = perf_counter()
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """캡처 스레드를 멈추고 남은 프레임을 버립니다."""
+        with self._condition:
+            self._running = False
+            self._frames.clear()
+            self._condition.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        return self
+
+    def _produce(self):
+        """생산자: 프레임을 캡처해 버퍼에 넣습니다."""
+        number = 0
+        try:
+            while self._running:
+                start = perf_counter()
+                frame: Image = self._gui.image_array()
+                with self._condition:
+                    if not self._running:
+                        break
+                    if len(self._frames) == self._frames.maxlen:
+                        self._dropped += 1
+                    self._frames.append((number, frame))
+                    self._captured += 1
+                    self._condition.notify()
+                number += 1
+                wait = self._interval - (perf_counter() - start)
+                if wait > 0:
+                    with self._condition:
+                        self._condition.wait_for(lambda: not self._running, wait)
+        except StopIteration:
+            pass  # 원본의 끝
+        except BaseException as e:
+            self._error = e
+        finally:
+            with self._condition:
+                self._running = False
+                self._condition.notify_all()
+
+    def next_result(self, timeout: float=None) -> PipelineResult:
+        """가장 최근 프레임에서 탬플릿을 찾습니다.
+
+        Args:
+            timeout: 새 프레임을 기다릴 최대 시간(초), 기본값 ``None``
+                (계속 대기)
+
+        Returns:
+            ``(프레임 번호, 탐색 결과)``, 파이프라인이 멈췄거나 시간이
+            초과되면 ``None``
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._frames or not self._running, timeout)
+            if not self._frames:
+                if self._error is not None:
+                    error, self._error = self._error, None
+                    raise error
+                return None
+            number, frame = self._frames.pop()
+            self._dropped += len(self._frames)
+            self._frames.clear()
+        results = self._templates.screen_search(frame)
+        with self._condition:
+            self._matched += 1
+        return number, results
+
+    def __iter__(self) -> Iterator[PipelineResult]:
+        """파이프라인이 멈출 때까지 결과를 순회합니다. 순회를 끝내면
+        캡처 스레드도 멈춥니다."""
+        self.start()
+        try:
+            while True:
+                result = self.next_result()
+                if result is None:
+                    return
+                yield result
+        finally:
+            self.stop()
+
+    async def __aiter__(self) -> AsyncIterator[PipelineResult]:
+        """``async for`` 로 결과를 순회합니다. 매칭은 실행기 스레드에서
+        진행되므로 이벤트 루프를 막지 않습니다. 생성기가 닫히면(끝까지
+        순회하거나 ``aclose()``) 캡처 스레드도 멈춥니다."""
+        self.start()
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                result = await loop.run_in_executor(None, self.next_result)
+                if result is None:
+                    return
+                yield result
+        finally:
+            self.stop()
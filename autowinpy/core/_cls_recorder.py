@@ -0,0 +1,433 @@
+"""프레임 녹화/재생 클래스
+"""
+from ..type import Image, Rect
+from time import monotonic, perf_counter, sleep, time
+from typing import Iterator, List, Tuple
+import os
+import struct
+import threading
+import zlib
+import numpy
+
+_MAGIC = b"AWPREC1\0"
+# 파일 머리: 매직, 녹화 시작 시각(유닉스 시간)
+_HEADER = struct.Struct("<8sd")
+# 프레임 머리: 시각(초), 너비, 높이, 채널 수, 종류, 압축 데이터 길이
+_RECORD = struct.Struct("<dIIBBI")
+# 변경 영역: x, y, 너비, 높이
+_BOX = struct.Struct("<IIII")
+# 파일 꼬리: 매직, 색인 레코드 위치
+_TAIL = struct.Struct("<8sQ")
+_TAIL_MAGIC = b"AWPRIDX\0"
+
+_KEY = 0    # 전체 프레임
+_DELTA = 1  # 직전 프레임에서 바뀐 영역
+_INDEX = 2  # 색인 (닫을 때 기록)
+
+
+class RecordingError(Exception):
+    """녹화 파일 오류 처리"""
+
+    def __init__(self, message: str):
+        """초기화"""
+        self.message: str = message
+
+    def __str__(self) -> str:
+        """메시지 전달"""
+        return self.message
+
+
+class ReplayEnd(StopIteration, EOFError):
+    """녹화 재생의 끝, :meth:`FrameReplay.image_array` 가 냅니다
+
+    :class:`MatchPipeline` 은 ``StopIteration`` 을 원본의 끝으로
+    처리합니다. 이전처럼 ``EOFError`` 로도 받을 수 있습니다.
+    """
+
+    __module__ = 'autowinpy'
+
+
+def _changed_box(frame: numpy.ndarray, previous: numpy.ndarray
+                 ) -> Tuple[int, int, int, int]:
+    """두 프레임이 다른 영역의 경계 사각형 (x, y, 너비, 높이)"""
+    height = frame.shape[0]
+    diff = numpy.bitwise_xor(frame, previous).reshape(height, -1)
+    rows = numpy.flatnonzero(diff.any(axis=1))
+    if not rows.size:
+        return 0, 0, 0, 0
+    top, bottom = int(rows[0]), int(rows[-1]) + 1
+    band = diff[top:bottom].reshape((bottom - top, frame.shape[1], -1))
+    cols = numpy.flatnonzero(band.any(axis=(0, 2)))
+    left, right = int(cols[0]), int(cols[-1]) + 1
+    return left, top, right - left, bottom - top
+
+
+class FrameRecorder:
+    """캡처한 프레임을 압축해 파일 끝에 이어 쓰는 녹화 클래스
+
+    각 프레임은 직전 프레임과 달라진 영역(경계 사각형)만 ``zlib`` 으로
+    압축해 무손실로 저장하므로, 화면 일부만 바뀌는 경우 크기와 기록
+    시간이 모두 작습니다.
+    ``keyframe_interval`` 프레임마다, 그리고 크기가 바뀔 때 전체
+    프레임을 저장해 임의 접근 비용을 제한합니다.
+
+    프레임은 기록 즉시 파일에 추가되며, :meth:`close` 에서 시각
+    색인을 덧붙입니다. 색인이 없는 파일(비정상 종료)도
+    :class:`FrameReplay` 로 읽을 수 있습니다.
+
+    Args:
+        path: 녹화 파일 경로, 이미 있으면 덮어씁니다.
+        keyframe_interval: 전체 프레임 간격, 기본값 ``30``
+        level: ``zlib`` 압축 수준(1-9), 기본값 ``1``
+    """
+
+    __module__ = 'autowinpy'
+
+    def __init__(self, path: str, keyframe_interval: int=30, level: int=1):
+        """초기화"""
+        if keyframe_interval < 1:
+            raise RecordingError("전체 프레임 간격은 1 이상입니다.")
+        self._path: str = path
+        self._keyframe_interval: int = keyframe_interval
+        self._level: int = level
+        self._file = open(path, "wb")
+        self._file.write(_HEADER.pack(_MAGIC, time()))
+        self._started: float = monotonic()
+        self._previous: numpy.ndarray = None
+        self._since_key: int = 0
+        self._timestamps: List[float] = []
+        self._offsets: List[int] = []
+        self._kinds: List[int] = []
+        self._bytes: int = 0
+        self._written: int = 0
+
+    def __enter__(self) -> 'FrameRecorder':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        """기록한 프레임 수"""
+        return len(self._timestamps)
+
+    @property
+    def path(self) -> str:
+        """(str) 녹화 파일 경로"""
+        return self._path
+
+    @property
+    def compression_ratio(self) -> float:
+        """(float) 원본 크기 대비 압축 크기 비율"""
+        if not self._bytes:
+            return 0.0
+        return self._written / self._bytes
+
+    def write(self, frame: numpy.ndarray, timestamp: float=None) -> float:
+        """프레임 하나를 기록합니다
+
+        Args:
+            frame: ``uint8`` 이미지
+            timestamp: [선택] 녹화 시작부터의 시각(초), 기본값은 현재 시각
+
+        Returns:
+            기록한 시각(초)
+        """
+        if self._file is None:
+            raise RecordingError("닫힌 녹화 파일입니다. {}".format(self._path))
+        if timestamp is None:
+            timestamp = monotonic() - self._started
+        frame = numpy.ascontiguousarray(frame, dtype=numpy.uint8)
+        height, width = frame.shape[:2]
+        channels = frame.shape[2] if frame.ndim == 3 else 0
+        previous = self._previous
+        if (previous is None or previous.shape != frame.shape
+                or self._since_key >= self._keyframe_interval):
+            kind = _KEY
+            payload = zlib.compress(frame, self._level)
+            self._since_key = 0
+        else:
+            kind = _DELTA
+            x, y, w, h = _changed_box(frame, previous)
+            payload = _BOX.pack(x, y, w, h) + zlib.compress(
+                numpy.ascontiguousarray(frame[y:y + h, x:x + w]), self._level)
+        self._offsets.append(self._file.tell())
+        self._file.write(_RECORD.pack(timestamp, width, height, channels, kind, len(payload)))
+        self._file.write(payload)
+        self._timestamps.append(timestamp)
+        self._kinds.append(kind)
+        # 호출한 쪽이 버퍼를 재사용할 수 있으므로 복사해 둡니다.
+        self._previous = frame.copy()
+        self._since_key += 1
+        self._bytes += frame.nbytes
+        self._written += _RECORD.size + len(payload)
+        return timestamp
+
+    def record(self, gui, duration: float=None, frames: int=None,
+               interval: float=0) -> int:
+        """:class:`Gui` 의 ``image_array()`` 를 반복 캡처해 기록합니다
+
+        Args:
+            gui: ``image_array()`` 를 가진 객체
+            duration: [선택] 녹화 시간(초)
+            frames: [선택] 녹화할 프레임 수
+            interval: 캡처 최소 간격(초), 기본값 ``0``
+
+        Returns:
+            기록한 프레임 수
+        """
+        if duration is None and frames is None:
+            raise RecordingError("duration 또는 frames 가 필요합니다.")
+        count, start = 0, perf_counter()
+        while ((frames is None or count < frames)
+               and (duration is None or perf_counter() - start < duration)):
+            captured = perf_counter()
+            self.write(gui.image_array())
+            count += 1
+            wait = interval - (perf_counter() - captured)
+            if wait > 0:
+                sleep(wait)
+        return count
+
+    def close(self):
+        """시각 색인을 덧붙이고 파일을 닫습니다."""
+        if self._file is None:
+            return
+        index = numpy.rec.fromarrays(
+            [self._timestamps, self._offsets, self._kinds],
+            formats="<f8,<u8,u1").tobytes()
+        payload = zlib.compress(index, self._level)
+        position = self._file.tell()
+        self._file.write(_RECORD.pack(0.0, 0, 0, 0, _INDEX, len(payload)))
+        self._file.write(payload)
+        self._file.write(_TAIL.pack(_TAIL_MAGIC, position))
+        self._file.close()
+        self._file = None
+
+
+class FrameReplay:
+    """녹화 파일을 라이브 :class:`Gui` 처럼 재생하는 클래스
+
+    :meth:`image_array` 는 호출할 때마다 다음 프레임을 출력하므로
+    :class:`MatchPipeline` 등에 :class:`Gui` 대신 넘길 수 있습니다.
+    기본값은 기다리지 않고 바로 출력(실시간보다 빠름)하며,
+    ``realtime`` 이면 녹화 시각에 맞춰 출력합니다. 끝에 다다르면
+    ``loop`` 가 아닌 경우 ``ReplayEnd`` (``StopIteration``,
+    ``EOFError`` 의 하위 클래스)를 냅니다.
+
+    :meth:`at` 과 :meth:`frame` 으로 시각이나 번호로 임의 접근할 수
+    있으며, 가장 가까운 앞쪽 전체 프레임부터 복원합니다. 파일 읽기와
+    복원은 잠금으로 보호되므로 여러 스레드에서 함께 사용할 수
+    있습니다.
+
+    Args:
+        path: 녹화 파일 경로
+        realtime: 녹화 시각에 맞춰 재생, 기본값 ``False``
+        loop: 끝에서 처음으로 돌아가 반복, 기본값 ``False``
+    """
+
+    __module__ = 'autowinpy'
+
+    def __init__(self, path: str, realtime: bool=False, loop: bool=False):
+        """초기화"""
+        self._path: str = path
+        self._realtime: bool = realtime
+        self._loop: bool = loop
+        self._lock = threading.Lock()
+        self._file = open(path, "rb")
+        try:
+            magic, self._wall_start = _HEADER.unpack(self._file.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise RecordingError("녹화 파일이 아닙니다. {}".format(path))
+            timestamps, offsets, kinds = self._read_index()
+        except (struct.error, zlib.error) as e:
+            self._file.close()
+            raise RecordingError("녹화 파일이 손상되었습니다. {}".format(path)) from e
+        except BaseException:
+            self._file.close()
+            raise
+        self._timestamps: numpy.ndarray = timestamps
+        self._offsets: numpy.ndarray = offsets
+        self._keyframes: numpy.ndarray = numpy.flatnonzero(kinds == _KEY)
+        self._cursor: int = 0
+        self._cached: Tuple[int, numpy.ndarray] = (-1, None)
+        self._clock: float = None
+
+    def __enter__(self) -> 'FrameReplay':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        """프레임 수"""
+        return len(self._timestamps)
+
+    def __iter__(self) -> Iterator[Tuple[float, Image]]:
+        """처음부터 ``(시각, 프레임)`` 을 차례로 출력합니다"""
+        for index in range(len(self)):
+            yield float(self._timestamps[index]), self.frame(index)
+
+    def _read_index(self) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """꼬리의 색인을 읽고, 없으면 프레임 머리를 차례로 훑습니다"""
+        size = os.fstat(self._file.fileno()).st_size
+        if size >= _HEADER.size + _TAIL.size:
+            self._file.seek(size - _TAIL.size)
+            magic, position = _TAIL.unpack(self._file.read(_TAIL.size))
+            if (magic == _TAIL_MAGIC
+                    and _HEADER.size <= position <= size - _TAIL.size - _RECORD.size):
+                self._file.seek(position)
+                *_, length = _RECORD.unpack(self._file.read(_RECORD.size))
+                index = numpy.frombuffer(
+                    zlib.decompress(self._file.read(length)),
+                    dtype=numpy.dtype([("t", "<f8"), ("offset", "<u8"), ("kind", "u1")]))
+                return index["t"].copy(), index["offset"].copy(), index["kind"].copy()
+        timestamps, offsets, kinds = [], [], []
+        position = _HEADER.size
+        self._file.seek(position)
+        while position + _RECORD.size <= size:
+            header = self._file.read(_RECORD.size)
+            timestamp, _, _, _, kind, length = _RECORD.unpack(header)
+            if kind == _INDEX or position + _RECORD.size + length > size:
+                break  # 색인 또는 기록 중 잘린 프레임
+            timestamps.append(timestamp)
+            offsets.append(position)
+            kinds.append(kind)
+            position += _RECORD.size + length
+            self._file.seek(position)
+        return (numpy.asarray(timestamps, dtype=numpy.float64),
+                numpy.asarray(offsets, dtype=numpy.uint64),
+                numpy.asarray(kinds, dtype=numpy.uint8))
+
+    @property
+    def path(self) -> str:
+        """(str) 녹화 파일 경로"""
+        return self._path
+
+    @property
+    def timestamps(self) -> numpy.ndarray:
+        """녹화 시작부터의 프레임 시각(초) 배열"""
+        return self._timestamps
+
+    @property
+    def duration(self) -> float:
+        """(float) 첫 프레임부터 마지막 프레임까지의 시간(초)"""
+        if not len(self):
+            return 0.0
+        return float(self._timestamps[-1] - self._timestamps[0])
+
+    @property
+    def position(self) -> int:
+        """(int) :meth:`image_array` 가 다음에 출력할 프레임 번호"""
+        return self._cursor
+
+    @property
+    def name(self) -> str:
+        """(str) 녹화 파일 이름, :attr:`Gui.name` 대응"""
+        return os.path.basename(self._path)
+
+    @property
+    def hwnd(self) -> int:
+        """(int) 항상 ``0``, :attr:`Gui.hwnd` 대응"""
+        return 0
+
+    @property
+    def rect(self) -> Rect:
+        """현재 프레임 크기의 :class:`Rect <autowinpy.type.Rect>`,
+        프레임이 없으면 ``Rect(0, 0, 0, 0)``"""
+        if not len(self):
+            return Rect(0, 0, 0, 0)
+        with self._lock:
+            _, width, height, _, _, _ = self._header(min(self._cursor, len(self) - 1))
+        return Rect(0, 0, width, height)
+
+    def _header(self, index: int) -> tuple:
+        """프레임 머리 읽기 (잠금 안에서 호출)"""
+        self._file.seek(int(self._offsets[index]))
+        return _RECORD.unpack(self._file.read(_RECORD.size))
+
+    def _decode(self, index: int, previous: numpy.ndarray) -> numpy.ndarray:
+        """프레임 하나를 복원합니다 (델타는 ``previous`` 를 고쳐 씁니다)"""
+        _, width, height, channels, kind, length = self._header(index)
+        payload = self._file.read(length)
+        if kind == _KEY:
+            shape = (height, width, channels) if channels else (height, width)
+            data = numpy.frombuffer(zlib.decompress(payload), numpy.uint8)
+            return data.reshape(shape).copy()
+        x, y, w, h = _BOX.unpack_from(payload)
+        if w and h:
+            data = numpy.frombuffer(zlib.decompress(payload[_BOX.size:]), numpy.uint8)
+            previous[y:y + h, x:x + w] = data.reshape((h, w) + previous.shape[2:])
+        return previous
+
+    def frame(self, index: int) -> Image:
+        """번호로 프레임을 출력합니다
+
+        직전에 출력한 프레임 다음이면 델타 하나만 복원합니다.
+
+        Args:
+            index: 프레임 번호, 음수는 끝에서부터
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("프레임 번호가 범위를 벗어났습니다. {}".format(index))
+        key = int(self._keyframes[numpy.searchsorted(self._keyframes, index, "right") - 1])
+        with self._lock:
+            cached_index, cached = self._cached
+            if key <= cached_index <= index:
+                start, frame = cached_index + 1, cached
+            else:
+                start, frame = key, None
+            for i in range(start, index + 1):
+                frame = self._decode(i, frame)
+            self._cached = (index, frame)
+            return Image(frame.copy())
+
+    def index_at(self, timestamp: float) -> int:
+        """시각 이전(같은 시각 포함)의 마지막 프레임 번호
+
+        Args:
+            timestamp: 녹화 시작부터의 시각(초)
+        """
+        index = int(numpy.searchsorted(self._timestamps, timestamp, "right")) - 1
+        return max(index, 0)
+
+    def at(self, timestamp: float) -> Image:
+        """시각에 화면에 있던 프레임을 출력합니다
+
+        Args:
+            timestamp: 녹화 시작부터의 시각(초)
+        """
+        return self.frame(self.index_at(timestamp))
+
+    def seek(self, timestamp: float):
+        """:meth:`image_array` 가 시각의 프레임부터 출력하도록 옮깁니다."""
+        self._cursor = self.index_at(timestamp)
+        self._clock = None
+        return self
+
+    def image_array(self) -> Image:
+        """다음 프레임 출력, :meth:`Gui.image_array` 대응"""
+        wait = 0.0
+        with self._lock:
+            if self._cursor >= len(self):
+                if not self._loop or not len(self):
+                    raise ReplayEnd("녹화의 끝입니다. {}".format(self._path))
+                self._cursor, self._clock = 0, None
+            index = self._cursor
+            self._cursor += 1
+            if self._realtime:
+                now = perf_counter()
+                if self._clock is None:
+                    self._clock = now - float(self._timestamps[index])
+                wait = self._clock + float(self._timestamps[index]) - now
+        if wait > 0:
+            sleep(wait)
+        return self.frame(index)
+
+    def close(self):
+        """파일을 닫습니다."""
+        with self._lock:
+            self._file.close()
+            self._cached = (-1, None)
@@ -0,0 +1,101 @@
+"""병렬 탬플릿 탐색 클래스
+"""
+from ._cls_template import Template
+from ._cls_template_set import TemplateSet
+from ..type import Image, Rect
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+import math
+import os
+
+
+class SearchExecutor:
+    """스레드 풀로 탬플릿 탐색을 나누어 실행하는 클래스
+
+    OpenCV 매칭은 GIL을 해제하므로 여러 탬플릿, 또는 큰 스크린의
+    여러 띠 영역을 동시에 탐색할 수 있습니다. 결과 순서는 작업
+    분배와 관계없이 항상 같습니다. 같은 탬플릿을 여러 스레드가
+    탐색해도 매칭 준비 캐시는 한 번만 만들고, 추적을 사용하는
+    탬플릿의 탐색은 하나씩 실행합니다.
+
+    Args:
+        workers: 작업 스레드 수, 기본값 ``None`` 이면 CPU 수
+    """
+
+    __module__ = 'autowinpy'
+
+    def __init__(self, workers: int=None):
+        """초기화"""
+        self._workers: int = workers or os.cpu_count() or 1
+        self._pool = ThreadPoolExecutor(max_workers=self._workers)
+
+    def __enter__(self) -> 'SearchExecutor':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def workers(self) -> int:
+        """(int) 작업 스레드 수"""
+        return self._workers
+
+    def close(self):
+        """스레드 풀을 종료합니다."""
+        self._pool.shutdown(wait=True)
+
+    def screen_search(self, templates, screen: Image
+                      ) -> Dict[str, Tuple[bool, Rect, float]]:
+        """스크린에서 모든 탬플릿을 나누어 찾습니다
+
+        스크린의 회색조 변환은 한 번만 수행합니다.
+
+        Args:
+            templates: :class:`TemplateSet` 또는 ``{이름: Template}``
+            screen: 탬플릿을 탐색할 이미지
+
+        Returns:
+            등록 순서의 ``{이름: (탐색 성공 여부, 탐색 결과 영역, 매칭 점수)}``
+        """
+        if not isinstance(templates, TemplateSet):
+            templates = TemplateSet(templates)
+        screen_gray: Image = screen.grayscale
+        futures = [
+            (name, self._pool.submit(templates[name]._search, screen_gray, True))
+            for name in templates]
+        return {name: future.result() for name, future in futures}
+
+    def tile_search(self, template: Template, screen: Image, tiles: int=None
+                    ) -> Tuple[bool, Rect, float]:
+        """하나의 탬플릿을 스크린의 띠 영역으로 나누어 찾습니다
+
+        ``screen_area`` 영역을 가로 띠로 나누고, 경계의 결과를 놓치지
+        않도록 띠를 탬플릿 높이만큼 겹칩니다. 추적 설정은 사용하지
+        않습니다. 점수가 유한하지 않은 띠의 결과는 비교에서 제외합니다.
+
+        Args:
+            template: 탐색할 탬플릿
+            screen: 탬플릿을 탐색할 이미지
+            tiles: 띠 개수, 기본값 ``None`` 이면 작업 스레드 수
+
+        Returns:
+            (``bool``) 탐색 성공 여부,
+            (:class:`type.Rect`) 탐색 결과 영역,
+            (``float``) 매칭 점수
+        """
+        region = template._search_region(*screen.size())
+        area = screen[region.top:region.bottom, region.left:region.right]
+        screen_gray: Image = area.grayscale
+        th = template._template_size()[1]
+        # 점수 지도의 행을 나누고, 띠마다 탬플릿 높이만큼 덧붙임
+        rows = region.height - th + 1
+        tiles = max(1, min(tiles or self._workers, rows))
+        bounds = [rows * i // tiles for i in range(tiles + 1)]
+        futures: List = []
+        for top, bottom in zip(bounds[:-1], bounds[1:]):
+            band = screen_gray[top:bottom + th - 1]
+            offset = (region.left, region.top + top)
+            futures.append(self._pool.submit(template._match, band, offset))
+        results = [future.result() for future in futures]
+        finite = [result for result in results if math.isfinite(result[2])]
+        return max(finite or results, key=lambda result: result[2])
@@ -1,7 +1,9 @@
 """템플릿 클래스
 """
+from .._profiler import profiler
 from ..type import Image, Rect
-from typing import List, Tuple
+from typing import Dict, List, Sequence, Tuple
+import threading
 import cv2
 import numpy
 
@@ -17,19 +19,77 @@ class TemplateError(Exception):
         return self.message
 
 
+def _suppress(xs: numpy.ndarray, ys: numpy.ndarray, scores: numpy.ndarray,
+              width: int, height: int, overlap: float, max_count: int=None
+              ) -> numpy.ndarray:
+    """같은 크기 상자들의 비최대 억제(NMS)
+
+    점수가 높은 상자부터 선택하고, 선택한 상자와의 IoU가 ``overlap``
+    을 넘는 나머지 상자를 한 번에 제거합니다. 반복은 선택된 상자
+    수만큼만 수행됩니다.
+
+    Args:
+        xs: 상자 왼쪽 좌표 배열
+        ys: 상자 위쪽 좌표 배열
+        scores: 상자 점수 배열
+        width: 상자 너비
+        height: 상자 높이
+        overlap: 허용할 최대 IoU
+        max_count: [선택] 최대 선택 수
+
+    Returns:
+        선택된 상자 인덱스 배열 (점수 내림차순)
+    """
+    order = numpy.argsort(-scores, kind="stable")
+    area = width * height
+    keep: List[int] = []
+    while order.size and (max_count is None or len(keep) < max_count):
+        i, rest = order[0], order[1:]
+        keep.append(i)
+        iw = numpy.clip(width - numpy.abs(xs[rest] - xs[i]), 0, None)
+        ih = numpy.clip(height - numpy.abs(ys[rest] - ys[i]), 0, None)
+        inter = iw * ih
+        order = rest[inter <= overlap * (2 * area - inter)]
+    return numpy.asarray(keep, dtype=numpy.intp)
+
+
+def _max_loc(match_data: numpy.ndarray) -> Tuple[float, Tuple[int, int]]:
+    """점수 지도의 최댓값과 위치
+
+    마스크 매칭은 평탄한 영역에서 NaN/inf 를 내므로 ``-1`` 로 바꾼 뒤
+    찾습니다. ``match_data`` 를 고쳐 씁니다.
+    """
+    match_data[~numpy.isfinite(match_data)] = -1
+    _, maxVal, _, maxLoc = cv2.minMaxLoc(match_data)
+    return maxVal, maxLoc
+
+
 class Template:
     """이미지 서칭을 위한 탬플릿 클래스
 
     Keyword Args:
         path (str): 파일 경로
+        image (type.Image): [선택] 이미 읽어 둔 원본 이미지, 지정하면
+            ``path`` 를 읽지 않고 이름으로만 사용합니다.
         matched_width (int): 이미지 서칭에 사용할 너비, 기본값 ``None``
         matched_height (int): 이미지 서칭에 사용할 높이, 기본값 ``None``
         threshold (float): 이미지 서치 성공을 판단할 문턱값, 기본값 ``0.8``
         screen_area ([int, int, int, int]):
-            스크린 매칭 영역, 기본값 ``[0, 0, 100, 100]``
-
-    Todo:
-        [새로운 키워드] ``mask_color``: 특정 색상을 마스크 키로 사용
+            스크린 매칭 영역, 좌, 상, 우, 하 순서의 백분율(%),
+            기본값 ``[0, 0, 100, 100]``
+        mask_threshold (int): 투명도가 이 값 이상인 픽셀만 매칭에 사용,
+            기본값 ``255``
+        mask_color ((int, int, int)): 마스크 키로 사용할 BGR 색상,
+            기본값 ``None``
+        mask_erode (int): 마스크 가장자리를 깎아낼 픽셀 수, 기본값 ``0``
+        pyramid_levels (int): 피라미드 매칭 단계 수, ``n`` 단계는
+            ``2**n`` 배 축소한 스크린에서 후보를 찾습니다.
+            기본값 ``0`` (사용 안 함)
+        pyramid_radius (int): 후보 주변을 원본 해상도로 재검증할 반경(px),
+            기본값 ``None`` 이면 축소 배율
+        pyramid_candidates (int): 재검증할 축소 단계 후보 수, 기본값 ``3``
+        tracking (bool): 직전 탐색 위치 주변을 먼저 탐색, 기본값 ``False``
+        tracking_radius (int): 직전 위치 주변 탐색 반경(px), 기본값 ``16``
     """
     
     __module__ = 'autowinpy'
@@ -37,26 +97,55 @@ class Template:
     def __init__(self, **args):
         """탬플릿 초기화"""
         self._path:str = args.get("path", None)
-        self._matched_width:int = args.get("matched_width", None)
-        self._matched_height:int = args.get("matched_height", None)
-        self._threshold:float = args.get("threshold", 0.8)
-        self._screen_area:List[int, int, int, int] = args.get("screen_area", [0,0,100,100])
-        self._image: Image = Image(cv2.imread(self._path, cv2.IMREAD_UNCHANGED))
-        # variables validation
-        _w, _h = self._image.size()
         if self._path is None:
             raise TemplateError("필수 인수가 없습니다. path")
+        image = args.get("image", None)
+        if image is None:
+            image = cv2.imread(self._path, cv2.IMREAD_UNCHANGED)
+            if image is None:
+                raise TemplateError("이미지를 읽을 수 없습니다. {}".format(self._path))
+        self._image: Image = Image(image)
+        _w, _h = self._image.size()
         if _h < 20 or _w < 20:
             raise TemplateError("템플릿 이미지의 크기가 너무 작습니다")
-        if self._threshold > 1 or self._threshold < 0:
-            raise TemplateError("문턱값은 0에서 1사이입니다.")
-        if min(self._screen_area) < 0 or max(self._screen_area) > 100:
-            raise TemplateError("스크린 영역은 0(%)에서 100(%)사이 값을 가집니다.")
-        # variables override
-        if self._matched_width and self._matched_height is None:
-            self._matched_height = int(self._matched_width * _w / _h)
-        if self._matched_height and self._matched_width is None:
-            self._matched_width = int(self._matched_height * _h / _w)
+        # 매칭 준비 데이터 캐시: {(매칭 사이즈, 매칭 방법, 단계): (회색조, 마스크)}
+        self._prepared: Dict[tuple, Tuple[Image, Image]] = {}
+        # 여러 스레드가 같은 탬플릿을 탐색할 때 캐시와 추적 상태 보호
+        self._prepare_lock = threading.RLock()
+        self._tracking_lock = threading.Lock()
+        # default values
+        self._matched_width:int = None
+        self._matched_height:int = None
+        self._threshold:float = 0.8
+        self._screen_area:List[int, int, int, int] = [0,0,100,100]
+        self._mask_threshold:int = 255
+        self._mask_color:Tuple[int, int, int] = None
+        self._mask_erode:int = 0
+        self._pyramid_levels:int = 0
+        self._pyramid_radius:int = None
+        self._pyramid_candidates:int = 3
+        self._tracking:bool = False
+        self._tracking_radius:int = 16
+        # 추적 상태: 직전 탐색 성공 위치와 적중/실패 횟수
+        self._last_loc: Rect = None
+        self._tracking_hits: int = 0
+        self._tracking_misses: int = 0
+        # configure() 로 설정을 바꿀 때마다 증가 (결과 캐시 무효화용)
+        self._revision: int = 0
+        # variables validation
+        self.configure(**args)
+
+    def __getstate__(self) -> dict:
+        """pickle 상태, 잠금은 제외"""
+        state = dict(self.__dict__)
+        del state["_prepare_lock"], state["_tracking_lock"]
+        return state
+
+    def __setstate__(self, state: dict):
+        """pickle 상태 복원"""
+        self.__dict__.update(state)
+        self._prepare_lock = threading.RLock()
+        self._tracking_lock = threading.Lock()
 
     @property
     def origin_image(self) -> Image:
@@ -68,14 +157,35 @@ class Template:
         """매칭 사이즈 출력"""
         return self._matched_width, self._matched_height
 
+    @property
+    def tracking_stats(self) -> Dict[str, int]:
+        """추적 적중(``hit``)과 실패(``miss``) 횟수 출력"""
+        return {"hit": self._tracking_hits, "miss": self._tracking_misses}
+
+    def reset_tracking(self):
+        """직전 탐색 위치와 추적 횟수를 초기화합니다."""
+        self._last_loc = None
+        self._tracking_hits = 0
+        self._tracking_misses = 0
+
     def configure(self, **args) -> dict:
         """현재 설정을 변경하거나 출력합니다.
 
+        너비와 높이 중 하나만 지정하면 나머지는 원본 비율로 채웁니다.
+
         Keyword Args:
             matched_width (int): 이미지 서칭에 사용할 너비
             matched_height (int): 이미지 서칭에 사용할 높이
             threshold (float): 이미지 서치 성공을 판단할 문턱값
             screen_area ([int, int, int, int]): 스크린 매칭 영역
+            mask_threshold (int): 마스크 투명도 문턱값
+            mask_color ((int, int, int)): 마스크 키 BGR 색상
+            mask_erode (int): 마스크 침식 크기
+            pyramid_levels (int): 피라미드 매칭 단계 수
+            pyramid_radius (int): 피라미드 재검증 반경
+            pyramid_candidates (int): 피라미드 후보 수
+            tracking (bool): 직전 위치 추적 사용 여부
+            tracking_radius (int): 직전 위치 주변 탐색 반경
 
         Returns:
             (dict) 현재 설정
@@ -84,47 +194,301 @@ class Template:
         _matched_height:int = args.get("matched_height", self._matched_height)
         _threshold:float = args.get("threshold", self._threshold)
         _screen_area:List[int, int, int, int] = args.get("screen_area", self._screen_area)
+        _mask_threshold:int = args.get("mask_threshold", self._mask_threshold)
+        _mask_color:Tuple[int, int, int] = args.get("mask_color", self._mask_color)
+        _mask_erode:int = args.get("mask_erode", self._mask_erode)
+        _pyramid_levels:int = args.get("pyramid_levels", self._pyramid_levels)
+        _pyramid_radius:int = args.get("pyramid_radius", self._pyramid_radius)
+        _pyramid_candidates:int = args.get("pyramid_candidates", self._pyramid_candidates)
+        _tracking:bool = args.get("tracking", self._tracking)
+        _tracking_radius:int = args.get("tracking_radius", self._tracking_radius)
+        # 너비나 높이 하나만 지정하면 원본 비율 유지
+        _w, _h = self._image.size()
+        if "matched_width" in args and "matched_height" not in args:
+            _matched_height = (None if _matched_width is None
+                               else max(1, int(round(_matched_width * _h / _w))))
+        elif "matched_height" in args and "matched_width" not in args:
+            _matched_width = (None if _matched_height is None
+                              else max(1, int(round(_matched_height * _w / _h))))
         if _threshold > 1 or _threshold < 0:
             raise TemplateError("문턱값은 0에서 1사이입니다.")
         if min(_screen_area) < 0 or max(_screen_area) > 100:
             raise TemplateError("스크린 영역은 0(%)에서 100(%)사이 값을 가집니다.")
+        if _mask_threshold > 255 or _mask_threshold < 0:
+            raise TemplateError("마스크 문턱값은 0에서 255사이입니다.")
+        if _mask_color is not None and len(_mask_color) != 3:
+            raise TemplateError("마스크 색상은 (B, G, R) 형식입니다.")
+        if _mask_erode < 0:
+            raise TemplateError("마스크 침식 크기는 0 이상입니다.")
+        if _pyramid_levels < 0:
+            raise TemplateError("피라미드 단계 수는 0 이상입니다.")
+        if _pyramid_radius is not None and _pyramid_radius < 0:
+            raise TemplateError("피라미드 재검증 반경은 0 이상입니다.")
+        if _pyramid_candidates < 1:
+            raise TemplateError("피라미드 후보 수는 1 이상입니다.")
+        if _tracking_radius < 0:
+            raise TemplateError("추적 반경은 0 이상입니다.")
+        if ((_matched_width, _matched_height) != self.match_size
+                or _mask_threshold != self._mask_threshold
+                or _mask_color != self._mask_color
+                or _mask_erode != self._mask_erode):
+            with self._prepare_lock:
+                self._prepared.clear()
+            self._last_loc = None
+        if not _tracking or _screen_area != self._screen_area:
+            self._last_loc = None
         self._matched_width = _matched_width
         self._matched_height = _matched_height
         self._threshold = _threshold
         self._screen_area = _screen_area
+        self._mask_threshold = _mask_threshold
+        self._mask_color = _mask_color
+        self._mask_erode = _mask_erode
+        self._pyramid_levels = _pyramid_levels
+        self._pyramid_radius = _pyramid_radius
+        self._pyramid_candidates = _pyramid_candidates
+        self._tracking = _tracking
+        self._tracking_radius = _tracking_radius
+        if args:
+            self._revision += 1
         return {
             "path": self._path,
             "matched_width": self._matched_width,
             "matched_height": self._matched_height,
             "threshold": self._threshold,
-            "screen_area": self._screen_area
+            "screen_area": self._screen_area,
+            "mask_threshold": self._mask_threshold,
+            "mask_color": self._mask_color,
+            "mask_erode": self._mask_erode,
+            "pyramid_levels": self._pyramid_levels,
+            "pyramid_radius": self._pyramid_radius,
+            "pyramid_candidates": self._pyramid_candidates,
+            "tracking": self._tracking,
+            "tracking_radius": self._tracking_radius,
         }
 
     def mask(self, dsize: Tuple[int, int]=None) -> Image:
         """마스크 이미지 출력
 
+        투명 채널 문턱값, ``mask_color`` 색상 키, ``mask_erode``
+        침식을 차례로 적용합니다. 모든 단계는 배열 단위로 처리됩니다.
+
         Args:
             dsize (width, height): [선택] 출력할 마스크의 너비와 높이
 
         Returns:
-            마스크 이미지, 이미지에 투명 채널이 없는 경우 ``None``
+            ``uint8`` 마스크 이미지, 투명 채널과 ``mask_color`` 가
+            모두 없거나 가려지는 픽셀이 없으면(불투명 PNG 등) ``None``
         """
-        if self._image.len_channels < 3:
-            return None  # is grayscale
-        mask_function = numpy.vectorize(
-            lambda x: 0 if x < 255 else 255, otypes=[numpy.uint8])
-        transparent_channel = self._image.channel(3)
-        mask = mask_function(transparent_channel)
-        if dsize is None:
-            return mask
-        dw, iw = dsize[0], self._image.width
-        method = cv2.INTER_AREA if dw < iw else cv2.INTER_LINEAR
-        mask = cv2.resize(mask, dsize, interpolation=method)
-        return mask
+        channels = self._image.len_channels
+        has_alpha = channels == 4
+        if not has_alpha and (self._mask_color is None or channels < 3):
+            return None  # no mask source
+        if has_alpha:
+            # alpha >= mask_threshold -> 255, else 0
+            _, mask = cv2.threshold(
+                self._image.channel(3), self._mask_threshold - 1, 255,
+                cv2.THRESH_BINARY)
+        else:
+            mask = numpy.full(self._image.shape[:2], 255, dtype=numpy.uint8)
+        if self._mask_color is not None:
+            color = numpy.asarray(self._mask_color, dtype=numpy.uint8)
+            keyed = cv2.inRange(self._image[:, :, :3], color, color)
+            mask = cv2.bitwise_and(mask, cv2.bitwise_not(keyed))
+        if self._mask_erode > 0:
+            kernel = numpy.ones((3, 3), dtype=numpy.uint8)
+            mask = cv2.erode(mask, kernel, iterations=self._mask_erode)
+        if mask.min() == 255:
+            return None  # 마스크 없는 매칭이 더 빠름
+        if dsize is not None:
+            dw, iw = dsize[0], self._image.width
+            method = cv2.INTER_AREA if dw < iw else cv2.INTER_LINEAR
+            mask = cv2.resize(mask, dsize, interpolation=method)
+        return Image(numpy.ascontiguousarray(mask, dtype=numpy.uint8))
+
+    def _prepare(self, method: int, level: int=0, dsize: Tuple[int, int]=None
+                 ) -> Tuple[Image, Image]:
+        """매칭에 사용할 회색조 탬플릿과 마스크를 준비합니다.
+
+        결과는 매칭 사이즈, 매칭 방법, 피라미드 단계를 키로 캐시되며,
+        :meth:`configure` 로 매칭 사이즈나 마스크 설정을 변경할 때만
+        다시 만듭니다.
+
+        Args:
+            method: OpenCV 매칭 방법
+            level: [선택] 피라미드 단계, ``cv2.pyrDown`` 적용 횟수
+            dsize (width, height): [선택] 탬플릿 크기,
+                기본값 ``None`` 이면 매칭 사이즈
+
+        Returns:
+            (``Image``) 회색조 탬플릿,
+            (``Image``) 마스크, 투명 채널이 없는 경우 ``None``
+        """
+        if dsize is None and self._matched_width is not None:
+            dsize = self.match_size
+        key = (dsize, method, level)
+        prepared = self._prepared.get(key)
+        if prepared is not None:
+            return prepared
+        with self._prepare_lock:
+            prepared = self._prepared.get(key)
+            if prepared is None:
+                prepared = self._build_prepared(key, method, level, dsize)
+        return prepared
+
+    def _build_prepared(self, key: tuple, method: int, level: int,
+                        dsize: Tuple[int, int]) -> Tuple[Image, Image]:
+        """:meth:`_prepare` 의 캐시 항목을 만듭니다."""
+        t = profiler.clock()
+        if level > 0:
+            template_gray, mask = self._prepare(method, level - 1, dsize)
+            template_gray = Image(cv2.pyrDown(template_gray))
+            if mask is not None:
+                mask = Image(cv2.pyrDown(mask))
+        else:
+            template_gray: Image = self._image.grayscale
+            if dsize is None:
+                mask: Image = self.mask()
+            else:
+                template_gray = template_gray.size(*dsize)
+                mask: Image = self.mask(dsize)
+        prepared = (template_gray, mask)
+        self._prepared[key] = prepared
+        profiler.lap("template.prepare", self._path, t)
+        return prepared
+
+    def _template_size(self, dsize: Tuple[int, int]=None) -> Tuple[int, int]:
+        """매칭에 사용하는 탬플릿 크기
+
+        Args:
+            dsize (width, height): [선택] 탬플릿 크기
+
+        Returns:
+            (``int, int``) 너비, 높이
+        """
+        return self._prepare(cv2.TM_CCOEFF_NORMED, dsize=dsize)[0].size()
+
+    def _search_region(self, width: int, height: int, dsize: Tuple[int, int]=None
+                       ) -> Rect:
+        """``screen_area`` 를 스크린 좌표 영역으로 변환합니다.
+
+        영역이 탬플릿보다 작으면 스크린 안에서 탬플릿 크기까지
+        넓힙니다.
+
+        Args:
+            width: 스크린 너비
+            height: 스크린 높이
+            dsize (width, height): [선택] 탬플릿 크기
+
+        Returns:
+            :class:`type.Rect` 탐색 영역
+        """
+        tw, th = self._template_size(dsize)
+        x0, y0, x1, y1 = self._screen_area
+        left, right = int(width * x0 / 100), int(numpy.ceil(width * x1 / 100))
+        top, bottom = int(height * y0 / 100), int(numpy.ceil(height * y1 / 100))
+        if right - left < tw:
+            left = max(0, min(left, width - tw))
+            right = min(width, left + tw)
+        if bottom - top < th:
+            top = max(0, min(top, height - th))
+            bottom = min(height, top + th)
+        return Rect(left, top, right, bottom)
+
+    def _pyramid_search(self, screen_gray: Image, method: int,
+                        dsize: Tuple[int, int]=None
+                        ) -> Tuple[float, Tuple[int, int]]:
+        """축소 스크린에서 후보를 찾고 원본 해상도에서 재검증합니다.
+
+        축소한 탬플릿의 짧은 변이 8px 보다 작아지지 않도록 단계 수를
+        줄이며, 단계가 0이 되면 전체 탐색과 같습니다.
+
+        Args:
+            screen_gray: 회색조 스크린
+            method: OpenCV 매칭 방법
+            dsize (width, height): [선택] 탬플릿 크기
+
+        Returns:
+            (``float``) 최고 매칭 점수,
+            (``int, int``) 최고 점수 위치
+        """
+        template_gray, mask = self._prepare(method, dsize=dsize)
+        tw, th = template_gray.size()
+        sw, sh = screen_gray.size()
+        level = self._pyramid_levels
+        while level > 0 and min(tw, th) >> level < 8:
+            level -= 1
+        if level == 0:
+            return _max_loc(cv2.matchTemplate(screen_gray, template_gray, method, mask=mask))
+        scale = 2 ** level
+        radius = scale if self._pyramid_radius is None else self._pyramid_radius
+        coarse_template, coarse_mask = self._prepare(method, level, dsize)
+        coarse_screen = screen_gray
+        for _ in range(level):
+            coarse_screen = cv2.pyrDown(coarse_screen)
+        coarse_data = cv2.matchTemplate(
+            coarse_screen, coarse_template, method, mask=coarse_mask)
+        coarse_data[~numpy.isfinite(coarse_data)] = -1
+        # 같은 대상이 여러 후보가 되지 않도록 억제할 반경
+        cw, ch = coarse_template.shape[1] // 2, coarse_template.shape[0] // 2
+        best: Tuple[float, Tuple[int, int]] = (-1.0, (0, 0))
+        for _ in range(self._pyramid_candidates):
+            _, coarse_val, _, (cx, cy) = cv2.minMaxLoc(coarse_data)
+            if not coarse_val > -1:
+                break
+            x0, y0 = max(0, cx * scale - radius), max(0, cy * scale - radius)
+            x1 = min(sw, cx * scale + tw + radius)
+            y1 = min(sh, cy * scale + th + radius)
+            if x1 - x0 >= tw and y1 - y0 >= th:
+                maxVal, (mx, my) = _max_loc(cv2.matchTemplate(
+                    screen_gray[y0:y1, x0:x1], template_gray, method, mask=mask))
+                if maxVal > best[0]:
+                    best = (maxVal, (mx + x0, my + y0))
+            coarse_data[max(0, cy - ch):cy + ch + 1, max(0, cx - cw):cx + cw + 1] = -2
+        return best
+
+    def _match(self, screen_gray: Image, offset: Tuple[int, int]=None,
+               dsize: Tuple[int, int]=None) -> Tuple[bool, Rect, float]:
+        """회색조 스크린에서 탬플릿을 찾습니다
+
+        Args:
+            screen_gray: 회색조로 변환된 스크린
+            offset: [선택] ``screen_gray`` 가 이미 탐색 영역으로 잘린
+                경우 그 시작 좌표. 기본값 ``None`` 이면 ``screen_area``
+                로 직접 잘라냅니다.
+            dsize (width, height): [선택] 탬플릿 크기,
+                기본값 ``None`` 이면 매칭 사이즈
+
+        Returns:
+            (``bool``) 탐색 성공 여부,
+            (:class:`type.Rect`) 스크린 좌표 기준 탐색 결과 영역,
+            (``float``) 매칭 점수
+        """
+        if offset is None:
+            region = self._search_region(*screen_gray.size(), dsize)
+            screen_gray = screen_gray[region.top:region.bottom, region.left:region.right]
+            offset = region.start
+        method = cv2.TM_CCOEFF_NORMED
+        template_gray, mask = self._prepare(method, dsize=dsize)
+        t = profiler.clock()
+        if self._pyramid_levels > 0:
+            maxVal, maxLoc = self._pyramid_search(screen_gray, method, dsize)
+            profiler.lap("template.pyramid", self._path, t)
+        else:
+            match_data = cv2.matchTemplate(screen_gray, template_gray, method, mask=mask)
+            t = profiler.lap("template.match", self._path, t)
+            maxVal, maxLoc = _max_loc(match_data)
+            profiler.lap("template.min_max_loc", self._path, t)
+        loc = Rect().xywh(
+            maxLoc[0] + offset[0], maxLoc[1] + offset[1], *template_gray.size())
+        return maxVal > self._threshold, loc, maxVal
 
     def screen_search(self, screen: Image) -> Tuple[bool, Rect]:
         """스크린에서 탬플릿을 찾습니다
 
+        ``screen_area`` 영역만 잘라서(복사 없이) 탐색하며, 결과 영역은
+        스크린 좌표로 변환됩니다.
+
         Args:
             screen: 탬플릿을 탐색할 이미지
         
@@ -132,21 +496,156 @@ class Template:
             (``bool``) 탐색 성공 여부,
             (:class:`type.Rect`) 탐색 결과 영역
         """
-        screen_gray: Image = screen.grayscale
-        template_gray: Image = self._image.grayscale
-        use_mask: bool = False
-        mask: Image = self.mask(self.match_size)
-        if not self._matched_width is None:
-            template_gray.size()
-        if None and not mask is None:
-            use_mask = True
-        if not self._matched_width is None and not mask is None:
-            mask.size(self._matched_width, self._matched_height)
-        method = cv2.TM_CCORR_NORMED if use_mask else cv2.TM_CCOEFF_NORMED
-        match_data = cv2.matchTemplate(screen_gray, template_gray, method, mask=mask)
-        minVal, maxVal, minLoc, maxLoc = cv2.minMaxLoc(match_data)
-        loc = Rect().xywh(*maxLoc, *self.match_size)
-        if maxVal > self._threshold:
-            return True, loc
+        found, loc, _ = self._search(screen)
+        return found, loc
+
+    def _tracking_window(self, width: int, height: int) -> Rect:
+        """직전 탐색 위치 주변의 추적 영역
+
+        Args:
+            width: 스크린 너비
+            height: 스크린 높이
+
+        Returns:
+            :class:`type.Rect` 추적 영역, 직전 위치가 없거나 영역이
+            탬플릿보다 작으면 ``None``
+        """
+        if self._last_loc is None:
+            return None
+        r = self._tracking_radius
+        last = self._last_loc
+        window = Rect(max(0, last.left - r), max(0, last.top - r),
+                      min(width, last.right + r), min(height, last.bottom + r))
+        if window.width < last.width or window.height < last.height:
+            return None
+        return window
+
+    def _search(self, screen: Image, is_gray: bool=False
+                ) -> Tuple[bool, Rect, float]:
+        """``screen_area`` 와 추적 설정을 적용해 탬플릿을 찾습니다
+
+        추적을 사용하면 직전 위치 주변을 먼저 탐색하고, 실패한 경우에만
+        ``screen_area`` 전체를 탐색합니다.
+
+        Args:
+            screen: 탬플릿을 탐색할 이미지
+            is_gray: ``screen`` 이 이미 회색조인지 여부
+
+        Returns:
+            (``bool``) 탐색 성공 여부,
+            (:class:`type.Rect`) 탐색 결과 영역,
+            (``float``) 매칭 점수
+        """
+        if self._tracking:
+            # 추적 상태는 탐색 하나가 끝날 때까지 다른 스레드와 공유하지 않음
+            with self._tracking_lock:
+                return self._search_unlocked(screen, is_gray)
+        return self._search_unlocked(screen, is_gray)
+
+    def _search_unlocked(self, screen: Image, is_gray: bool
+                         ) -> Tuple[bool, Rect, float]:
+        """:meth:`_search` 본문"""
+        t = profiler.clock()
+        convert = (lambda a: a) if is_gray else (lambda a: a.grayscale)
+        if self._tracking:
+            window = self._tracking_window(*screen.size())
+            if window is not None:
+                area = screen[window.top:window.bottom, window.left:window.right]
+                found, loc, score = self._match(convert(area), window.start)
+                if found:
+                    self._tracking_hits += 1
+                    self._last_loc = loc
+                    if t:
+                        profiler.record_search(self._path, found, score, profiler.clock() - t)
+                    return found, loc, score
+            self._tracking_misses += 1
+        region = self._search_region(*screen.size())
+        area = screen[region.top:region.bottom, region.left:region.right]
+        found, loc, score = self._match(convert(area), region.start)
+        if self._tracking:
+            self._last_loc = loc if found else None
+        if t:
+            profiler.record_search(self._path, found, score, profiler.clock() - t)
+        return found, loc, score
+
+    def scaled_size(self, scale: float) -> Tuple[int, int]:
+        """배율을 적용한 탬플릿 크기
+
+        Args:
+            scale: 매칭 사이즈(없으면 원본 크기)에 곱할 배율
+
+        Returns:
+            (``int, int``) 너비, 높이
+        """
+        if self._matched_width is None:
+            width, height = self._image.size()
         else:
-            return False, loc
+            width, height = self.match_size
+        return max(1, int(round(width * scale))), max(1, int(round(height * scale)))
+
+    def scale_search(self, screen: Image, scales: Sequence[float]
+                     ) -> Tuple[bool, Rect, float]:
+        """여러 배율로 스크린에서 탬플릿을 찾습니다
+
+        스크린의 회색조 변환은 한 번만 수행하고, 배율별 탬플릿은
+        캐시해 재사용합니다. ``scales`` 순서대로 탐색하며 문턱값을
+        넘는 배율을 찾으면 나머지 배율은 탐색하지 않으므로, 가능성이
+        높은 배율(예: ``__dpi_scale_factor__``)을 앞에 둡니다.
+
+        Args:
+            screen: 탬플릿을 탐색할 이미지
+            scales: 탐색할 배율 목록
+
+        Returns:
+            (``bool``) 탐색 성공 여부,
+            (:class:`type.Rect`) 탐색 결과 영역,
+            (``float``) 결과를 얻은 배율, 탐색에 실패하면 가장 높은
+            점수를 얻은 배율
+        """
+        screen_gray: Image = screen.grayscale
+        sw, sh = screen_gray.size()
+        best: Tuple[bool, Rect, float] = (False, Rect(), None)
+        best_score: float = -1.0
+        for scale in scales:
+            dsize = self.scaled_size(scale)
+            if dsize[0] > sw or dsize[1] > sh:
+                continue
+            found, loc, score = self._match(screen_gray, dsize=dsize)
+            if found:
+                return found, loc, scale
+            if score > best_score:
+                best, best_score = (found, loc, scale), score
+        return best
+
+    def screen_search_all(self, screen: Image, max_count: int=None,
+                          overlap: float=0.3) -> List[Tuple[Rect, float]]:
+        """스크린에서 문턱값을 넘는 모든 탬플릿 위치를 찾습니다
+
+        점수 지도를 한 번에 문턱값 처리하고 지역 최댓값만 후보로
+        남긴 뒤, 비최대 억제로 겹치는 결과를 제거합니다. 피라미드
+        설정과 관계없이 원본 해상도로 탐색합니다.
+
+        Args:
+            screen: 탬플릿을 탐색할 이미지
+            max_count: [선택] 최대 결과 수, 기본값 ``None`` (제한 없음)
+            overlap: 겹침을 허용할 최대 IoU, 기본값 ``0.3``
+
+        Returns:
+            점수 내림차순의 (:class:`type.Rect` 탐색 결과 영역,
+            ``float`` 매칭 점수) 리스트
+        """
+        region = self._search_region(*screen.size())
+        area = screen[region.top:region.bottom, region.left:region.right]
+        method = cv2.TM_CCOEFF_NORMED
+        template_gray, mask = self._prepare(method)
+        tw, th = template_gray.size()
+        match_data = cv2.matchTemplate(area.grayscale, template_gray, method, mask=mask)
+        match_data[~numpy.isfinite(match_data)] = -1
+        # 지역 최댓값이면서 문턱값을 넘는 위치만 후보로 사용
+        peak = cv2.dilate(match_data, numpy.ones((3, 3), dtype=numpy.uint8))
+        ys, xs = numpy.nonzero((match_data > self._threshold) & (match_data >= peak))
+        scores = match_data[ys, xs]
+        keep = _suppress(xs, ys, scores, tw, th, overlap, max_count)
+        x0, y0 = region.start
+        return [(Rect().xywh(int(xs[i]) + x0, int(ys[i]) + y0, tw, th), float(scores[i]))
+                for i in keep]
@@ -0,0 +1,194 @@
+"""탬플릿 라이브러리 클래스
+"""
+from ._cls_template import Template, TemplateError
+from ._cls_template_set import TemplateSet
+from ..type import Image
+from typing import Dict, Iterator, List, Sequence
+import glob
+import json
+import os
+import cv2
+import numpy
+
+_MANIFEST = "manifest.json"
+_DATA = "data.bin"
+_VERSION = 1
+_ALIGN = 64
+
+
+class TemplateLibrary:
+    """미리 컴파일한 탬플릿 묶음을 디스크에서 불러오는 클래스
+
+    라이브러리는 ``manifest.json`` 과 ``data.bin`` 으로 된 디렉토리
+    입니다. ``data.bin`` 에는 디코딩한 원본 이미지와 매칭에 쓰는
+    회색조 탬플릿, 마스크, 배율 변형이 들어 있고, 메모리 매핑으로
+    읽기 때문에 PNG 디코딩 없이 바로 사용할 수 있습니다. 같은
+    라이브러리를 여는 여러 프로세스는 운영체제의 페이지 캐시를
+    공유합니다.
+
+    라이브러리는 :meth:`build` 또는 명령줄에서 만듭니다::
+
+        python -m autowinpy build-templates <PNG 폴더> <라이브러리 폴더>
+
+    Args:
+        path: 라이브러리 디렉토리 경로
+    """
+
+    __module__ = 'autowinpy'
+
+    def __init__(self, path: str):
+        """초기화"""
+        self._path: str = path
+        try:
+            with open(os.path.join(path, _MANIFEST), encoding="utf8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            raise TemplateError("탬플릿 라이브러리가 아닙니다. {}".format(path))
+        if manifest.get("version") != _VERSION:
+            raise TemplateError("지원하지 않는 라이브러리 버전입니다. {}".format(
+                manifest.get("version")))
+        self._entries: Dict[str, dict] = manifest["templates"]
+        data_path = os.path.join(path, _DATA)
+        if os.path.getsize(data_path):
+            mapped = numpy.memmap(data_path, dtype=numpy.uint8, mode="r")
+            self._data: numpy.ndarray = mapped.view(numpy.ndarray)
+        else:
+            self._data = numpy.empty(0, dtype=numpy.uint8)
+        self._templates: Dict[str, Template] = {}
+
+    def __reduce__(self):
+        """다른 프로세스에는 경로만 넘겨 다시 매핑합니다"""
+        return (TemplateLibrary, (self._path,))
+
+    def __len__(self) -> int:
+        """탬플릿 수"""
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        """탬플릿 이름 순회"""
+        return iter(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        """이름 포함 여부"""
+        return name in self._entries
+
+    def __getitem__(self, name: str) -> Template:
+        """이름으로 :class:`Template` 출력
+
+        처음 요청할 때 매핑된 데이터로 만들고, 이후에는 같은 객체를
+        출력합니다.
+        """
+        template = self._templates.get(name)
+        if template is None:
+            template = self._load(self._entries[name])
+            self._templates[name] = template
+        return template
+
+    @property
+    def path(self) -> str:
+        """(str) 라이브러리 디렉토리 경로"""
+        return self._path
+
+    @property
+    def names(self) -> List[str]:
+        """(list) 탬플릿 이름 목록"""
+        return list(self._entries)
+
+    def _array(self, info: dict) -> Image:
+        """매핑된 데이터에서 배열 뷰를 만듭니다 (읽기 전용)"""
+        return Image(numpy.ndarray(info["shape"], info["dtype"], self._data, info["offset"]))
+
+    def _load(self, entry: dict) -> Template:
+        """목록 항목으로 :class:`Template` 를 만듭니다"""
+        config = dict(entry["config"])
+        if config.get("mask_color") is not None:
+            config["mask_color"] = tuple(config["mask_color"])
+        template = Template(image=self._array(entry["image"]), **config)
+        for item in entry["prepared"]:
+            dsize = tuple(item["dsize"]) if item["dsize"] is not None else None
+            mask = self._array(item["mask"]) if item["mask"] is not None else None
+            key = (dsize, item["method"], item["level"])
+            template._prepared[key] = (self._array(item["gray"]), mask)
+        return template
+
+    def template_set(self, names: Sequence[str]=None) -> TemplateSet:
+        """탬플릿을 :class:`TemplateSet` 으로 묶어 출력합니다
+
+        Args:
+            names: [선택] 묶을 탬플릿 이름, 기본값은 전체
+        """
+        names = self.names if names is None else names
+        return TemplateSet({name: self[name] for name in names})
+
+    def close(self):
+        """메모리 매핑을 해제합니다
+
+        이미 출력한 :class:`Template` 는 매핑을 참조하므로 계속 사용할
+        수 있으며, 모두 사라질 때 해제됩니다.
+        """
+        self._templates.clear()
+        self._data = numpy.empty(0, dtype=numpy.uint8)
+
+    @staticmethod
+    def build(source: str, path: str, scales: Sequence[float]=(),
+              pattern: str="*.png", **config) -> 'TemplateLibrary':
+        """PNG 폴더를 탬플릿 라이브러리로 컴파일합니다
+
+        각 이미지는 파일 이름(확장자 제외)으로 등록됩니다. 기본 매칭
+        사이즈와 ``scales`` 의 각 배율, ``pyramid_levels`` 단계의
+        회색조 탬플릿과 마스크를 미리 만들어 저장합니다.
+
+        Args:
+            source: PNG 파일이 있는 폴더
+            path: 만들 라이브러리 디렉토리, 이미 있으면 덮어씁니다.
+            scales: [선택] 미리 만들 배율 목록 (:meth:`Template.scale_search` 용)
+            pattern: 파일 이름 패턴, 기본값 ``"*.png"``
+            **config: 모든 탬플릿에 적용할 :class:`Template` 설정
+
+        Returns:
+            만든 :class:`TemplateLibrary`
+        """
+        os.makedirs(path, exist_ok=True)
+        method = cv2.TM_CCOEFF_NORMED
+        entries: Dict[str, dict] = {}
+        offset = 0
+        with open(os.path.join(path, _DATA), "wb") as data:
+
+            def write(array: numpy.ndarray) -> dict:
+                nonlocal offset
+                if array is None:
+                    return None
+                array = numpy.ascontiguousarray(array)
+                pad = -offset % _ALIGN
+                data.write(b"\0" * pad)
+                offset += pad
+                info = {"offset": offset, "shape": list(array.shape),
+                        "dtype": array.dtype.str}
+                data.write(array.tobytes())
+                offset += array.nbytes
+                return info
+
+            for file in sorted(glob.glob(os.path.join(source, pattern))):
+                name = os.path.splitext(os.path.basename(file))[0]
+                template = Template(path=file, **config)
+                dsizes = [None] + [template.scaled_size(s) for s in scales]
+                for dsize in dsizes:
+                    for level in range(template.configure()["pyramid_levels"] + 1):
+                        template._prepare(method, level, dsize)
+                settings = template.configure()
+                settings["path"] = os.path.abspath(file)
+                entries[name] = {
+                    "config": settings,
+                    "image": write(template.origin_image),
+                    "prepared": [
+                        {"dsize": list(key[0]) if key[0] is not None else None,
+                         "method": key[1], "level": key[2],
+                         "gray": write(gray), "mask": write(mask)}
+                        for key, (gray, mask) in template._prepared.items()],
+                }
+        manifest = {"version": _VERSION, "templates": entries}
+        temp = os.path.join(path, _MANIFEST + ".tmp")
+        with open(temp, "w", encoding="utf8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+        os.replace(temp, os.path.join(path, _MANIFEST))
+        return TemplateLibrary(path)
@@ -0,0 +1,74 @@
+"""탬플릿 묶음 클래스
+"""
+from ._cls_template import Template
+from ..type import Image, Rect
+from typing import Dict, Iterator, Tuple
+
+
+class TemplateSet:
+    """여러 탬플릿을 하나의 스크린에서 한 번에 찾는 클래스
+
+    스크린의 회색조 변환은 :meth:`screen_search` 호출마다 한 번만
+    수행하고, 등록된 모든 :class:`Template` 가 이를 공유합니다.
+    공유하는 작업은 회색조 변환뿐이므로, 탬플릿 매칭 시간이 대부분인
+    일반적인 경우 개별 :meth:`Template.screen_search` 호출보다 크게
+    빠르지 않습니다(1080p 스크린, 탬플릿 30개에서 프레임당 약 1%).
+    주된 용도는 여러 탬플릿을 이름으로 묶어 관리하는 것입니다.
+
+    Args:
+        templates: [선택] ``{이름: Template}`` 초기 탬플릿
+    """
+
+    __module__ = 'autowinpy'
+
+    def __init__(self, templates: Dict[str, Template]=None):
+        """초기화"""
+        self._templates: Dict[str, Template] = dict(templates or {})
+
+    def __len__(self) -> int:
+        """등록된 탬플릿 수"""
+        return len(self._templates)
+
+    def __iter__(self) -> Iterator[str]:
+        """등록된 탬플릿 이름 순회"""
+        return iter(self._templates)
+
+    def __contains__(self, name: str) -> bool:
+        """이름 등록 여부"""
+        return name in self._templates
+
+    def __getitem__(self, name: str) -> Template:
+        """이름으로 탬플릿 출력"""
+        return self._templates[name]
+
+    def add(self, name: str, template: Template):
+        """탬플릿 등록
+
+        Args:
+            name: 탐색 결과에서 사용할 이름
+            template: 등록할 탬플릿
+        """
+        self._templates[name] = template
+        return self
+
+    def remove(self, name: str):
+        """탬플릿 등록 해제
+
+        Args:
+            name: 등록된 탬플릿 이름
+        """
+        del self._templates[name]
+        return self
+
+    def screen_search(self, screen: Image) -> Dict[str, Tuple[bool, Rect, float]]:
+        """스크린에서 등록된 모든 탬플릿을 찾습니다
+
+        Args:
+            screen: 탬플릿을 탐색할 이미지
+
+        Returns:
+            ``{이름: (탐색 성공 여부, 탐색 결과 영역, 매칭 점수)}``
+        """
+        screen_gray: Image = screen.grayscale
+        return {name: template._search(screen_gray, is_gray=True)
+                for name, template in self._templates.items()}
@@ -0,0 +1,180 @@
+"""윈도우 목록 스냅샷 클래스
+"""
+from ._cls_gui import Gui
+from ..backend import get_backend
+from ..type import Rect
+from time import monotonic
+from typing import Dict, List
+import re
+
+
+class WindowInfo:
+    """스냅샷에 저장된 윈도우 정보
+
+    Args:
+        hwnd: 윈도우 핸들
+        title: 윈도우 이름
+        class_name: 윈도우 클래스 이름
+        rect: 윈도우 사각영역
+        active: 활성 여부
+    """
+
+    __module__ = 'autowinpy'
+    __slots__ = ("hwnd", "title", "class_name", "rect", "active")
+
+    def __init__(self, hwnd: int, title: str, class_name: str, rect: Rect, active: bool):
+        """초기화"""
+        self.hwnd: int = hwnd
+        self.title: str = title
+        self.class_name: str = class_name
+        self.rect: Rect = rect
+        self.active: bool = active
+
+    def __repr__(self):
+        """터미널 출력"""
+        return "({}) {} [{}]".format(self.hwnd, self.title, self.class_name)
+
+
+class WindowSnapshot:
+    """최상위 윈도우 목록을 한 번에 가져와 보관하는 클래스
+
+    윈도우 열거와 이름, 클래스, 영역, 활성 여부 조회를 한 번에 수행하고
+    ``ttl`` 초 동안 재사용합니다. 이름, 정규표현식, 클래스 이름, 핸들로
+    찾을 수 있으며 정규표현식 결과도 스냅샷이 바뀔 때까지 보관합니다.
+
+    Args:
+        ttl: 스냅샷 유효 시간(초), 기본값 ``0.5``
+    """
+
+    __module__ = 'autowinpy'
+
+    def __init__(self, ttl: float=0.5):
+        """초기화"""
+        self._ttl: float = ttl
+        self._taken: float = None
+        self._infos: Dict[int, WindowInfo] = {}
+        self._by_title: Dict[str, List[int]] = {}
+        self._by_class: Dict[str, List[int]] = {}
+        self._search_cache: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        """윈도우 수"""
+        self._ensure()
+        return len(self._infos)
+
+    @property
+    def ttl(self) -> float:
+        """(float) 스냅샷 유효 시간(초)"""
+        return self._ttl
+
+    @property
+    def age(self) -> float:
+        """(float) 스냅샷을 만든 뒤 지난 시간(초), 없으면 ``None``"""
+        return None if self._taken is None else monotonic() - self._taken
+
+    def refresh(self):
+        """윈도우 목록을 다시 가져옵니다."""
+        backend = get_backend()
+        infos: Dict[int, WindowInfo] = {}
+        by_title: Dict[str, List[int]] = {}
+        by_class: Dict[str, List[int]] = {}
+        for hwnd in backend.handle_list():
+            active = backend.is_active_gui(hwnd)
+            if not active:
+                # 비활성 윈도우는 이름 등을 조회하지 않습니다.
+                infos[hwnd] = WindowInfo(hwnd, None, None, None, False)
+                continue
+            info = WindowInfo(
+                hwnd, backend.window_text(hwnd), backend.window_class(hwnd),
+                backend.window_rect(hwnd), True)
+            infos[hwnd] = info
+            by_title.setdefault(info.title, []).append(hwnd)
+            by_class.setdefault(info.class_name, []).append(hwnd)
+        self._infos, self._by_title, self._by_class = infos, by_title, by_class
+        self._search_cache = {}
+        self._taken = monotonic()
+        return self
+
+    def _ensure(self, max_age: float=None):
+        """스냅샷이 없거나 오래되었으면 다시 가져옵니다."""
+        max_age = self._ttl if max_age is None else max_age
+        if self._taken is None or monotonic() - self._taken >= max_age:
+            self.refresh()
+
+    def _guis(self, hwnds: List[int]) -> List[Gui]:
+        """스냅샷 값을 보관한 :class:`Gui` 목록 출력
+
+        이름, 영역, 활성 여부는 스냅샷을 만든 시각의 값으로 채우고
+        ``ttl`` 이 지나면 다시 가져옵니다.
+        """
+        guis = []
+        for h in hwnds:
+            info = self._infos[h]
+            gui = Gui(h, self._ttl)
+            gui._fetched = {
+                "name": (self._taken, info.title),
+                "rect": (self._taken, info.rect),
+                "active": (self._taken, info.active),
+            }
+            guis.append(gui)
+        return guis
+
+    def info(self, hwnd: int) -> WindowInfo:
+        """핸들로 윈도우 정보 출력
+
+        Args:
+            hwnd: 윈도우 핸들
+
+        Returns:
+            :class:`WindowInfo`, 스냅샷에 없으면 ``None``
+        """
+        self._ensure()
+        return self._infos.get(hwnd)
+
+    def windows(self, max_age: float=None) -> List[Gui]:
+        """활성 윈도우 목록
+
+        Args:
+            max_age: [선택] 허용할 스냅샷 나이(초), 기본값 ``ttl``
+        """
+        self._ensure(max_age)
+        return self._guis([h for h, i in self._infos.items() if i.active])
+
+    def by_title(self, title: str, max_age: float=None) -> List[Gui]:
+        """이름이 정확히 일치하는 활성 윈도우 목록
+
+        Args:
+            title: 윈도우 이름
+            max_age: [선택] 허용할 스냅샷 나이(초), 기본값 ``ttl``
+        """
+        self._ensure(max_age)
+        return self._guis(self._by_title.get(title, []))
+
+    def by_class(self, class_name: str, max_age: float=None) -> List[Gui]:
+        """클래스 이름이 일치하는 활성 윈도우 목록
+
+        Args:
+            class_name: 윈도우 클래스 이름
+            max_age: [선택] 허용할 스냅샷 나이(초), 기본값 ``ttl``
+        """
+        self._ensure(max_age)
+        return self._guis(self._by_class.get(class_name, []))
+
+    def search(self, name_re: str, max_age: float=None) -> List[Gui]:
+        """이름이 정규표현식을 만족(``re.search``)하는 활성 윈도우 목록
+
+        Args:
+            name_re: 정규표현식
+            max_age: [선택] 허용할 스냅샷 나이(초), 기본값 ``ttl``
+        """
+        self._ensure(max_age)
+        hwnds = self._search_cache.get(name_re)
+        if hwnds is None:
+            _rex = re.compile(name_re)
+            hwnds = [h for h, i in self._infos.items()
+                     if i.active and _rex.search(i.title)]
+            self._search_cache[name_re] = hwnds
+        return self._guis(hwnds)
+
+
+_default_snapshot = WindowSnapshot()
@@ -0,0 +1,58 @@
+"""드래그 경로 생성 함수
+"""
+import numpy
+
+_EASING = {
+    "linear": lambda t: t,
+    "ease_in": lambda t: t * t,
+    "ease_out": lambda t: t * (2 - t),
+    "ease_in_out": lambda t: t * t * (3 - 2 * t),
+}
+
+
+def drag_path(x0: int, y0: int, x1: int, y1: int, spacing: float=3.0,
+              max_points: int=None, easing: str="linear", curve: float=0.0,
+              scale: float=1.0) -> numpy.ndarray:
+    """드래그 경로를 lParam 배열로 만듭니다
+
+    모든 점을 한 번에 계산하고, 정수 좌표로 바꾼 뒤 연속으로 같은
+    점은 하나만 남깁니다.
+
+    Args:
+        x0: 시작 x 좌표
+        y0: 시작 y 좌표
+        x1: 끝 x 좌표
+        y1: 끝 y 좌표
+        spacing: 점 사이 거리(px), 기본값 ``3``
+        max_points: [선택] 최대 점 수
+        easing: 속도 변화 ``"linear"``, ``"ease_in"``, ``"ease_out"``,
+            ``"ease_in_out"`` 중 하나, 기본값 ``"linear"``
+        curve: 경로를 휘게 할 정도, 이동 거리에 대한 중간점의
+            수직 이동 비율, 기본값 ``0`` (직선)
+        scale: 좌표에 곱할 배율(예: ``__dpi_scale_factor__``),
+            기본값 ``1``
+
+    Returns:
+        ``x | y << 16`` 로 묶은 ``int64`` lParam 배열, 시작점과 끝점 포함
+    """
+    if easing not in _EASING:
+        raise ValueError("지원하지 않는 easing 입니다. {}".format(easing))
+    start = numpy.array([x0, y0], dtype=numpy.float64) * scale
+    end = numpy.array([x1, y1], dtype=numpy.float64) * scale
+    delta = end - start
+    distance = float(numpy.hypot(*delta))
+    points = max(2, int(distance / spacing) + 1)
+    if max_points is not None:
+        points = max(2, min(points, max_points))
+    t = _EASING[easing](numpy.linspace(0.0, 1.0, points))[:, None]
+    if curve:
+        # 2차 베지어: 중간점을 진행 방향의 수직으로 이동한 제어점
+        control = (start + end) / 2 + curve * numpy.array([-delta[1], delta[0]])
+        path = (1 - t) ** 2 * start + 2 * (1 - t) * t * control + t ** 2 * end
+    else:
+        path = start + t * delta
+    xy = numpy.rint(path).astype(numpy.int64)
+    lparams = (xy[:, 0] & 0xFFFF) | (xy[:, 1] & 0xFFFF) << 16
+    keep = numpy.ones(len(lparams), dtype=bool)
+    keep[1:] = lparams[1:] != lparams[:-1]
+    return lparams[keep]
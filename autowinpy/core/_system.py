@@ -1,8 +1,9 @@
 """패키지 & 파이썬 & 프로세스 시스템 제어
 """
-from ctypes import windll
 import sys
 
+_dpi_scale: float = None
+
 
 def _set_windows_dpi() -> float:
     """windows 8.1 이상을 위한 DPI 조정.
@@ -12,13 +13,23 @@ def _set_windows_dpi() -> float:
 
     프로세스가 HIDPI 모드로 변경됩니다.
     이 작업은 좌표 기반의 윈도우 핸들링을 위해
-    반드시 필요합니다.
+    반드시 필요합니다. Windows가 아니면 ``1`` 을 출력합니다.
+
+    조정은 처음 호출할 때 한 번만 수행하고, 이후에는 그 결과를
+    출력합니다.
     """
-    if sys.getwindowsversion().major > 8:
+    global _dpi_scale
+    if _dpi_scale is not None:
+        return _dpi_scale
+    if sys.platform != "win32":
+        _dpi_scale = 1
+    elif sys.getwindowsversion().major > 8:
+        from ctypes import windll
         user32 = windll.user32
         native = user32.GetDpiForSystem()
         user32.SetProcessDPIAware()
         scaled = user32.GetDpiForSystem()
-        return scaled / native
+        _dpi_scale = scaled / native
     else:
-        return 1
+        _dpi_scale = 1
+    return _dpi_scale
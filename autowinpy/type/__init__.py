@@ -1,6 +1,7 @@
 """패키지 내부 타입"""
 from ._rect import Rect
 from ._image import Image
+from ._rect_array import RectArray
 
 __all__ = [
 ]
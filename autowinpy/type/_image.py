@@ -1,7 +1,10 @@
 """이미지 타입 클래스
 """
+from typing import Tuple
 import numpy
 import cv2
+from ._rect import Rect
+from .._profiler import profiler
 
 class ImageError(Exception):
     """이미지 오류 처리"""
@@ -31,6 +34,13 @@ class Image(numpy.ndarray):
         +--------------+--------------+----------------+
         | grayscale    | `type.Image` | 회색조 이미지  |
         +--------------+--------------+----------------+
+        | origin       | ``int, int`` | 원본 기준 좌표 |
+        +--------------+--------------+----------------+
+        | rect         | `type.Rect`  | 원본 기준 영역 |
+        +--------------+--------------+----------------+
+
+    슬라이싱이나 :meth:`crop` 으로 만든 뷰는 데이터를 복사하지 않고,
+    원본 이미지에서의 좌상단 좌표를 ``origin`` 으로 이어받습니다.
     """
 
     __module__ = 'autowinpy.type'
@@ -39,6 +49,54 @@ class Image(numpy.ndarray):
         """초기화"""
         return n.view(cls)
 
+    def __array_finalize__(self, obj):
+        """뷰 생성 시 원본 기준 좌표 계산"""
+        origin = getattr(obj, "origin", (0, 0))
+        if (isinstance(obj, Image) and self.ndim >= 2 and obj.ndim >= 2
+                and self.base is not None):
+            # 같은 버퍼 안의 뷰이면 주소 차이로 잘린 위치를 구합니다.
+            delta = (self.__array_interface__["data"][0]
+                     - obj.__array_interface__["data"][0])
+            s0, s1 = obj.strides[:2]
+            if (delta and 0 < s1 <= s0 and self.strides[0] % s0 == 0
+                    and 0 <= delta < obj.shape[0] * s0):
+                dy, rest = divmod(delta, s0)
+                dx = rest // s1
+                if dx < obj.shape[1]:
+                    origin = (origin[0] + dx, origin[1] + dy)
+        self.origin: Tuple[int, int] = origin
+
+    def _wrap(self, n: numpy.ndarray) -> 'Image':
+        """같은 ``origin`` 을 가진 새 이미지"""
+        image = Image(n)
+        image.origin = self.origin
+        return image
+
+    @property
+    def rect(self) -> Rect:
+        """원본 이미지 기준 :class:`Rect <autowinpy.type.Rect>` 영역"""
+        return Rect().xywh(*self.origin, self.width, self.height)
+
+    def crop(self, rect: Rect) -> 'Image':
+        """영역을 복사 없이 잘라낸 뷰를 출력합니다
+
+        영역은 이미지 안으로 제한됩니다. 결과의 ``origin`` 에 원본 기준
+        좌표가 남으므로, 뷰에서 찾은 좌표에 더해 원본 좌표로 바꿀 수
+        있습니다.
+
+        Args:
+            rect: 이 이미지 좌표 기준 :class:`Rect <autowinpy.type.Rect>`
+
+        Returns:
+            ``Image`` 뷰
+        """
+        left, top = max(0, rect.left), max(0, rect.top)
+        right = min(self.width, max(left, rect.right))
+        bottom = min(self.height, max(top, rect.bottom))
+        view = self[top:bottom, left:right]
+        view.origin = (self.origin[0] + left, self.origin[1] + top)
+        return view
+
     @property
     def width(self) -> int:
         """너비"""
@@ -66,7 +124,10 @@ class Image(numpy.ndarray):
     @property
     def grayscale(self) -> 'Image':
         """회색조 이미지를 출력합니다."""
-        return Image(cv2.cvtColor(self, cv2.COLOR_RGB2GRAY))
+        t = profiler.clock()
+        gray = self._wrap(cv2.cvtColor(self, cv2.COLOR_RGB2GRAY))
+        profiler.lap("image.grayscale", "", t)
+        return gray
 
     def size(self, width: int=None, height: int=None):
         """너비, 높이 변경 및 출력
@@ -89,20 +150,38 @@ class Image(numpy.ndarray):
         elif width is None:
             width  = int(height * _w / _h)
         method = cv2.INTER_AREA if _w > width else cv2.INTER_LINEAR
-        return Image(cv2.resize(self, (width, height), interpolation=method))
+        t = profiler.clock()
+        resized = Image(cv2.resize(self, (width, height), interpolation=method))
+        profiler.lap("image.resize", "", t)
+        return resized
     
-    def channel(self, n: int) -> 'Image':
+    def channel(self, n: int, contiguous: bool=False) -> 'Image':
         """단일채널 이미지 출력
-        
+
+        기본값은 복사 없는 뷰이며, 연속 메모리가 필요한 함수에 넘길
+        때만 ``contiguous`` 를 사용합니다.
+
         Args:
             n: 채널은 0부터 시작합니다.
                 sRGB의 경우 투명도 채널은 3
+            contiguous: 연속 메모리 배열로 출력, 기본값 ``False``
         """
-        if self.len_channels < n or n < 0 :
+        if self.len_channels <= n or n < 0 :
             raise ImageError(
                 "{} 채널이 존재하지 않습니다. 이미지 채널 수: {}".format(
                     n, self.len_channels))
-        return Image(self[:,:,n])
+        view = self[:,:,n]
+        if contiguous and not view.flags.c_contiguous:
+            return self._wrap(numpy.ascontiguousarray(view))
+        return view
 
     def convert(self, mode) -> 'Image':
-        return Image(cv2.cvtColor(self, mode))
+        """색 공간 변환 이미지 출력
+
+        Args:
+            mode: OpenCV 색 변환 코드
+        """
+        t = profiler.clock()
+        converted = self._wrap(cv2.cvtColor(self, mode))
+        profiler.lap("image.convert", "", t)
+        return converted
@@ -27,14 +27,36 @@ class Rect:
         +--------+--------------+-------------+
         | end    | ``int, int`` | 끝점 좌표   |
         +--------+--------------+-------------+
+        | area   | ``int``      | 넓이        |
+        +--------+--------------+-------------+
+
+    같은 좌표의 영역은 같은 값으로 비교되고 해시됩니다. 딕셔너리 키나
+    집합에 넣은 뒤에는 :meth:`xyxy`, :meth:`xywh` 로 바꾸지 마세요.
     """
 
     __module__ = 'autowinpy.type'
+    __slots__ = ("_left", "_top", "_right", "_bottom")
 
     def __init__(self, left=0, top=0, right=0, bottom=0):
         """초기화"""
         self.xyxy(left, top, right, bottom)
 
+    def __repr__(self):
+        """터미널 출력"""
+        return "Rect({}, {}, {}, {})".format(
+            self._left, self._top, self._right, self._bottom)
+
+    def __eq__(self, other):
+        """좌표 비교"""
+        if not isinstance(other, Rect):
+            return NotImplemented
+        return (self._left, self._top, self._right, self._bottom) == (
+            other._left, other._top, other._right, other._bottom)
+
+    def __hash__(self):
+        """좌표 해시"""
+        return hash((self._left, self._top, self._right, self._bottom))
+
     @property
     def left(self) -> int:
         """왼쪽 좌표"""
@@ -70,6 +92,11 @@ class Rect:
         """너비와 높이 출력"""
         return self.width, self.height
 
+    @property
+    def area(self) -> int:
+        """넓이, 뒤집힌 영역은 ``0``"""
+        return max(0, self.width) * max(0, self.height)
+
     @property
     def start(self) -> Tuple[int, int]:
         """시작 좌표"""
@@ -95,3 +122,25 @@ class Rect:
         self._right: int = left + width
         self._bottom: int = top + height
         return self
+
+    def intersection(self, other: 'Rect') -> 'Rect':
+        """겹치는 영역, 겹치지 않으면 크기가 ``0`` 인 영역"""
+        left, top = max(self._left, other._left), max(self._top, other._top)
+        right = max(left, min(self._right, other._right))
+        bottom = max(top, min(self._bottom, other._bottom))
+        return Rect(left, top, right, bottom)
+
+    def union(self, other: 'Rect') -> 'Rect':
+        """두 영역을 모두 포함하는 가장 작은 영역"""
+        return Rect(min(self._left, other._left), min(self._top, other._top),
+                    max(self._right, other._right), max(self._bottom, other._bottom))
+
+    def contains(self, x: int, y: int) -> bool:
+        """점이 영역 안에 있는지 여부, 오른쪽과 아래쪽 경계는 제외"""
+        return self._left <= x < self._right and self._top <= y < self._bottom
+
+    def iou(self, other: 'Rect') -> float:
+        """두 영역의 IoU (Intersection over Union)"""
+        inter = self.intersection(other).area
+        union = self.area + other.area - inter
+        return inter / union if union > 0 else 0.0
@@ -0,0 +1,221 @@
+"""사각형 영역 배열 타입 클래스
+"""
+from typing import Iterable, Iterator, List, Union
+import numpy
+from ._rect import Rect
+
+_SORT_KEYS = ("left", "top", "right", "bottom", "width", "height", "area")
+
+
+class RectArray:
+    """여러 사각형 영역을 담는 배열
+
+    ``(N, 4)`` 크기의 ``int64`` 배열에 ``(left, top, right, bottom)``
+    순서로 보관하며, 겹침 계산 같은 기하 연산을 한 번에 처리합니다.
+
+    Args:
+        boxes: [선택] ``(N, 4)`` 크기의 ``(left, top, right, bottom)``
+            배열 또는 리스트, 기본값은 빈 배열
+
+    Property:
+        +--------+-------------------+----------------------+
+        | 이름   | 타입              | 내용                 |
+        +========+===================+======================+
+        | array  | ``numpy.ndarray`` | ``(N, 4)`` 좌표 배열 |
+        +--------+-------------------+----------------------+
+        | left   | ``numpy.ndarray`` | 왼쪽 값              |
+        +--------+-------------------+----------------------+
+        | top    | ``numpy.ndarray`` | 위쪽 값              |
+        +--------+-------------------+----------------------+
+        | right  | ``numpy.ndarray`` | 오른쪽 값            |
+        +--------+-------------------+----------------------+
+        | bottom | ``numpy.ndarray`` | 아래쪽 값            |
+        +--------+-------------------+----------------------+
+        | width  | ``numpy.ndarray`` | 너비                 |
+        +--------+-------------------+----------------------+
+        | height | ``numpy.ndarray`` | 높이                 |
+        +--------+-------------------+----------------------+
+        | area   | ``numpy.ndarray`` | 넓이                 |
+        +--------+-------------------+----------------------+
+    """
+
+    __module__ = 'autowinpy.type'
+    __slots__ = ("_boxes",)
+
+    def __init__(self, boxes=None):
+        """초기화"""
+        if boxes is None:
+            boxes = numpy.empty((0, 4), dtype=numpy.int64)
+        boxes = numpy.asarray(boxes, dtype=numpy.int64).reshape(-1, 4)
+        self._boxes: numpy.ndarray = boxes
+
+    @classmethod
+    def from_rects(cls, rects: Iterable[Rect]) -> 'RectArray':
+        """:class:`Rect` 목록으로 만듭니다"""
+        return cls([(r.left, r.top, r.right, r.bottom) for r in rects])
+
+    @classmethod
+    def from_xywh(cls, x, y, width, height) -> 'RectArray':
+        """시작 좌표와 너비, 높이 배열로 만듭니다
+
+        스칼라와 배열을 섞어 쓸 수 있습니다. 예를 들어 같은 크기의
+        매칭 결과는 ``RectArray.from_xywh(xs, ys, w, h)`` 로 만듭니다.
+        """
+        x, y, width, height = numpy.broadcast_arrays(x, y, width, height)
+        return cls(numpy.stack([x, y, x + width, y + height], axis=-1))
+
+    def to_rects(self) -> List[Rect]:
+        """:class:`Rect` 리스트로 출력합니다"""
+        return [Rect(*box) for box in self._boxes.tolist()]
+
+    def __repr__(self):
+        """터미널 출력"""
+        return "RectArray({})".format(self._boxes.tolist())
+
+    def __len__(self) -> int:
+        """영역 수"""
+        return len(self._boxes)
+
+    def __iter__(self) -> Iterator[Rect]:
+        """:class:`Rect` 반복자"""
+        return iter(self.to_rects())
+
+    def __getitem__(self, index) -> Union[Rect, 'RectArray']:
+        """정수는 :class:`Rect`, 슬라이스와 배열은 :class:`RectArray`"""
+        if isinstance(index, (int, numpy.integer)):
+            return Rect(*self._boxes[index].tolist())
+        return RectArray(self._boxes[index])
+
+    @property
+    def array(self) -> numpy.ndarray:
+        """``(N, 4)`` 좌표 배열"""
+        return self._boxes
+
+    @property
+    def left(self) -> numpy.ndarray:
+        """왼쪽 좌표"""
+        return self._boxes[:, 0]
+
+    @property
+    def top(self) -> numpy.ndarray:
+        """상단 좌표"""
+        return self._boxes[:, 1]
+
+    @property
+    def right(self) -> numpy.ndarray:
+        """오른쪽 좌표"""
+        return self._boxes[:, 2]
+
+    @property
+    def bottom(self) -> numpy.ndarray:
+        """하단 좌표"""
+        return self._boxes[:, 3]
+
+    @property
+    def width(self) -> numpy.ndarray:
+        """너비"""
+        return self._boxes[:, 2] - self._boxes[:, 0]
+
+    @property
+    def height(self) -> numpy.ndarray:
+        """높이"""
+        return self._boxes[:, 3] - self._boxes[:, 1]
+
+    @property
+    def area(self) -> numpy.ndarray:
+        """넓이, 뒤집힌 영역은 ``0``"""
+        return (numpy.maximum(self.width, 0) * numpy.maximum(self.height, 0))
+
+    @staticmethod
+    def _other(other: Union[Rect, 'RectArray']) -> numpy.ndarray:
+        """비교 대상을 ``(M, 4)`` 배열로 변환"""
+        if isinstance(other, Rect):
+            return numpy.array([[other.left, other.top, other.right, other.bottom]],
+                               dtype=numpy.int64)
+        return other.array
+
+    def intersection(self, other: Union[Rect, 'RectArray']) -> 'RectArray':
+        """각 영역과 겹치는 영역
+
+        Args:
+            other: :class:`Rect` 또는 길이가 같은 :class:`RectArray`
+
+        Returns:
+            겹치지 않는 항목은 크기가 ``0`` 인 :class:`RectArray`
+        """
+        b = self._other(other)
+        lt = numpy.maximum(self._boxes[:, :2], b[:, :2])
+        rb = numpy.maximum(lt, numpy.minimum(self._boxes[:, 2:], b[:, 2:]))
+        return RectArray(numpy.concatenate([lt, rb], axis=1))
+
+    def iou(self, other: Union[Rect, 'RectArray']) -> numpy.ndarray:
+        """모든 영역 쌍의 IoU (Intersection over Union)
+
+        Args:
+            other: :class:`Rect` 또는 :class:`RectArray`
+
+        Returns:
+            ``(N, M)`` 크기의 ``float64`` 배열,
+            ``other`` 가 :class:`Rect` 이면 ``(N,)``
+        """
+        a, b = self._boxes[:, None, :], self._other(other)[None, :, :]
+        w = numpy.minimum(a[..., 2], b[..., 2]) - numpy.maximum(a[..., 0], b[..., 0])
+        h = numpy.minimum(a[..., 3], b[..., 3]) - numpy.maximum(a[..., 1], b[..., 1])
+        inter = numpy.maximum(w, 0) * numpy.maximum(h, 0)
+        area_b = RectArray(b[0]).area[None, :]
+        union = self.area[:, None] + area_b - inter
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            result = numpy.where(union > 0, inter / union, 0.0)
+        return result[:, 0] if isinstance(other, Rect) else result
+
+    def contains(self, x, y) -> numpy.ndarray:
+        """점이 각 영역 안에 있는지 여부
+
+        오른쪽과 아래쪽 경계는 제외합니다.
+
+        Args:
+            x: 점의 x 좌표
+            y: 점의 y 좌표
+
+        Returns:
+            ``(N,)`` 크기의 ``bool`` 배열
+        """
+        return ((self.left <= x) & (x < self.right)
+                & (self.top <= y) & (y < self.bottom))
+
+    def translate(self, dx: int, dy: int) -> 'RectArray':
+        """모든 영역을 이동한 새 배열"""
+        return RectArray(self._boxes + numpy.array([dx, dy, dx, dy], dtype=numpy.int64))
+
+    def scale(self, fx: float, fy: float=None) -> 'RectArray':
+        """좌표에 배율을 곱한 새 배열
+
+        Args:
+            fx: x 축 배율
+            fy: [선택] y 축 배율, 기본값은 ``fx``
+        """
+        fy = fx if fy is None else fy
+        factor = numpy.array([fx, fy, fx, fy], dtype=numpy.float64)
+        return RectArray(numpy.rint(self._boxes * factor))
+
+    def argsort(self, key: str="top", reverse: bool=False) -> numpy.ndarray:
+        """정렬 순서 인덱스
+
+        Args:
+            key: ``"left"``, ``"top"``, ``"right"``, ``"bottom"``,
+                ``"width"``, ``"height"``, ``"area"`` 중 하나, 또는
+                위에서 아래, 왼쪽에서 오른쪽으로 읽는 ``"reading"``.
+                기본값 ``"top"``
+            reverse: 내림차순, 기본값 ``False``
+        """
+        if key == "reading":
+            order = numpy.lexsort((self.left, self.top))
+        elif key in _SORT_KEYS:
+            order = numpy.argsort(getattr(self, key), kind="stable")
+        else:
+            raise ValueError("지원하지 않는 정렬 기준입니다. {}".format(key))
+        return order[::-1] if reverse else order
+
+    def sort(self, key: str="top", reverse: bool=False) -> 'RectArray':
+        """정렬한 새 배열, 인자는 :meth:`argsort` 와 같습니다"""
+        return RectArray(self._boxes[self.argsort(key, reverse)])
@@ -3,13 +3,29 @@
 from ._handle import (
     handle_list,
     child_handle_list,
+    direct_children,
     window_text,
+    window_class,
     window_rect,
     window_array,
+    window_capture,
+    GdiSource,
     is_active_gui,
     post_cilck,
     post_drag,
 )
 
+from ..backend import (
+    CaptureError,
+    CaptureSource,
+    BytesSource,
+    WindowCapture,
+)
+
+from ..core._system import _set_windows_dpi
+
 __all__ = [
 ]
+
+# 좌표 기반 윈도우 제어를 위해 처음 불러올 때 HIDPI 모드로 변경
+_set_windows_dpi()
@@ -0,0 +1,60 @@
+"""Win32 백엔드
+"""
+from typing import Iterator, List
+
+from win32 import win32api
+
+from ..backend import Backend, CaptureSource
+from ..core._system import _set_windows_dpi
+from ..type import Rect
+from . import _handle
+
+
+class Win32Backend(Backend):
+    """pywin32를 사용하는 Windows 백엔드"""
+
+    __module__ = 'autowinpy.win32'
+
+    def __init__(self):
+        """초기화, 프로세스를 HIDPI 모드로 변경"""
+        _set_windows_dpi()
+
+    def handle_list(self) -> List[int]:
+        """최상위 윈도우 핸들 리스트"""
+        return _handle.handle_list()
+
+    def child_handle_list(self, hwnd: int) -> List[int]:
+        """자식 윈도우 핸들 리스트"""
+        return _handle.child_handle_list(hwnd)
+
+    def direct_children(self, hwnd: int) -> Iterator[int]:
+        """직계 자식 윈도우 핸들"""
+        return _handle.direct_children(hwnd)
+
+    def is_active_gui(self, hwnd: int) -> bool:
+        """윈도우 활성 여부"""
+        return _handle.is_active_gui(hwnd)
+
+    def window_text(self, hwnd: int) -> str:
+        """윈도우 이름"""
+        return _handle.window_text(hwnd)
+
+    def window_class(self, hwnd: int) -> str:
+        """윈도우 클래스 이름"""
+        return _handle.window_class(hwnd)
+
+    def window_rect(self, hwnd: int) -> Rect:
+        """윈도우 사각영역"""
+        return _handle.window_rect(hwnd)
+
+    def capture_source(self, hwnd: int) -> CaptureSource:
+        """GDI 캡처 원본"""
+        return _handle.GdiSource(hwnd)
+
+    def post_message(self, hwnd: int, msg: int, wparam: int, lparam: int):
+        """``PostMessage`` 로 메시지 전송"""
+        win32api.PostMessage(hwnd, msg, wparam, lparam)
+
+    def dpi_scale_factor(self) -> float:
+        """HIDPI 배율"""
+        return _set_windows_dpi()
@@ -1,18 +1,17 @@
 """
 
 """
-from ctypes import windll
+from ctypes import c_void_p, windll
 from time import sleep
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 
 import numpy
-from PIL import Image as pil_Image
 from pythonwin import win32ui
 from win32 import win32api, win32gui
 
-import cv2
-
 from ..type import Image, Rect
+from ..core._path import drag_path
+from ..backend import CaptureSource, WindowCapture
 
 
 def handle_list() -> List[int]:
@@ -40,6 +39,23 @@ def child_handle_list(hwnd: int) -> List[int]:
     win32gui.EnumChildWindows(hwnd, enum, out)
     return out
 
+def direct_children(hwnd: int) -> Iterator[int]:
+    """직계 자식 핸들을 하나씩 가져옴
+
+    ``GetWindow`` 로 형제 윈도우를 따라가므로 전체 자손을 열거하지
+    않습니다.
+
+    Args:
+        hwnd: 부모 윈도우 핸들
+
+    Returns:
+        자식핸들 ID 반복자
+    """
+    child = win32gui.GetWindow(hwnd, 5)  # GW_CHILD
+    while child:
+        yield child
+        child = win32gui.GetWindow(child, 2)  # GW_HWNDNEXT
+
 def is_active_gui(hwnd: int) -> bool:
     """핸들이 감지할 수 있는 GUI를 가지고 있는지\
     확인합니다."""
@@ -56,12 +72,23 @@ def window_text(hwnd: int) -> str:
     Returns:
         윈도우 이름
     """
-    txt: str = win32gui.GetWindowText(hwnd).strip()
-    if txt:
-        return win32gui.GetWindowText(hwnd)
+    txt: str = win32gui.GetWindowText(hwnd)
+    if txt.strip():
+        return txt
     else:
         return "({})".format(hwnd)
 
+def window_class(hwnd: int) -> str:
+    """핸들로부터 윈도우 클래스 이름을 가져옴
+
+    Args:
+        hwnd: 윈도우 핸들
+
+    Returns:
+        윈도우 클래스 이름
+    """
+    return win32gui.GetClassName(hwnd)
+
 def window_rect(hwnd: int) -> 'autowinpy.type.Rect':
     """핸들로부터 윈도우 사각영역 좌표를 가져옴
 
@@ -73,6 +100,78 @@ def window_rect(hwnd: int) -> 'autowinpy.type.Rect':
     """
     return Rect(*win32gui.GetWindowRect(hwnd))
 
+class GdiSource(CaptureSource):
+    """GDI 윈도우 캡처 원본
+
+    DC와 비트맵을 프레임마다 만들지 않고 유지하며, 윈도우 크기가
+    바뀔 때만 다시 만듭니다. 픽셀은 ``GetBitmapBits`` 로 버퍼에
+    직접 복사합니다.
+
+    Args:
+        hwnd: 윈도우 핸들
+    """
+
+    __module__ = 'autowinpy.win32'
+
+    def __init__(self, hwnd: int):
+        """초기화"""
+        self._hwnd: int = hwnd
+        self._size: Tuple[int, int] = None
+        self._window_dc = None
+        self._dc_hwnd = None
+        self._new_dc = None
+        self._bitmap = None
+
+    def size(self) -> Tuple[int, int]:
+        """현재 윈도우 크기"""
+        return window_rect(self._hwnd).size
+
+    def _setup(self, width: int, height: int):
+        """크기에 맞는 DC와 비트맵 생성"""
+        self.close()
+        self._window_dc = win32gui.GetWindowDC(self._hwnd)
+        self._dc_hwnd = win32ui.CreateDCFromHandle(self._window_dc)
+        self._new_dc = self._dc_hwnd.CreateCompatibleDC()
+        # bitmap object create & select
+        self._bitmap = win32ui.CreateBitmap()
+        self._bitmap.CreateCompatibleBitmap(self._dc_hwnd, width, height)
+        self._new_dc.SelectObject(self._bitmap)
+        self._size = (width, height)
+
+    def read_into(self, buffer: numpy.ndarray):
+        """윈도우를 캡처해 BGRX 픽셀을 버퍼에 씁니다."""
+        height, width = buffer.shape[:2]
+        if self._size != (width, height):
+            self._setup(width, height)
+        # capturing window
+        windll.user32.PrintWindow(self._hwnd, self._new_dc.GetSafeHdc(), 0x2)
+        windll.gdi32.GetBitmapBits(
+            self._bitmap.GetHandle(), buffer.nbytes, buffer.ctypes.data_as(c_void_p))
+
+    def close(self):
+        """DC와 비트맵 해제"""
+        if self._bitmap is not None:
+            win32gui.DeleteObject(self._bitmap.GetHandle())
+            self._dc_hwnd.DeleteDC()
+            self._new_dc.DeleteDC()
+            win32gui.ReleaseDC(self._hwnd, self._window_dc)
+        self._window_dc = self._dc_hwnd = self._new_dc = self._bitmap = None
+        self._size = None
+
+def window_capture(hwnd: int) -> WindowCapture:
+    """윈도우 캡처 객체 생성
+
+    프레임마다 GDI 객체와 배열을 새로 만들지 않으므로, 같은 윈도우를
+    반복해서 캡처할 때 사용합니다.
+
+    Args:
+        hwnd: 윈도우 핸들
+
+    Returns:
+        :class:`WindowCapture` 캡처 객체
+    """
+    return WindowCapture(GdiSource(hwnd))
+
 def window_array(hwnd: int) -> Image:
     """윈도우 이미지를 배열 형태로 가져옴
 
@@ -82,29 +181,8 @@ def window_array(hwnd: int) -> Image:
     Return:
         윈도우 이미지 배열
     """
-    rect: Rect = window_rect(hwnd)
-    window_dc = win32gui.GetWindowDC(hwnd)
-    dc_hwnd = win32ui.CreateDCFromHandle(window_dc)
-    new_dc = dc_hwnd.CreateCompatibleDC()
-    # bitmap object create & select
-    bitmap = win32ui.CreateBitmap()
-    bitmap.CreateCompatibleBitmap(dc_hwnd, rect.width, rect.height)
-    new_dc.SelectObject(bitmap)
-    # capturing window
-    windll.user32.PrintWindow(hwnd, new_dc.GetSafeHdc(), 0x2)
-    # formating image
-    bitmap_array = numpy.asarray(bitmap.GetBitmapBits(), dtype='uint8')
-
-    bmp_pil = pil_Image.frombuffer(
-        'RGB', (rect.width, rect.height), bitmap_array, 'raw', 'BGRX', 0, 1)
-    img = numpy.array(bmp_pil)
-    img = cv2.cvtColor(img, cv2.COLOR_RGB2BGR)
-    # close DC
-    win32gui.DeleteObject(bitmap.GetHandle())
-    dc_hwnd.DeleteDC()
-    new_dc.DeleteDC()
-    win32gui.ReleaseDC(hwnd, window_dc)
-    return Image(img)
+    with window_capture(hwnd) as capture:
+        return capture.capture(copy=True)
 
 def post_cilck(hwnd: int, x: int, y: int):
     """핸들로 클릭 메시지 전송
@@ -120,7 +198,8 @@ def post_cilck(hwnd: int, x: int, y: int):
     win32api.PostMessage(hwnd, 0x0202, 0x0000, lParam)
     sleep(0.01)
 
-def post_drag(hwnd: int, x0: int, y0: int, x1: int, y1: int, dtime: float=0.01):
+def post_drag(hwnd: int, x0: int, y0: int, x1: int, y1: int, dtime: float=0.01,
+              max_points: int=None):
     """핸들로 드래그 메시지 전송
     
     Args:
@@ -130,15 +209,13 @@ def post_drag(hwnd: int, x0: int, y0: int, x1: int, y1: int, dtime: float=0.01):
         x1: 드래그를 끝낼 x 좌표
         y1: 드래그를 끝낼 y 좌표
         dtime: 이동 스탭별 시간 간격. 기본값 ``0.01`` (초)
+        max_points: [선택] 이동 메시지 최대 수
     """
-    lParam = lambda x, y: x | y << 16
-    distance = int(numpy.sqrt(pow(abs(x1-x0), 2) + pow(abs(y1-y0), 2)) / 3)
-    position = numpy.linspace(x0, x1, distance), numpy.linspace(y0, y1, distance)
-    win32api.PostMessage(hwnd, 0x0201, 0x0001, lParam(x0, y0))
+    lparams = drag_path(x0, y0, x1, y1, max_points=max_points).tolist()
+    win32api.PostMessage(hwnd, 0x0201, 0x0001, lparams[0])
     sleep(dtime)
-    for x, y in zip(*position):
-        x, y = int(x), int(y)
-        win32api.PostMessage(hwnd, 0x0200, 0x0001, lParam(x, y))
+    for lParam in lparams:
+        win32api.PostMessage(hwnd, 0x0200, 0x0001, lParam)
         sleep(dtime)
-    win32api.PostMessage(hwnd, 0x0202, 0x0000, lParam(x1, y1))
+    win32api.PostMessage(hwnd, 0x0202, 0x0000, lparams[-1])
     sleep(dtime)
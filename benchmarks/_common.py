@@ -0,0 +1,230 @@
+"""벤치마크 공통 도구
+
+모든 벤치마크 스크립트가 먼저 불러오는 모듈입니다. 저장소 루트를
+``sys.path`` 앞에 넣으므로 ``PYTHONPATH`` 없이 어느 디렉터리에서나
+
+    python benchmarks/<script>.py [--quick] [--filter REGEX]
+
+로 실행하면 설치된 패키지 대신 작업 트리의 ``autowinpy`` 를 측정합니다.
+
+각 스크립트는 ``cases(quick)`` 로 ``(이름, 종류, 준비 함수)`` 항목을
+출력하고, ``suite.py`` 는 이 항목을 모아 한 번에 측정합니다. 종류는
+
+- ``latency``: 준비 함수가 출력한 함수의 호출당 시간(ms)
+- ``fps``: 준비 함수가 출력한 함수를 반복한 처리량(frames/s)
+- ``group``: 준비 함수가 출력한 함수가 ``{접미사: 결과}`` 를 직접 출력
+
+입니다.
+"""
+import argparse
+import os
+import re
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import cv2
+import numpy
+
+import autowinpy as awp
+
+SCREENS = {"720p": (1280, 720), "1080p": (1920, 1080),
+           "1440p": (2560, 1440), "4k": (3840, 2160)}
+SPRITES = (20, 64, 150, 300)
+QUICK_SCREENS = ("720p", "1080p")
+QUICK_SPRITES = (20, 64)
+
+
+def rng(seed: int = 0) -> numpy.random.Generator:
+    """시드를 고정한 난수 생성기"""
+    return numpy.random.default_rng(seed)
+
+
+def noise(width: int, height: int, channels: int = 3, seed: int = 0) -> awp.type.Image:
+    """균일 난수 이미지"""
+    return awp.type.Image(rng(seed).integers(
+        0, 256, (height, width, channels), dtype=numpy.uint8))
+
+
+def make_screen(width: int, height: int, seed: int = 0) -> numpy.ndarray:
+    """노이즈와 그라디언트를 섞은 BGR 스크린"""
+    base = rng(seed).integers(0, 64, (height, width, 3), dtype=numpy.uint8)
+    ramp = numpy.linspace(0, 191, width, dtype=numpy.uint8)[None, :, None]
+    return base + ramp
+
+
+def make_sprite(size: int, alpha: bool, seed: int = 1) -> numpy.ndarray:
+    """무늬가 있는 스프라이트, ``alpha`` 이면 원형 투명 채널을 가진 BGRA"""
+    sprite = rng(seed + size).integers(0, 256, (size, size, 3), dtype=numpy.uint8)
+    if not alpha:
+        return sprite
+    yy, xx = numpy.mgrid[:size, :size]
+    r = size / 2
+    inside = (xx - r + 0.5) ** 2 + (yy - r + 0.5) ** 2 <= r * r
+    alpha_channel = numpy.where(inside, 255, 0).astype(numpy.uint8)
+    return numpy.dstack([sprite, alpha_channel])
+
+
+def paste(screen: numpy.ndarray, sprite: numpy.ndarray, x: int, y: int):
+    """스크린에 스프라이트를 붙입니다 (투명 부분 제외)"""
+    h, w = sprite.shape[:2]
+    area = screen[y:y + h, x:x + w]
+    if sprite.shape[2] == 4:
+        inside = sprite[..., 3] > 0
+        area[inside] = sprite[..., :3][inside]
+    else:
+        area[...] = sprite
+
+
+def template(image: numpy.ndarray, name: str = "sprite", **config) -> awp.Template:
+    """파일 없이 만든 :class:`Template`, 이미지는 복사해 보관합니다."""
+    return awp.Template(path=name, image=numpy.array(image), **config)
+
+
+def template_set(images: list, prefix: str = "sprite") -> awp.TemplateSet:
+    """이미지마다 ``<prefix>_N`` 이름의 탬플릿을 등록한 :class:`TemplateSet`"""
+    names = ["{}_{}".format(prefix, i) for i in range(len(images))]
+    return awp.TemplateSet({
+        name: template(image, name) for name, image in zip(names, images)})
+
+
+def make_template(size: int, alpha: bool, **config) -> awp.Template:
+    """:func:`make_sprite` 로 만든 :class:`Template`"""
+    name = "sprite_{}{}".format(size, "_alpha" if alpha else "")
+    return template(make_sprite(size, alpha), name, **config)
+
+
+def crops(screen: numpy.ndarray, count: int, size: int, seed: int = 1) -> list:
+    """스크린의 임의 위치에서 잘라낸 ``size`` 정사각형 ``count`` 개"""
+    height, width = screen.shape[:2]
+    generator = rng(seed)
+    result = []
+    for _ in range(count):
+        x = int(generator.integers(0, width - size))
+        y = int(generator.integers(0, height - size))
+        result.append(numpy.array(screen[y:y + size, x:x + size]))
+    return result
+
+
+def write_images(directory: str, images: list, prefix: str = "sprite") -> list:
+    """이미지를 ``<prefix>_NNN.png`` 로 저장하고 경로 목록 출력"""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for i, image in enumerate(images):
+        path = os.path.join(directory, "{}_{:03d}.png".format(prefix, i))
+        cv2.imwrite(path, image)
+        paths.append(path)
+    return paths
+
+
+def temporary_directory() -> tempfile.TemporaryDirectory:
+    """벤치마크용 임시 디렉터리"""
+    return tempfile.TemporaryDirectory(prefix="awp-bench-")
+
+
+def result(value: float, unit: str, higher_is_better: bool, **extra) -> dict:
+    """결과 항목"""
+    return dict(value=value, unit=unit, higher_is_better=higher_is_better, **extra)
+
+
+# 모든 결과에 있거나 측정 방법을 나타내는 키, 출력에서 생략
+_RESULT_KEYS = ("value", "unit", "higher_is_better", "min", "number", "frames")
+
+
+def measure(func, min_time: float, repeat: int) -> dict:
+    """호출당 시간(ms) 통계
+
+    표본마다 ``min_time`` 을 넘도록 반복 횟수를 정하고, ``repeat`` 개
+    표본의 중앙값과 최솟값을 출력합니다.
+    """
+    func()  # 준비
+    number, elapsed = 1, 0.0
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 16:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return result(statistics.median(samples) * 1e3, "ms", False,
+                  min=min(samples) * 1e3, number=number)
+
+
+def sustained(func, duration: float) -> dict:
+    """``duration`` 초 동안 반복한 처리량(frames/s)"""
+    func()  # 준비
+    frames, start = 0, time.perf_counter()
+    while time.perf_counter() - start < duration:
+        func()
+        frames += 1
+    elapsed = time.perf_counter() - start
+    return result(frames / elapsed, "frames/s", True, frames=frames)
+
+
+def run_cases(cases, args) -> dict:
+    """항목을 측정하고 한 줄씩 출력
+
+    Args:
+        cases: ``(이름, 종류, 준비 함수)`` 반복자
+        args: ``filter``, ``min_time``, ``repeat``, ``duration`` 을 가진 인수
+
+    Returns:
+        ``{이름: 결과}``
+    """
+    pattern = re.compile(args.filter) if args.filter else None
+    results = {}
+    for name, kind, setup in cases:
+        if pattern is not None and not pattern.search(name):
+            continue
+        func = setup()
+        if kind == "group":
+            measured = {"{}/{}".format(name, k): v for k, v in func().items()}
+        elif kind == "fps":
+            measured = {name: sustained(func, args.duration)}
+        else:
+            measured = {name: measure(func, args.min_time, args.repeat)}
+        for key, value in measured.items():
+            extra = ", ".join("{}={}".format(k, v) for k, v in value.items()
+                              if k not in _RESULT_KEYS)
+            print("{:<44} {:>10.3f} {:<9} {}".format(
+                key, value["value"], value["unit"], extra).rstrip())
+        sys.stdout.flush()
+        results.update(measured)
+    return results
+
+
+def add_run_arguments(parser: argparse.ArgumentParser):
+    """측정 옵션 추가"""
+    parser.add_argument("--quick", action="store_true",
+                        help="작은 입력만 측정")
+    parser.add_argument("--filter", default=None, help="항목 이름 정규표현식")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="표본당 최소 시간(초)")
+    parser.add_argument("--duration", type=float, default=2.0,
+                        help="처리량 측정 시간(초)")
+
+
+def main(cases, doc: str) -> dict:
+    """스크립트 하나의 항목을 측정합니다
+
+    Args:
+        cases: ``cases(quick)`` 함수
+        doc: 도움말 첫 줄로 사용할 모듈 문서
+    """
+    parser = argparse.ArgumentParser(description=doc.splitlines()[0])
+    add_run_arguments(parser)
+    args = parser.parse_args()
+    return run_cases(cases(args.quick), args)
@@ -0,0 +1,55 @@
+"""캡처 디코딩 벤치마크
+
+``BytesSource`` 의 BGRX 프레임으로, PIL을 거치던 기존 디코딩 경로와
+버퍼를 재사용하는 :class:`WindowCapture` 의 프레임당 시간을
+해상도별로 비교합니다. 윈도우 없이 실행할 수 있습니다.
+"""
+import cv2
+import numpy
+
+import _common  # autowinpy 보다 먼저: 저장소 경로 설정
+from autowinpy.backend import BytesSource, WindowCapture
+
+
+def legacy_decode(raw: bytes, width: int, height: int) -> numpy.ndarray:
+    """GetBitmapBits -> numpy -> PIL -> numpy -> cvtColor 경로"""
+    from PIL import Image as pil_Image
+    bitmap_array = numpy.asarray(bytearray(raw), dtype='uint8')
+    bmp_pil = pil_Image.frombuffer(
+        'RGB', (width, height), bitmap_array, 'raw', 'BGRX', 0, 1)
+    img = numpy.array(bmp_pil)
+    return cv2.cvtColor(img, cv2.COLOR_RGB2BGR)
+
+
+def _capture(width: int, height: int):
+    """BGRX 프레임 하나를 반복하는 캡처와 원본 바이트"""
+    screen = _common.make_screen(width, height)
+    raw = numpy.dstack([screen, numpy.zeros_like(screen[..., :1])]).tobytes()
+    return raw, WindowCapture(BytesSource(width, height, [raw]))
+
+
+def cases(quick: bool):
+    """(이름, 종류, 준비 함수) 목록"""
+    screens = _common.QUICK_SCREENS if quick else ("720p", "1080p", "4k")
+    for label in screens:
+        width, height = _common.SCREENS[label]
+
+        def legacy(width=width, height=height):
+            raw, capture = _capture(width, height)
+            assert numpy.array_equal(legacy_decode(raw, width, height), capture.capture())
+            return lambda: legacy_decode(raw, width, height)
+
+        def copy(width=width, height=height):
+            capture = _capture(width, height)[1]
+            return lambda: capture.capture(copy=True)
+
+        def reuse(width=width, height=height):
+            return _capture(width, height)[1].capture
+
+        yield "capture.decode_legacy/{}".format(label), "latency", legacy
+        yield "capture.decode_copy/{}".format(label), "latency", copy
+        yield "capture.decode/{}".format(label), "latency", reuse
+
+
+if __name__ == "__main__":
+    _common.main(cases, __doc__)
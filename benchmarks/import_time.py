@@ -0,0 +1,79 @@
+"""import 시간 벤치마크
+
+``python -X importtime`` 으로 ``import autowinpy`` 의 누적 import 시간을
+측정합니다. ``--max-ms`` 를 지정하면 중앙값이 이를 넘을 때 종료 코드
+1을 돌려주므로 회귀 검사에 사용할 수 있습니다.
+
+    python import_time.py [--repeat 7] [--max-ms 20]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+import _common  # 저장소 경로
+
+CASES = (
+    ("import autowinpy", "import autowinpy"),
+    ("autowinpy.Template", "import autowinpy; autowinpy.Template"),
+    ("autowinpy.atk.image_tk", "import autowinpy; autowinpy.atk.image_tk"),
+)
+
+
+def import_time(code: str) -> float:
+    """새 인터프리터에서 ``code`` 를 실행하고 누적 import 시간(ms)
+
+    ``autowinpy`` 이후에 최상위에서 일어난 모든 import(지연 import 포함)의
+    누적 시간을 더합니다.
+    """
+    env = dict(os.environ, PYTHONPATH=_common.ROOT)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    total, started = 0, False
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2][1:]
+        started = started or name == "autowinpy"
+        if started and not name.startswith(" "):
+            total += int(parts[1])
+    return total / 1e3
+
+
+def import_times(repeat: int) -> dict:
+    """항목별 누적 import 시간(ms)의 중앙값과 최솟값"""
+    results = {}
+    for label, code in CASES:
+        times = [import_time(code) for _ in range(repeat)]
+        results[label] = _common.result(
+            statistics.median(times), "ms", False, min=min(times))
+    return results
+
+
+def cases(quick: bool):
+    """(이름, 종류, 준비 함수) 목록"""
+    repeat = 3 if quick else 7
+    yield "import", "group", lambda: lambda: import_times(repeat)
+
+
+def main():
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="import autowinpy 중앙값 상한(ms)")
+    args = parser.parse_args()
+    results = import_times(args.repeat)
+    for label, result in results.items():
+        print("{:<24} {:8.1f} ms (min {:.1f})".format(label, result["value"], result["min"]))
+    if args.max_ms is not None and results["import autowinpy"]["value"] > args.max_ms:
+        print("regression: import autowinpy > {} ms".format(args.max_ms))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""매칭 서버 부하 테스트
+
+:class:`MatchServer` 를 띄우고 여러 클라이언트 프로세스가 동시에
+스크린을 보내 탐색할 때의 처리량(frames/s)과 요청 지연 시간의
+백분위수(p50, p90, p99)를 측정합니다. 같은 탬플릿을 한 프로세스에서
+:class:`TemplateSet` 으로 탐색하는 경우를 기준으로 함께 출력합니다.
+
+    python match_server.py [--clients 4] [--frames 50] [--templates 40]
+                           [--workers N] [--width 1280 --height 720]
+"""
+import argparse
+import multiprocessing
+import os
+import time
+
+import numpy
+
+import _common  # autowinpy 보다 먼저: 저장소 경로 설정
+import autowinpy as awp
+
+
+def _client(address, authkey, width, height, frames, barrier, queue):
+    """클라이언트 프로세스: 요청별 지연 시간(초) 목록을 보냅니다"""
+    screen = _common.noise(width, height)
+    latencies = []
+    with awp.MatchClient(address, authkey) as client:
+        client.screen_search(screen)  # 공유 메모리 준비
+        barrier.wait()
+        for _ in range(frames):
+            start = time.perf_counter()
+            client.screen_search(screen)
+            latencies.append(time.perf_counter() - start)
+    queue.put(latencies)
+
+
+def _latency(latencies, **extra) -> dict:
+    """처리량(frames/s)과 지연 시간 백분위수(ms)"""
+    p50, p90, p99 = numpy.percentile(numpy.asarray(latencies) * 1e3, [50, 90, 99])
+    return _common.result(len(latencies) / sum(latencies), "frames/s", True,
+                          p50=round(p50, 1), p90=round(p90, 1), p99=round(p99, 1), **extra)
+
+
+def load_test(clients: int = 4, frames: int = 50, templates: int = 40, size: int = 48,
+              workers: int = None, width: int = 1280, height: int = 720) -> dict:
+    """한 프로세스 탐색(local)과 매칭 서버(server)의 처리량"""
+    screen = _common.noise(width, height)
+    with _common.temporary_directory() as tmp:
+        source = os.path.join(tmp, "png")
+        _common.write_images(source, _common.crops(screen, templates, size))
+        library = awp.TemplateLibrary.build(source, os.path.join(tmp, "library"))
+
+        # 기준: 한 프로세스에서 TemplateSet 으로 탐색
+        template_set = library.template_set()
+        template_set.screen_search(screen)
+        baseline = []
+        for _ in range(min(frames, 20)):
+            start = time.perf_counter()
+            template_set.screen_search(screen)
+            baseline.append(time.perf_counter() - start)
+
+        ctx = multiprocessing.get_context("spawn")
+        with awp.MatchServer(library, workers) as server:
+            barrier = ctx.Barrier(clients + 1)
+            queue = ctx.Queue()
+            procs = [ctx.Process(target=_client, args=(
+                server.address, server.authkey, width, height, frames, barrier, queue))
+                for _ in range(clients)]
+            for proc in procs:
+                proc.start()
+            barrier.wait()
+            start = time.perf_counter()
+            latencies = []
+            for _ in procs:
+                latencies += queue.get()
+            elapsed = time.perf_counter() - start
+            for proc in procs:
+                proc.join()
+            stats = server.stats
+            workers = server.workers
+    server = _latency(latencies, clients=clients, workers=workers,
+                      requests=stats["requests"], errors=stats["errors"])
+    # 여러 클라이언트가 동시에 보내므로 처리량은 전체 시간 기준
+    server["value"] = clients * frames / elapsed
+    return {"local": _latency(baseline), "server": server}
+
+
+def cases(quick: bool):
+    """(이름, 종류, 준비 함수) 목록"""
+    config = dict(clients=2, frames=10, templates=10) if quick else {}
+    yield ("match_server/720p/{}".format(config.get("templates", 40)), "group",
+           lambda: lambda: load_test(**config))
+
+
+def main():
+    """부하 테스트 실행"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--frames", type=int, default=50)
+    parser.add_argument("--templates", type=int, default=40)
+    parser.add_argument("--size", type=int, default=48)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    args = parser.parse_args()
+    for key, value in load_test(**vars(args)).items():
+        print("{:<8} {:8.1f} frames/s  p50 {} / p90 {} / p99 {} ms".format(
+            key, value["value"], value["p50"], value["p90"], value["p99"]))
+
+
+if __name__ == "__main__":
+    main()
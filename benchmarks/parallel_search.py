@@ -0,0 +1,45 @@
+"""병렬 탬플릿 탐색 벤치마크
+
+합성 스크린에서 :class:`SearchExecutor` 의 작업 스레드 수(1/2/4/8)에
+따른 탬플릿 분배(``screen_search``)와 띠 분할(``tile_search``)
+처리 시간을 비교합니다.
+"""
+import _common  # autowinpy 보다 먼저: 저장소 경로 설정
+import autowinpy as awp
+
+
+def _starts(results):
+    return {n: (f, r.start) for n, (f, r, _) in results.items()}
+
+
+def _templates(workers: int, count: int):
+    """탬플릿 분배 탐색 함수"""
+    screen = _common.noise(1920, 1080)
+    templates = _common.template_set(_common.crops(screen, count, 40))
+    executor = awp.SearchExecutor(workers)
+    assert _starts(executor.screen_search(templates, screen)) == _starts(
+        templates.screen_search(screen))
+    return lambda: executor.screen_search(templates, screen)
+
+
+def _tiles(workers: int):
+    """4K 띠 분할 탐색 함수"""
+    big = _common.noise(3840, 2160, seed=1)
+    single = _common.template(big[1500:1600, 3000:3100], "big")
+    executor = awp.SearchExecutor(workers)
+    assert executor.tile_search(single, big)[1].start == (3000, 1500)
+    return lambda: executor.tile_search(single, big)
+
+
+def cases(quick: bool):
+    """(이름, 종류, 준비 함수) 목록"""
+    count = 8 if quick else 16
+    for workers in ((1, 2) if quick else (1, 2, 4, 8)):
+        yield ("search_executor.templates/1080p/w{}".format(workers), "latency",
+               lambda workers=workers: _templates(workers, count))
+        yield ("search_executor.tiles/4k/w{}".format(workers), "latency",
+               lambda workers=workers: _tiles(workers))
+
+
+if __name__ == "__main__":
+    _common.main(cases, __doc__)
@@ -0,0 +1,37 @@
+"""계측 비용 벤치마크
+
+작은 스크린에서 :class:`TemplateSet` 탐색을 반복하며 계측을 끈 경우와
+켠 경우의 프레임 시간을 비교합니다. 직접 실행하면 켠 상태의 보고서도
+출력합니다.
+"""
+import _common  # autowinpy 보다 먼저: 저장소 경로 설정
+import autowinpy as awp
+
+
+def _search(enabled: bool):
+    """탬플릿 10개 탐색 함수, ``enabled`` 면 계측을 켠 상태로 실행"""
+    screen = _common.noise(320, 240)
+    template_set = _common.template_set(_common.crops(screen, 10, 24))
+
+    def search():
+        if not enabled:
+            return template_set.screen_search(screen)
+        awp.profiler.enable()
+        try:
+            return template_set.screen_search(screen)
+        finally:
+            awp.profiler.disable()
+    awp.profiler.reset()
+    return search
+
+
+def cases(quick: bool):
+    """(이름, 종류, 준비 함수) 목록"""
+    yield "profiler.disabled/320x240", "latency", lambda: _search(False)
+    yield "profiler.enabled/320x240", "latency", lambda: _search(True)
+
+
+if __name__ == "__main__":
+    _common.main(cases, __doc__)
+    print()
+    print(awp.profiler.report())
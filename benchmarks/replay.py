@@ -0,0 +1,77 @@
+"""프레임 녹화/재생 벤치마크
+
+고정된 배경 위로 스프라이트가 움직이는 합성 프레임을
+:class:`FrameRecorder` 로 기록하고, 파일 크기와 프레임당 기록 시간,
+:class:`FrameReplay` 의 순차 재생 fps 와 시각 기반 임의 접근 시간을
+측정합니다. 마지막으로 재생 프레임에서 탬플릿을 찾는 오프라인 탐색이
+녹화 속도(30 fps)보다 몇 배 빠른지 출력합니다.
+"""
+import os
+import time
+
+import numpy
+
+import _common  # autowinpy 보다 먼저: 저장소 경로 설정
+import autowinpy as awp
+
+
+def replay(count: int, width: int, height: int, fps: float = 30.0) -> dict:
+    """녹화와 재생 결과"""
+    rng = _common.rng()
+    background = (numpy.linspace(0, 255, width, dtype=numpy.uint8)[None, :, None]
+                  .repeat(height, 0).repeat(3, 2))
+    sprite = rng.integers(0, 256, (48, 48, 3), dtype=numpy.uint8)
+
+    def frame(i: int) -> numpy.ndarray:
+        f = background.copy()
+        x = 20 + (i * 13) % (width - 100)
+        f[height // 2:height // 2 + 48, x:x + 48] = sprite
+        return f
+
+    frames = [frame(i) for i in range(count)]
+    with _common.temporary_directory() as tmp:
+        path = os.path.join(tmp, "frames.awpr")
+        start = time.perf_counter()
+        with awp.FrameRecorder(path) as recorder:
+            for i, f in enumerate(frames):
+                recorder.write(f, i / fps)
+            ratio = recorder.compression_ratio
+        record = (time.perf_counter() - start) / count
+        size = os.path.getsize(path)
+
+        with awp.FrameReplay(path) as replay:
+            start = time.perf_counter()
+            for _ in range(count):
+                replay.image_array()
+            sequential = (time.perf_counter() - start) / count
+            stamps = rng.uniform(0, replay.duration, 30)
+            start = time.perf_counter()
+            for t in stamps:
+                replay.at(t)
+            random_access = (time.perf_counter() - start) / len(stamps)
+            assert numpy.array_equal(replay.at(stamps[0]), frames[replay.index_at(stamps[0])])
+
+            template_set = awp.TemplateSet({"sprite": _common.template(sprite)})
+            replay.seek(0)
+            start = time.perf_counter()
+            for _ in range(count):
+                template_set.screen_search(replay.image_array())
+            offline = time.perf_counter() - start
+    return {
+        "record": _common.result(record * 1e3, "ms", False,
+                                 file_mb=round(size / 2**20, 2), ratio=round(ratio, 4)),
+        "sequential": _common.result(1 / sequential, "frames/s", True),
+        "seek": _common.result(random_access * 1e3, "ms", False),
+        "offline": _common.result(count / fps / offline, "x", True),
+    }
+
+
+def cases(quick: bool):
+    """(이름, 종류, 준비 함수) 목록"""
+    label, count = ("720p", 30) if quick else ("1080p", 120)
+    yield ("replay/{}".format(label), "group",
+           lambda: lambda: replay(count, *_common.SCREENS[label]))
+
+
+if __name__ == "__main__":
+    _common.main(cases, __doc__)
@@ -0,0 +1,177 @@
+"""핫 경로 벤치마크 모음
+
+각 벤치마크 스크립트의 ``cases(quick)`` 항목과 이 모듈의 항목(이미지
+변환, 캡처부터 탐색까지 반복하는 지속 처리량)을 한 번에 측정해 결과
+파일로 저장합니다. 윈도우 없이(리눅스 포함) 실행되며 난수 시드가
+고정되어 있습니다. 스크립트 하나만 측정하려면 해당 스크립트를 직접
+실행합니다.
+
+    python suite.py run [-o results.json] [--quick] [--filter REGEX]
+    python suite.py compare base.json new.json [--threshold 10]
+
+``compare`` 는 두 결과 파일의 같은 항목을 비교해 ``threshold`` (%)
+이상 느려진 항목을 표시하고, 하나라도 있으면 종료 코드 1을 돌려줍니다.
+"""
+import argparse
+import importlib
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import cv2
+import numpy
+
+import _common  # autowinpy 보다 먼저: 저장소 경로 설정
+import autowinpy as awp
+from autowinpy.backend import BytesSource, WindowCapture
+
+# 항목을 모을 벤치마크 스크립트
+ENTRIES = (
+    "capture_decode", "template_mask", "template_cache", "template_area",
+    "template_set", "template_pyramid", "template_library", "parallel_search",
+    "profiler_overhead", "replay", "match_server", "import_time",
+)
+
+
+def cases(quick: bool):
+    """이 모듈의 (이름, 종류, 준비 함수) 목록
+
+    준비 함수는 측정할 함수를 출력합니다. 큰 입력은 해당 항목을
+    측정할 때만 만듭니다.
+    """
+    screens = _common.QUICK_SCREENS if quick else tuple(_common.SCREENS)
+
+    for label in screens:
+        width, height = _common.SCREENS[label]
+
+        def grayscale(width=width, height=height):
+            screen = awp.type.Image(_common.make_screen(width, height))
+            return lambda: screen.grayscale
+
+        def resize(width=width, height=height):
+            screen = awp.type.Image(_common.make_screen(width, height))
+            return lambda: screen.size(width // 2)
+
+        yield "image.grayscale/{}".format(label), "latency", grayscale
+        yield "image.size/{}".format(label), "latency", resize
+
+    for label in screens:
+        width, height = _common.SCREENS[label]
+
+        def pipeline(width=width, height=height):
+            # 캡처 -> 회색조 -> 탬플릿 8개 탐색
+            screen = _common.make_screen(width, height)
+            templates = awp.TemplateSet()
+            for i, size in enumerate((20, 32, 48, 64) * 2):
+                alpha = i >= 4
+                sprite = _common.make_sprite(size, alpha, seed=i)
+                _common.paste(screen, sprite, (i + 1) * width // 10, height // 2)
+                templates.add("s{}".format(i), _common.template(sprite, "s{}".format(i)))
+            bgrx = numpy.dstack([screen, numpy.zeros_like(screen[..., :1])]).tobytes()
+            capture = WindowCapture(BytesSource(width, height, [bgrx]))
+            return lambda: templates.screen_search(capture.capture())
+
+        yield "pipeline.fps/{}".format(label), "fps", pipeline
+
+
+def all_cases(quick: bool):
+    """이 모듈과 ``ENTRIES`` 스크립트의 모든 항목"""
+    modules = [importlib.import_module(name) for name in ENTRIES]
+    return itertools.chain(cases(quick), *(module.cases(quick) for module in modules))
+
+
+def environment() -> dict:
+    """결과와 함께 저장할 실행 환경"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(__file__),
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            universal_newlines=True).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": numpy.__version__,
+        "opencv": cv2.__version__,
+        "autowinpy": awp.__version__,
+        "cv2_threads": cv2.getNumThreads(),
+    }
+
+
+def run(args) -> int:
+    """벤치마크 실행 후 결과 저장"""
+    results = _common.run_cases(all_cases(args.quick), args)
+    report = {"environment": environment(), "results": results}
+    with open(args.output, "w", encoding="utf8") as f:
+        json.dump(report, f, indent=1)
+    print("saved -> {}".format(args.output))
+    return 0
+
+
+def compare(args) -> int:
+    """두 결과 파일 비교"""
+    with open(args.base, encoding="utf8") as f:
+        base = json.load(f)
+    with open(args.new, encoding="utf8") as f:
+        new = json.load(f)
+    for key in ("commit", "platform", "cpu_count", "opencv"):
+        a, b = base["environment"].get(key), new["environment"].get(key)
+        if a != b:
+            print("note: {} differs ({} -> {})".format(key, a, b))
+    regressions = 0
+    print("{:<44} {:>12} {:>12} {:>8}".format("case", "base", "new", "change"))
+    for name, old in base["results"].items():
+        cur = new["results"].get(name)
+        if cur is None:
+            continue
+        # 양수가 나빠진 방향
+        if old["higher_is_better"]:
+            change = (old["value"] / cur["value"] - 1) * 100
+        else:
+            change = (cur["value"] / old["value"] - 1) * 100
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif change < -args.threshold:
+            flag = "  improved"
+        print("{:<44} {:>12.3f} {:>12.3f} {:>+7.1f}%{}".format(
+            name, old["value"], cur["value"], change, flag))
+    missing = sorted(set(base["results"]) ^ set(new["results"]))
+    if missing:
+        print("not compared: {}".format(", ".join(missing)))
+    print("{} regression(s) over {}%".format(regressions, args.threshold))
+    return 1 if regressions else 0
+
+
+def main():
+    """명령 실행"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command")
+    run_parser = commands.add_parser("run", help="벤치마크 실행")
+    run_parser.add_argument("-o", "--output", default="results.json")
+    _common.add_run_arguments(run_parser)
+    compare_parser = commands.add_parser("compare", help="두 결과 비교")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=10.0,
+                                help="회귀로 볼 변화율(%%)")
+    args = parser.parse_args()
+    if args.command == "run":
+        return run(args)
+    if args.command == "compare":
+        return compare(args)
+    parser.print_help()
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,26 @@
+"""스크린 영역 제한 벤치마크
+
+1920x1080 스크린의 오른쪽 아래 10% 영역에 있는 버튼을 찾을 때,
+전체 스크린 탐색과 ``screen_area`` 로 영역을 제한한 탐색의
+호출 시간을 비교합니다.
+"""
+import _common  # autowinpy 보다 먼저: 저장소 경로 설정
+
+
+def _search(**config):
+    """오른쪽 아래 버튼을 찾는 함수"""
+    screen = _common.noise(1920, 1080)
+    template = _common.template(screen[1010:1050, 1800:1880], "button", **config)
+    assert template.screen_search(screen)[1].start == (1800, 1010)
+    return lambda: template.screen_search(screen)
+
+
+def cases(quick: bool):
+    """(이름, 종류, 준비 함수) 목록"""
+    yield "template.area_full/1080p", "latency", _search
+    yield "template.area_corner/1080p", "latency", lambda: _search(
+        screen_area=[90, 90, 100, 100])
+
+
+if __name__ == "__main__":
+    _common.main(cases, __doc__)
@@ -0,0 +1,63 @@
+"""탬플릿 캐시 벤치마크
+
+합성 스크린에서 매 호출마다 탬플릿을 전처리하던 기존 경로와
+캐시된 전처리 데이터를 사용하는 :meth:`Template.screen_search`
+의 호출 시간을 비교하고, 해상도와 스프라이트 크기(투명 채널 유무)별
+:meth:`Template.screen_search` 호출 시간을 측정합니다.
+"""
+import cv2
+import numpy
+
+import _common  # autowinpy 보다 먼저: 저장소 경로 설정
+import autowinpy as awp
+
+
+def legacy_search(template: awp.Template, screen: awp.type.Image):
+    """매 호출마다 회색조 변환, 마스크, 리사이즈를 다시 수행하는 경로"""
+    screen_gray = screen.grayscale
+    template_gray = template.origin_image.grayscale
+    mask = template.mask(template.match_size)
+    if template.match_size[0] is not None:
+        template_gray = template_gray.size(*template.match_size)
+    match_data = cv2.matchTemplate(
+        screen_gray, template_gray, cv2.TM_CCOEFF_NORMED, mask=mask)
+    return cv2.minMaxLoc(match_data)
+
+
+def _resized(legacy: bool):
+    """720p 스크린에서 매칭 사이즈를 지정한 100px 탬플릿을 찾는 함수"""
+    screen = _common.noise(1280, 720)
+    sprite = numpy.dstack([
+        screen[300:400, 500:600],
+        numpy.full((100, 100), 255, dtype=numpy.uint8)])
+    template = _common.template(sprite, matched_width=100, matched_height=100)
+    if legacy:
+        return lambda: legacy_search(template, screen)
+    return lambda: template.screen_search(screen)
+
+
+def cases(quick: bool):
+    """(이름, 종류, 준비 함수) 목록"""
+    yield "template.search_legacy/720p/100px", "latency", lambda: _resized(True)
+    yield "template.search_cached/720p/100px", "latency", lambda: _resized(False)
+    screens = _common.QUICK_SCREENS if quick else tuple(_common.SCREENS)
+    sprites = _common.QUICK_SPRITES if quick else _common.SPRITES
+    for label in screens:
+        width, height = _common.SCREENS[label]
+        for size in sprites:
+            for alpha in (False, True):
+                def search(width=width, height=height, size=size, alpha=alpha):
+                    screen = _common.make_screen(width, height)
+                    _common.paste(screen, _common.make_sprite(size, alpha),
+                                  width // 3, height // 3)
+                    screen = awp.type.Image(screen)
+                    template = _common.make_template(size, alpha)
+                    assert template.screen_search(screen)[0]
+                    return lambda: template.screen_search(screen)
+
+                yield "template.screen_search/{}/{}px{}".format(
+                    label, size, "+alpha" if alpha else ""), "latency", search
+
+
+if __name__ == "__main__":
+    _common.main(cases, __doc__)
@@ -0,0 +1,87 @@
+"""탬플릿 라이브러리 벤치마크
+
+N개의 알파 채널 PNG 스프라이트를 준비할 때,
+
+- cold: PNG 마다 :class:`Template` 를 만들고 매칭 데이터를 준비하는 경우
+- warm: :class:`TemplateLibrary` 를 열고 모든 탬플릿의 매칭 데이터를
+  꺼내는 경우
+
+의 시간을 비교합니다. 두 경우 모두 결과 점수가 같은지도 확인합니다.
+"""
+import os
+import time
+
+import cv2
+import numpy
+
+import _common  # autowinpy 보다 먼저: 저장소 경로 설정
+import autowinpy as awp
+
+
+def _cold(paths, scales):
+    """PNG 디코딩과 준비"""
+    templates = []
+    for path in paths:
+        template = awp.Template(path=path)
+        for dsize in [None] + [template.scaled_size(s) for s in scales]:
+            template._prepare(cv2.TM_CCOEFF_NORMED, dsize=dsize)
+        templates.append(template)
+    return templates
+
+
+def _warm(library_path, scales):
+    """라이브러리 매핑"""
+    library = awp.TemplateLibrary(library_path)
+    templates = []
+    for name in library:
+        template = library[name]
+        for dsize in [None] + [template.scaled_size(s) for s in scales]:
+            template._prepare(cv2.TM_CCOEFF_NORMED, dsize=dsize)
+        templates.append(template)
+    return templates
+
+
+def library(count: int, size: int = 96, scales=(0.75, 1.25), repeat: int = 3) -> dict:
+    """라이브러리 생성, cold, warm 준비 시간"""
+    rng = _common.rng()
+    screen = _common.noise(1280, 720)
+    sprites = []
+    for _ in range(count):
+        sprite = rng.integers(0, 256, (size, size, 4), dtype=numpy.uint8)
+        sprite[..., 3] = 255
+        sprite[:size // 8, :, 3] = 0
+        sprites.append(sprite)
+    with _common.temporary_directory() as tmp:
+        source = os.path.join(tmp, "png")
+        paths = _common.write_images(source, sprites)
+        library_path = os.path.join(tmp, "library")
+        start = time.perf_counter()
+        awp.TemplateLibrary.build(source, library_path, scales)
+        build = time.perf_counter() - start
+
+        cold, warm = [], []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            old = _cold(paths, scales)
+            cold.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            new = _warm(library_path, scales)
+            warm.append(time.perf_counter() - start)
+        same = old[0]._search(screen)[2] == new[0]._search(screen)[2]
+        data = os.path.getsize(os.path.join(library_path, "data.bin"))
+    return {
+        "build": _common.result(build * 1e3, "ms", False, data_mb=round(data / 2**20, 1)),
+        "cold": _common.result(min(cold) * 1e3, "ms", False),
+        "warm": _common.result(min(warm) * 1e3, "ms", False, same_score=same),
+    }
+
+
+def cases(quick: bool):
+    """(이름, 종류, 준비 함수) 목록"""
+    count = 50 if quick else 300
+    yield ("template_library/{}x96px".format(count), "group",
+           lambda: lambda: library(count))
+
+
+if __name__ == "__main__":
+    _common.main(cases, __doc__)
@@ -0,0 +1,39 @@
+"""탬플릿 마스크 생성 벤치마크
+
+``numpy.vectorize`` 로 픽셀마다 파이썬 함수를 호출하던 기존 마스크
+생성과 배열 단위로 처리하는 :meth:`Template.mask` 의 생성 시간을
+스프라이트 크기별로 비교합니다.
+"""
+import numpy
+
+import _common  # autowinpy 보다 먼저: 저장소 경로 설정
+import autowinpy as awp
+
+
+def legacy_mask(template: awp.Template):
+    """픽셀 단위 파이썬 함수로 투명 채널을 마스크로 변환"""
+    mask_function = numpy.vectorize(
+        lambda x: 0 if x < 255 else 255, otypes=[numpy.uint8])
+    return mask_function(template.origin_image.channel(3))
+
+
+def cases(quick: bool):
+    """(이름, 종류, 준비 함수) 목록"""
+    sprites = _common.QUICK_SPRITES if quick else _common.SPRITES
+    for size in sprites:
+        def legacy(size=size):
+            template = _common.make_template(size, True)
+            assert numpy.array_equal(legacy_mask(template), template.mask())
+            return lambda: legacy_mask(template)
+
+        yield "template.mask_legacy/{}px+alpha".format(size), "latency", legacy
+        for alpha in (False, True):
+            def mask(size=size, alpha=alpha):
+                return _common.make_template(size, alpha, mask_color=(0, 0, 0)).mask
+
+            yield "template.mask/{}px{}".format(
+                size, "+alpha" if alpha else ""), "latency", mask
+
+
+if __name__ == "__main__":
+    _common.main(cases, __doc__)
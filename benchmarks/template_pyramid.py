@@ -0,0 +1,60 @@
+"""피라미드 매칭 벤치마크
+
+합성 장면에서 전체 해상도 탐색과 ``pyramid_levels`` 단계별 피라미드
+탐색의 호출 시간과 탐색 위치 일치율을 비교합니다.
+"""
+import time
+
+import cv2
+
+import _common  # autowinpy 보다 먼저: 저장소 경로 설정
+import autowinpy as awp
+
+
+def synthetic_scene(rng, width: int, height: int) -> awp.type.Image:
+    """부드러운 질감 위에 사각형을 흩뿌린 합성 장면"""
+    noise = rng.integers(0, 256, (height, width, 3), dtype="uint8")
+    scene = cv2.GaussianBlur(noise, (0, 0), 3)
+    for _ in range(40):
+        x, y = int(rng.integers(0, width)), int(rng.integers(0, height))
+        w, h = rng.integers(10, 120, 2)
+        color = tuple(int(c) for c in rng.integers(0, 256, 3))
+        cv2.rectangle(scene, (x, y), (x + int(w), y + int(h)), color, -1)
+    return awp.type.Image(scene)
+
+
+def pyramid(width: int, height: int, scenes: int) -> dict:
+    """단계 수별 탐색 시간(ms)과 일치한 장면 수"""
+    rng = _common.rng()
+    scenarios = []
+    for i in range(scenes):
+        screen = synthetic_scene(rng, width, height)
+        size = int(rng.integers(40, 200))
+        x, y = int(rng.integers(0, width - size)), int(rng.integers(0, height - size))
+        template = _common.template(screen[y:y + size, x:x + size], "sprite_{}".format(i))
+        scenarios.append((screen, template, (x, y)))
+    results = {}
+    for levels in (0, 1, 2, 3):
+        elapsed, matched = 0.0, 0
+        for screen, template, expected in scenarios:
+            template.configure(pyramid_levels=levels)
+            template.screen_search(screen)  # 캐시 준비
+            start = time.perf_counter()
+            found, rect = template.screen_search(screen)
+            elapsed += time.perf_counter() - start
+            matched += found and rect.start == expected
+        results["L{}".format(levels)] = _common.result(
+            elapsed / scenes * 1e3, "ms", False, matched=matched, scenes=scenes)
+    return results
+
+
+def cases(quick: bool):
+    """(이름, 종류, 준비 함수) 목록"""
+    label = "720p" if quick else "1080p"
+    width, height = _common.SCREENS[label]
+    yield ("template.pyramid/{}".format(label), "group",
+           lambda: lambda: pyramid(width, height, 4 if quick else 8))
+
+
+if __name__ == "__main__":
+    _common.main(cases, __doc__)
@@ -0,0 +1,31 @@
+"""탬플릿 묶음 벤치마크
+
+하나의 스크린에서 N개의 탬플릿을 찾을 때, 탬플릿마다
+:meth:`Template.screen_search` 를 호출하는 경우와
+:meth:`TemplateSet.screen_search` 로 회색조 변환을 공유하는 경우를
+비교합니다. 공유하는 작업은 회색조 변환(1080p 에서 약 1ms)뿐이고
+탐색 시간은 탬플릿 매칭이 대부분이므로, 두 결과의 차이는 측정
+오차 범위(약 1%) 안에 있습니다.
+"""
+import _common  # autowinpy 보다 먼저: 저장소 경로 설정
+
+
+def _search(label: str, count: int, batched: bool):
+    """``count`` 개 탬플릿을 모두 찾는 함수"""
+    screen = _common.noise(*_common.SCREENS[label])
+    template_set = _common.template_set(_common.crops(screen, count, 40))
+    if batched:
+        return lambda: template_set.screen_search(screen)
+    return lambda: [template_set[n].screen_search(screen) for n in template_set]
+
+
+def cases(quick: bool):
+    """(이름, 종류, 준비 함수) 목록"""
+    label, count = ("720p", 8) if quick else ("1080p", 30)
+    for batched, kind in ((False, "per_call"), (True, "batched")):
+        yield ("template_set.{}/{}/{}".format(kind, label, count), "latency",
+               lambda batched=batched: _search(label, count, batched))
+
+
+if __name__ == "__main__":
+    _common.main(cases, __doc__)